@@ -34,6 +34,7 @@ class EngineInferenceRequest(BaseModel):
     """
     text: str = Field(..., min_length=1, description="Input text for analysis")
     embedding: Optional[List[float]] = Field(None, description="Optional pre-computed embedding")
+    stream_id: Optional[str] = Field(None, description="Session/tenant id keying the TW369 drift memory")
     
     # Optional metadata fields that might be passed
     metadata: Optional[dict] = Field(default_factory=dict)
@@ -60,7 +60,7 @@ def generate_signal(
         embedding = _text_to_embedding(text)
         
         # Call Master Engine V2
-        signal = engine.infer_from_embedding(embedding)
+        signal = engine.infer_from_embedding(embedding, stream_id=payload.stream_id)
         
         # Extract top archetype
         top_idx = int(np.argmax(signal.archetype_probs))
@@ -45,5 +45,89 @@ def profile_story_buffer(n_events: int = 50):
     logger.info(f"[PROFILE] Story Buffer: Total {duration_ms:.2f}ms | Avg {avg_ms:.4f}ms per event")
     return {"total_ms": duration_ms, "avg_ms": avg_ms}
 
+def profile_story_buffer_serialization(
+    capacities=(12, 144, 1024),
+    repeats: int = 20,
+):
+    """
+    Benchmarks StoryBuffer snapshots: dict format (to_dict + json) against
+    the binary format (to_bytes / from_bytes).
+    Reports per-capacity encoded size, encode latency and the latency of
+    equivalent work after decoding: decode + columnar reads (the analytics
+    path) and decode + event materialization (get_timeline).
+    """
+    if not KALDRA_PROFILING_ENABLED:
+        logger.info("Profiling disabled via env var.")
+        return
+
+    import json
+    from src.story.story_buffer import StoryBuffer
+
+    stages = ("ordinary_world", "call_to_adventure", "ordeal", "return")
+    results = {}
+
+    def read_columns(buffer):
+        buffer.timestamps()
+        buffer.delta12_matrix()
+        buffer.drift_metrics()
+        buffer.tension_features()
+        buffer.stage_codes()
+        buffer.delta144_codes()
+
+    def timed(fn):
+        start_time = time.perf_counter()
+        for _ in range(repeats):
+            fn()
+        return (time.perf_counter() - start_time) * 1000 / repeats
+
+    for capacity in capacities:
+        buffer = StoryBuffer(capacity=capacity)
+        for i in range(capacity):
+            buffer.add_event(
+                f"Narrative event {i}",
+                delta12={f"A{k:02d}": (i * k % 97) / 97.0 for k in range(1, 13)},
+                delta144_state=f"A{i % 12 + 1:02d}_STATE_{i % 12:02d}",
+                meta_scores={
+                    "nietzsche": {"will_to_power": 0.3, "active_nihilism": 0.1},
+                    "aurelius": {"emotional_regulation": 0.6},
+                    "campbell": {"stage": stages[i % len(stages)], "confidence": 0.7},
+                },
+                drift_state={"drift_metric": 0.01 * i, "regime": "STABLE"},
+                tw_state={"plane": "6", "severity": 0.2},
+                metadata={"source": "profiler"},
+            )
+
+        as_json = json.dumps(buffer.to_dict())
+        as_bytes = buffer.to_bytes()
+        decoders = {
+            "dict": lambda: StoryBuffer.from_dict(json.loads(as_json)),
+            "binary": lambda: StoryBuffer.from_bytes(as_bytes),
+        }
+
+        timings = {
+            "dict_encode": timed(lambda: json.dumps(buffer.to_dict())),
+            "binary_encode": timed(buffer.to_bytes),
+        }
+        for name, decode in decoders.items():
+            timings[f"{name}_decode_columns"] = timed(lambda: read_columns(decode()))
+            timings[f"{name}_decode_events"] = timed(lambda: decode().get_timeline())
+
+        results[capacity] = {
+            "dict_bytes": len(as_json.encode("utf-8")),
+            "binary_bytes": len(as_bytes),
+            **{f"{name}_ms": ms for name, ms in timings.items()},
+        }
+        logger.info(
+            f"[PROFILE] StoryBuffer n={capacity}: json {len(as_json)}B "
+            f"enc {timings['dict_encode']:.2f}ms "
+            f"dec+cols {timings['dict_decode_columns']:.2f}ms "
+            f"dec+events {timings['dict_decode_events']:.2f}ms | "
+            f"binary {len(as_bytes)}B enc {timings['binary_encode']:.2f}ms "
+            f"dec+cols {timings['binary_decode_columns']:.2f}ms "
+            f"dec+events {timings['binary_decode_events']:.2f}ms"
+        )
+
+    return results
+
 if __name__ == "__main__":
     profile_story_buffer()
@@ -41,6 +41,52 @@ def profile_tw369_core(iterations: int = 100):
     logger.info(f"[PROFILE] TW369 Core: Total {duration_ms:.2f}ms | Avg {avg_ms:.4f}ms per op")
     return {"total_ms": duration_ms, "avg_ms": avg_ms}
 
+def profile_tw_oracle_eigen_solvers(
+    dims=(256, 512, 1024, 1536),
+    n_samples: int = 200,
+    repeats: int = 3,
+):
+    """
+    Benchmarks the exact (eigvalsh) and Lanczos top-eigenvalue paths of
+    TWPainleveOracle.detect on wide random windows.
+    Reports per-dimension latency for both paths and the relative lambda_max error.
+    """
+    if not KALDRA_PROFILING_ENABLED:
+        logger.info("Profiling disabled via env var.")
+        return
+
+    from src.tw369.oracle_tw_painleve import TWPainleveOracle, TWConfig
+
+    exact = TWPainleveOracle(TWConfig(window_size=n_samples, eigen_solver="exact"))
+    lanczos = TWPainleveOracle(TWConfig(window_size=n_samples, eigen_solver="lanczos"))
+    rng = np.random.default_rng(0)
+    results = {}
+
+    for m in dims:
+        window = rng.standard_normal((n_samples, m))
+        timings = {}
+        stats = {}
+        for name, oracle in (("exact", exact), ("lanczos", lanczos)):
+            start_time = time.perf_counter()
+            for _ in range(repeats):
+                _, stats[name] = oracle.detect(window)
+            timings[name] = (time.perf_counter() - start_time) * 1000 / repeats
+
+        ref = stats["exact"].lambda_max
+        rel_error = abs(stats["lanczos"].lambda_max - ref) / max(abs(ref), 1e-12)
+        results[m] = {
+            "exact_ms": timings["exact"],
+            "lanczos_ms": timings["lanczos"],
+            "speedup": timings["exact"] / max(timings["lanczos"], 1e-9),
+            "rel_error": rel_error,
+        }
+        logger.info(
+            f"[PROFILE] TW Oracle m={m}: exact {timings['exact']:.2f}ms | "
+            f"lanczos {timings['lanczos']:.2f}ms | rel_error {rel_error:.2e}"
+        )
+
+    return results
+
 if __name__ == "__main__":
     # Allow running directly for quick checks
     profile_tw369_core()
@@ -7,6 +7,8 @@ from __future__ import annotations
 from typing import Any, Dict, List
 import numpy as np
 
+from src.tw369.drift import compute_consecutive_drift, compute_consecutive_drift_batch
+
 
 def infer_state(
     vector_144: np.ndarray,
@@ -69,13 +71,33 @@ def evaluate_sequence_stability(
         return {"stability_score": 1.0, "details": {}}
 
     # L2 drift between successive activations
-    diffs = []
-    for a, b in zip(activations_sequence[:-1], activations_sequence[1:]):
-        a = np.asarray(a, dtype=float)
-        b = np.asarray(b, dtype=float)
-        diffs.append(float(np.linalg.norm(b - a, ord=2)))
+    diffs = compute_consecutive_drift(np.asarray(activations_sequence, dtype=float))["l2_drift"]
+    return _stability_summary(float(np.mean(diffs)), tau)
+
+
+def evaluate_sequence_stability_batch(
+    activations_batch: np.ndarray,
+    tau: float = 0.5,
+) -> List[Dict[str, Any]]:
+    """
+    evaluate_sequence_stability for B equal-length sequences at once.
+
+    Args:
+        activations_batch: Activations of shape (B, T, 144)
+        tau: Stability threshold parameter (default: 0.5)
+
+    Returns:
+        One result dictionary per sequence
+    """
+    batch = np.asarray(activations_batch, dtype=float)
+    if batch.shape[1] < 2:
+        return [{"stability_score": 1.0, "details": {}} for _ in range(batch.shape[0])]
+
+    avg_drifts = compute_consecutive_drift_batch(batch)["l2_drift"].mean(axis=1)
+    return [_stability_summary(float(d), tau) for d in avg_drifts]
+
 
-    avg_drift = float(np.mean(diffs))
+def _stability_summary(avg_drift: float, tau: float) -> Dict[str, Any]:
     # simple inverted normalization
     stability = 1.0 / (1.0 + avg_drift)
 
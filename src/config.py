@@ -60,3 +60,13 @@ KALDRA_META_ROUTING_ENABLED = os.getenv("KALDRA_META_ROUTING_ENABLED", "false").
 # v2.7: Polarity & Modifier Flags
 KALDRA_TW_POLARITY_ENABLED = os.getenv("KALDRA_TW_POLARITY_ENABLED", "false").lower() in ("true", "1", "yes")
 KALDRA_DELTA12_POLARITY_ENABLED = os.getenv("KALDRA_DELTA12_POLARITY_ENABLED", "false").lower() in ("true", "1", "yes")
+
+# Meta-engine analysis cache (src/meta/analysis_cache.py)
+KALDRA_META_CACHE_ENABLED = os.getenv("KALDRA_META_CACHE_ENABLED", "false").lower() in ("true", "1", "yes")
+KALDRA_META_CACHE_SIZE = int(os.getenv("KALDRA_META_CACHE_SIZE", "4096"))
+KALDRA_META_CACHE_DIR = os.getenv("KALDRA_META_CACHE_DIR", "")  # empty: memory only
+
+# Story tracker storage (src/core/story_store.py)
+KALDRA_STORY_HOT_BYTES = int(os.getenv("KALDRA_STORY_HOT_BYTES", "0"))  # 0: unbounded
+KALDRA_STORY_IDLE_SECONDS = float(os.getenv("KALDRA_STORY_IDLE_SECONDS", "0"))  # 0: no idle eviction
+KALDRA_STORY_SPILL_PATH = os.getenv("KALDRA_STORY_SPILL_PATH", "")  # empty: memory only
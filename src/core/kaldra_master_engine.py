@@ -8,6 +8,7 @@ from src.archetypes.delta144_engine import Delta144Engine
 from src.kindras.kindra_cultural_mod import KaldraKindraCulturalMod
 from src.tw369.oracle_tw_painleve import TWPainleveOracle, TWConfig, TWStats
 from src.tw369.tw369_integration import TW369Integrator, TWState
+from src.tw369.drift_memory import DriftMemoryStore
 from src.tau.tau_layer import TauLayer
 from src.tau.tau_state import TauState
 from src.safeguard.safeguard_engine import SafeguardEngine, SafeguardSignal
@@ -154,6 +155,7 @@ class KaldraMasterEngineV2:
         embedding: np.ndarray,
         text: Optional[str] = None,
         tw_window: Optional[np.ndarray] = None,
+        stream_id: Optional[str] = None,
     ) -> KaldraSignal:
         """
         Realiza a inferência completa (v2.8 Guardian Layer Enabled).
@@ -161,6 +163,8 @@ class KaldraMasterEngineV2:
         embedding: vetor de contexto (d_ctx)
         text: texto original (opcional, para meta-análise)
         tw_window: janela opcional de sinais para o oracle TW (T, m)
+        stream_id: stream/sessão/tenant do drift TW369 (memória e estado
+            multiscale separados por stream; None usa o stream padrão)
         """
         # Generate request ID and log start
         import uuid
@@ -265,7 +269,13 @@ class KaldraMasterEngineV2:
                 # Compute drift using the integrator
                 # We need a TWState. Let's create a minimal one.
                 tw_state = self.tw_integrator.create_state() # Empty for now, or populate if we had data
-                drift_values = self.tw_integrator.compute_drift(tw_state, tau_modifiers=tau_modifiers)
+                # Always keyed: the integrator is shared by concurrent requests,
+                # so its own (stream-less) multiscale state is never used here
+                drift_values = self.tw_integrator.compute_drift(
+                    tw_state,
+                    tau_modifiers=tau_modifiers,
+                    stream_id=stream_id or DriftMemoryStore.DEFAULT_STREAM,
+                )
                 drift_state = {"velocity": sum(drift_values.values()), "values": drift_values}
 
                 if tw_window is not None:
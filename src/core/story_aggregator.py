@@ -39,6 +39,13 @@ class StoryTurnSignal:
     tw_stats: Optional[Dict[str, Any]] = None
     epistemic_status: Optional[str] = None
 
+    @classmethod
+    def coerce(cls, signal: Any) -> "StoryTurnSignal":
+        """Return signal unchanged if already normalized, else from_signal(signal)."""
+        if isinstance(signal, cls):
+            return signal
+        return cls.from_signal(signal)
+
     @classmethod
     def from_signal(cls, signal: Any) -> "StoryTurnSignal":
         """
@@ -103,12 +110,7 @@ class StoryAggregator:
         # Normalize and collect StoryTurnSignal instances.
         normalized_turns: List[Tuple[Dict[str, Any], StoryTurnSignal]] = []
         for t in turns:
-            signal_obj = t.get("signal")
-            if isinstance(signal_obj, StoryTurnSignal):
-                sts = signal_obj
-            else:
-                sts = StoryTurnSignal.from_signal(signal_obj)
-            normalized_turns.append((t, sts))
+            normalized_turns.append((t, StoryTurnSignal.coerce(t.get("signal"))))
 
         # Build per-turn summaries and Δ144 evolution.
         turn_summaries: List[Dict[str, Any]] = []
@@ -117,56 +119,12 @@ class StoryAggregator:
         coherence_trace: List[Dict[str, Any]] = []
 
         for t, sts in normalized_turns:
-            probs = sts.archetype_probs
-            top_idx = int(np.argmax(probs))
-            top_prob = float(probs[top_idx])
-            archetype_indices.append(top_idx)
-
-            delta_state_id = None
-            if isinstance(sts.delta_state, dict):
-                delta_state_id = sts.delta_state.get("id") or sts.delta_state.get("state_id")
-
-            tw_severity = None
-            if isinstance(sts.tw_stats, dict):
-                tw_severity = sts.tw_stats.get("severity")
-
-            signal_summary = {
-                "archetype_top_index": top_idx,
-                "archetype_top_prob": top_prob,
-                "delta_state_id": delta_state_id,
-                "tw_trigger": sts.tw_trigger,
-                "tw_severity": tw_severity,
-                "epistemic_status": sts.epistemic_status,
-            }
-
-            turn_summaries.append(
-                {
-                    "turn_id": t.get("turn_id"),
-                    "turn_index": int(t["turn_index"]),
-                    "timestamp": t["timestamp"],
-                    "role": t["role"],
-                    "text": t["text"],
-                    "metadata": t.get("metadata", {}),
-                    "signal_summary": signal_summary,
-                }
-            )
-
-            if delta_state_id is not None:
-                delta_evolution.append(
-                    {
-                        "turn_index": int(t["turn_index"]),
-                        "delta_state_id": delta_state_id,
-                        "profile": sts.delta_state.get("profile") if isinstance(sts.delta_state, dict) else None,
-                    }
-                )
-
-            # Simple placeholder coherence: higher if top archetype is stable.
-            coherence_trace.append(
-                {
-                    "turn_index": int(t["turn_index"]),
-                    "coherence": top_prob
-                }
-            )
+            turn_summary, delta_entry, trace_entry = self.summarize_turn(t, sts)
+            archetype_indices.append(turn_summary["signal_summary"]["archetype_top_index"])
+            turn_summaries.append(turn_summary)
+            if delta_entry is not None:
+                delta_evolution.append(delta_entry)
+            coherence_trace.append(trace_entry)
 
         # Compute aggregate coherence and dominant archetypes.
         narrative_coherence = self._compute_coherence(archetype_indices, coherence_trace)
@@ -183,6 +141,64 @@ class StoryAggregator:
         }
         return story_obj
 
+    @staticmethod
+    def summarize_turn(
+        t: Dict[str, Any],
+        sts: StoryTurnSignal,
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Per-turn part of aggregate().
+
+        Returns:
+            (turn summary, Δ144 evolution entry or None, coherence trace entry)
+        """
+        probs = sts.archetype_probs
+        top_idx = int(np.argmax(probs))
+        top_prob = float(probs[top_idx])
+
+        delta_state_id = None
+        if isinstance(sts.delta_state, dict):
+            delta_state_id = sts.delta_state.get("id") or sts.delta_state.get("state_id")
+
+        tw_severity = None
+        if isinstance(sts.tw_stats, dict):
+            tw_severity = sts.tw_stats.get("severity")
+
+        signal_summary = {
+            "archetype_top_index": top_idx,
+            "archetype_top_prob": top_prob,
+            "delta_state_id": delta_state_id,
+            "tw_trigger": sts.tw_trigger,
+            "tw_severity": tw_severity,
+            "epistemic_status": sts.epistemic_status,
+        }
+
+        turn_summary = {
+            "turn_id": t.get("turn_id"),
+            "turn_index": int(t["turn_index"]),
+            "timestamp": t["timestamp"],
+            "role": t["role"],
+            "text": t["text"],
+            "metadata": t.get("metadata", {}),
+            "signal_summary": signal_summary,
+        }
+
+        delta_entry = None
+        if delta_state_id is not None:
+            delta_entry = {
+                "turn_index": int(t["turn_index"]),
+                "delta_state_id": delta_state_id,
+                "profile": sts.delta_state.get("profile") if isinstance(sts.delta_state, dict) else None,
+            }
+
+        # Simple placeholder coherence: higher if top archetype is stable.
+        trace_entry = {
+            "turn_index": int(t["turn_index"]),
+            "coherence": top_prob
+        }
+
+        return turn_summary, delta_entry, trace_entry
+
     # -------------------------
     # Internal helpers
     # -------------------------
@@ -227,3 +243,162 @@ class StoryAggregator:
 
         # Simple blend.
         return float(max(0.0, min(1.0, 0.5 * stability + 0.5 * avg_conf)))
+
+
+# TW regime labels of a turn (from tw_trigger; None when unknown)
+TW_REGIME_TRIGGERED = "TRIGGERED"
+TW_REGIME_STABLE = "STABLE"
+
+
+def tw_regime_of(sts: StoryTurnSignal) -> Optional[str]:
+    if sts.tw_trigger is None:
+        return None
+    return TW_REGIME_TRIGGERED if sts.tw_trigger else TW_REGIME_STABLE
+
+
+class IncrementalStoryAggregate:
+    """
+    Running StoryAggregator.aggregate() state of one story.
+
+    Each add_turn() folds one turn into running accumulators (archetype
+    counts and top-k, consecutive-match count and probability sum for
+    coherence, TW regime run lengths), so aggregate() does not revisit
+    earlier turns. aggregate() returns the same object as
+    StoryAggregator.aggregate over the same turns.
+
+    The lists in the returned object are shallow copies of the
+    accumulators, so a result is a snapshot that later turns and caller
+    edits cannot change. The copies are the only O(n) part of aggregate()
+    (three pointer copies, no per-turn work); callers that only need the
+    summary values can read dominant_archetypes / narrative_coherence /
+    tw_regime from the state directly in O(k).
+    """
+
+    def __init__(self, story_id: str, aggregator: Optional[StoryAggregator] = None) -> None:
+        self.story_id = story_id
+        self.aggregator = aggregator or StoryAggregator()
+        self.turn_summaries: List[Dict[str, Any]] = []
+        self.delta_evolution: List[Dict[str, Any]] = []
+        self.coherence_trace: List[Dict[str, Any]] = []
+
+        # Archetype index -> count; dict order = first-seen order, which is
+        # how Counter.most_common breaks ties
+        self.archetype_counts: Dict[int, int] = {}
+        self._first_seen: Dict[int, int] = {}
+        self._top: List[int] = []
+
+        self.last_archetype: Optional[int] = None
+        self._matches = 0
+        self._prob_sum = 0.0
+
+        self.tw_regime: Optional[str] = None
+        self.tw_run_length = 0
+        self.max_tw_trigger_run = 0
+
+    def __len__(self) -> int:
+        return len(self.turn_summaries)
+
+    @property
+    def top_k(self) -> int:
+        return self.aggregator.top_k_archetypes
+
+    def add_turn(self, turn: Dict[str, Any]) -> None:
+        """
+        Fold in one turn (same dict format as StoryAggregator.aggregate).
+
+        Raises:
+            ValueError: If the turn's signal has no archetype_probs
+        """
+        sts = StoryTurnSignal.coerce(turn.get("signal"))
+        turn_summary, delta_entry, trace_entry = self.aggregator.summarize_turn(turn, sts)
+        top_idx = turn_summary["signal_summary"]["archetype_top_index"]
+
+        self.turn_summaries.append(turn_summary)
+        if delta_entry is not None:
+            self.delta_evolution.append(delta_entry)
+        self.coherence_trace.append(trace_entry)
+
+        if self.last_archetype is not None and top_idx == self.last_archetype:
+            self._matches += 1
+        self.last_archetype = top_idx
+        self._prob_sum += float(trace_entry.get("coherence", 0.0))
+
+        self._count_archetype(top_idx)
+
+        regime = tw_regime_of(sts)
+        if regime == self.tw_regime and self.tw_run_length:
+            self.tw_run_length += 1
+        else:
+            self.tw_regime = regime
+            self.tw_run_length = 1
+        if regime == TW_REGIME_TRIGGERED:
+            self.max_tw_trigger_run = max(self.max_tw_trigger_run, self.tw_run_length)
+
+    def _count_archetype(self, idx: int) -> None:
+        """Increment a count and restore the top-k order (O(k))."""
+        count = self.archetype_counts.get(idx, 0) + 1
+        self.archetype_counts[idx] = count
+        self._first_seen.setdefault(idx, len(self._first_seen))
+
+        top = self._top
+        if idx not in top:
+            if len(top) < self.top_k:
+                top.append(idx)
+            elif top and self._ranks_before(idx, top[-1]):
+                top[-1] = idx
+            else:
+                return
+        # A count only grows by one, so the entry can only move up
+        i = top.index(idx)
+        while i > 0 and self._ranks_before(idx, top[i - 1]):
+            top[i], top[i - 1] = top[i - 1], top[i]
+            i -= 1
+
+    def _ranks_before(self, a: int, b: int) -> bool:
+        ca, cb = self.archetype_counts[a], self.archetype_counts[b]
+        return ca > cb or (ca == cb and self._first_seen[a] < self._first_seen[b])
+
+    @property
+    def dominant_archetypes(self) -> List[int]:
+        return list(self._top)
+
+    @property
+    def narrative_coherence(self) -> float:
+        """Same blend as StoryAggregator._compute_coherence."""
+        n = len(self.turn_summaries)
+        if not n:
+            return 0.0
+        stability = self._matches / max(1, n - 1)
+        avg_conf = float(self._prob_sum / n)
+        return float(max(0.0, min(1.0, 0.5 * stability + 0.5 * avg_conf)))
+
+    def aggregate(self) -> Dict[str, Any]:
+        """
+        Story-level object, as StoryAggregator.aggregate.
+
+        The per-turn lists are shallow copies (O(n) pointer copies), so a
+        returned object does not grow with later turns and edits to it
+        cannot desync the state.
+        """
+        return {
+            "story_id": self.story_id,
+            "turns": list(self.turn_summaries),
+            "delta144_evolution": list(self.delta_evolution),
+            "narrative_coherence": self.narrative_coherence,
+            "dominant_archetypes": self.dominant_archetypes,
+            "coherence_trace": list(self.coherence_trace),
+            "metadata": {},
+        }
+
+    @classmethod
+    def rebuild(
+        cls,
+        story_id: str,
+        turns: Sequence[Dict[str, Any]],
+        aggregator: Optional[StoryAggregator] = None,
+    ) -> "IncrementalStoryAggregate":
+        """Fresh state folded over all turns."""
+        state = cls(story_id, aggregator)
+        for turn in turns:
+            state.add_turn(turn)
+        return state
@@ -0,0 +1,252 @@
+"""
+Secondary indexes over tracked stories.
+
+StoryIndex keeps, per story, the keys dashboards filter on:
+
+    - dominant archetype (top of the story's dominant_archetypes)
+    - current Campbell stage (latest turn that reports one)
+    - current TW regime (TW_REGIME_TRIGGERED / TW_REGIME_STABLE of the
+      latest turn, see story_aggregator.tw_regime_of)
+    - time bucket of the latest turn (bucket_seconds wide)
+
+and one posting set per key value. StoryTracker updates it on add_turn, so
+query() only touches the stories matching its most selective filter
+instead of re-aggregating every story. Spilled stories stay indexed: their
+keys are persisted with the spill rows (see story_store) and re-indexed
+when a StoryTracker opens the spill file.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def campbell_stage_of(turn: Any) -> Optional[str]:
+    """
+    Campbell journey stage reported for a turn, if any.
+
+    Looked up in turn.metadata["campbell_stage"], then on the signal: a
+    'campbell' attribute (CampbellSignal or dict) or meta_scores["campbell"]
+    (StoryEvent format).
+    """
+    stage = turn.metadata.get("campbell_stage")
+    if stage:
+        return stage
+
+    campbell = getattr(turn.signal, "campbell", None)
+    if campbell is None:
+        meta_scores = getattr(turn.signal, "meta_scores", None)
+        if isinstance(meta_scores, dict):
+            campbell = meta_scores.get("campbell")
+    if isinstance(campbell, dict):
+        return campbell.get("journey_stage") or campbell.get("stage")
+    return getattr(campbell, "journey_stage", None)
+
+
+def timestamp_seconds(timestamp: str) -> Optional[float]:
+    """POSIX seconds of an ISO timestamp (None if unparseable)."""
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class StoryIndexEntry:
+    """Indexed keys of one story."""
+    archetype: Optional[int]
+    stage: Optional[str]
+    tw_regime: Optional[str]
+    last_seen: float
+    bucket: int
+
+
+@dataclass
+class StoryQueryResult:
+    """
+    One page of a story query.
+
+    Attributes:
+        story_ids: Matching ids, most recently active first
+        total: Number of matches over all pages
+        next_offset: Offset of the next page (None on the last page)
+    """
+    story_ids: List[str]
+    total: int
+    next_offset: Optional[int]
+
+
+class StoryIndex:
+    """Posting sets of story ids by archetype, stage, TW regime and time bucket."""
+
+    def __init__(self, bucket_seconds: float = 300.0):
+        """
+        Args:
+            bucket_seconds: Width of the time buckets
+        """
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+        self.bucket_seconds = bucket_seconds
+        self._entries: Dict[str, StoryIndexEntry] = {}
+        # Dicts used as insertion-ordered sets
+        self._by_archetype: Dict[Optional[int], Dict[str, None]] = {}
+        self._by_stage: Dict[Optional[str], Dict[str, None]] = {}
+        self._by_regime: Dict[Optional[str], Dict[str, None]] = {}
+        self._by_bucket: Dict[int, Dict[str, None]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, story_id: str) -> bool:
+        return story_id in self._entries
+
+    def entry(self, story_id: str) -> Optional[StoryIndexEntry]:
+        return self._entries.get(story_id)
+
+    def _postings(self) -> Tuple[Tuple[str, Dict[Any, Dict[str, None]]], ...]:
+        return (
+            ("archetype", self._by_archetype),
+            ("stage", self._by_stage),
+            ("tw_regime", self._by_regime),
+            ("bucket", self._by_bucket),
+        )
+
+    def update(
+        self,
+        story_id: str,
+        archetype: Optional[int],
+        stage: Optional[str],
+        tw_regime: Optional[str],
+        last_seen: float,
+    ) -> None:
+        """
+        Set the indexed keys of a story (O(1)).
+
+        Args:
+            story_id: Story identifier
+            archetype: Dominant archetype index
+            stage: Current Campbell stage
+            tw_regime: Current TW regime
+            last_seen: POSIX seconds of the latest turn
+        """
+        entry = StoryIndexEntry(
+            archetype=archetype,
+            stage=stage,
+            tw_regime=tw_regime,
+            last_seen=last_seen,
+            bucket=int(last_seen // self.bucket_seconds),
+        )
+        with self._lock:
+            old = self._entries.get(story_id)
+            for attr, postings in self._postings():
+                value = getattr(entry, attr)
+                if old is not None:
+                    previous = getattr(old, attr)
+                    if previous == value:
+                        continue
+                    self._discard(postings, previous, story_id)
+                postings.setdefault(value, {})[story_id] = None
+            self._entries[story_id] = entry
+
+    def remove(self, story_id: str) -> None:
+        with self._lock:
+            old = self._entries.pop(story_id, None)
+            if old is None:
+                return
+            for attr, postings in self._postings():
+                self._discard(postings, getattr(old, attr), story_id)
+
+    @staticmethod
+    def _discard(postings: Dict[Any, Dict[str, None]], value: Any, story_id: str) -> None:
+        ids = postings.get(value)
+        if ids is not None:
+            ids.pop(story_id, None)
+            if not ids:
+                del postings[value]
+
+    def query(
+        self,
+        archetype: Optional[int] = None,
+        stage: Optional[str] = None,
+        tw_regime: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> StoryQueryResult:
+        """
+        Stories matching every given filter (None = no filter).
+
+        Args:
+            archetype: Dominant archetype index
+            stage: Current Campbell stage
+            tw_regime: Current TW regime
+            since / until: Bounds (POSIX seconds) on the latest turn time
+            offset: Number of matches to skip
+            limit: Page size
+
+        Returns:
+            StoryQueryResult, most recently active first
+        """
+        if offset < 0 or limit < 0:
+            raise ValueError("offset and limit must be non-negative")
+
+        with self._lock:
+            candidates: List[Dict[str, None]] = []
+            if archetype is not None:
+                candidates.append(self._by_archetype.get(archetype, {}))
+            if stage is not None:
+                candidates.append(self._by_stage.get(stage, {}))
+            if tw_regime is not None:
+                candidates.append(self._by_regime.get(tw_regime, {}))
+            if since is not None or until is not None:
+                lo = int(since // self.bucket_seconds) if since is not None else None
+                hi = int(until // self.bucket_seconds) if until is not None else None
+                in_range: Dict[str, None] = {}
+                for bucket, ids in self._by_bucket.items():
+                    if (lo is None or bucket >= lo) and (hi is None or bucket <= hi):
+                        in_range.update(ids)
+                candidates.append(in_range)
+
+            # Scan the smallest posting set, check the other filters per story
+            base = min(candidates, key=len) if candidates else self._entries
+            matches = []
+            for story_id in base:
+                e = self._entries[story_id]
+                if archetype is not None and e.archetype != archetype:
+                    continue
+                if stage is not None and e.stage != stage:
+                    continue
+                if tw_regime is not None and e.tw_regime != tw_regime:
+                    continue
+                if since is not None and e.last_seen < since:
+                    continue
+                if until is not None and e.last_seen > until:
+                    continue
+                matches.append((-e.last_seen, story_id))
+
+        matches.sort()
+        page = [story_id for _, story_id in matches[offset:offset + limit]]
+        end = offset + len(page)
+        return StoryQueryResult(
+            story_ids=page,
+            total=len(matches),
+            next_offset=end if end < len(matches) else None,
+        )
+
+    def counts(self, key: str) -> Dict[Any, int]:
+        """
+        Number of stories per value of one key.
+
+        Args:
+            key: "archetype", "stage", "tw_regime" or "bucket"
+        """
+        postings = dict(self._postings()).get(key)
+        if postings is None:
+            raise ValueError(f"Unknown index key: {key}")
+        with self._lock:
+            return {value: len(ids) for value, ids in postings.items()}
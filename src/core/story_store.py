@@ -0,0 +1,400 @@
+"""
+Tiered storage for StoryTracker.
+
+Stories live in two tiers:
+
+    - Hot: in-memory LRU of StoryRecords, bounded by an estimated byte
+      budget (hot_bytes) and optionally by idle time (idle_seconds)
+    - Cold: a local sqlite file (spill_path) holding pickled records of
+      evicted stories; a story is moved back to the hot tier on access
+
+Without a spill path the store is a plain unbounded dict (the previous
+StoryTracker behavior). Byte sizes are estimates (see estimate_turn_bytes),
+meant to keep RSS roughly flat, not exact accounting.
+
+Signals are pickled on spill; a story whose turns cannot be pickled, or
+whose sqlite write fails (disk full, I/O error), stays hot (counted in
+spill_errors). The cold tier is a spill area, not a
+durable store: hot stories are not written out on close.
+
+A spilled record's index keys (StoryRecord.index_keys) are written to a
+story_index table in the same transaction, so a tracker reopening the
+file can rebuild its StoryIndex without loading the records.
+"""
+
+from __future__ import annotations
+
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Rough per-turn cost of the StoryTurn, its aggregate summary dicts and
+# the signal object, on top of text and archetype_probs
+TURN_OVERHEAD_BYTES = 2048
+RECORD_OVERHEAD_BYTES = 1024
+
+
+def estimate_turn_bytes(turn: Any) -> int:
+    """Approximate memory held by one StoryTurn (and its aggregate entries)."""
+    size = TURN_OVERHEAD_BYTES + len(turn.text) + len(turn.role) + len(turn.timestamp)
+    probs = getattr(turn.signal, "archetype_probs", None)
+    size += int(getattr(probs, "nbytes", 0))
+    size += 128 * len(turn.metadata)
+    return size
+
+
+@dataclass
+class StoryRecord:
+    """
+    Everything the tracker keeps for one story.
+
+    Attributes:
+        story_id: Story identifier
+        created: Creation sequence number (list order of stories)
+        turns: StoryTurn objects, oldest first
+        aggregate: Incremental aggregate state (None until first aggregated)
+        nbytes: Estimated size of the turns
+        last_access: Store clock value of the last access
+        index_keys: StoryIndex.update keyword arguments of the story
+            (None until its first indexed turn)
+    """
+    story_id: str
+    created: int
+    turns: List[Any] = field(default_factory=list)
+    aggregate: Optional[Any] = None
+    nbytes: int = 0
+    last_access: float = 0.0
+    index_keys: Optional[Dict[str, Any]] = None
+
+
+class SpillStore:
+    """sqlite tables of pickled StoryRecords and their index keys."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS stories ("
+            "story_id TEXT PRIMARY KEY, created INTEGER NOT NULL, data BLOB NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS story_index ("
+            "story_id TEXT PRIMARY KEY, created INTEGER NOT NULL, archetype INTEGER, "
+            "stage TEXT, tw_regime TEXT, last_seen REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def put(self, record: StoryRecord) -> None:
+        data = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        keys = record.index_keys
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stories (story_id, created, data) VALUES (?, ?, ?)",
+                (record.story_id, record.created, data),
+            )
+            if keys is None:
+                self._conn.execute(
+                    "DELETE FROM story_index WHERE story_id = ?", (record.story_id,)
+                )
+            else:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO story_index "
+                    "(story_id, created, archetype, stage, tw_regime, last_seen) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (record.story_id, record.created, keys["archetype"], keys["stage"],
+                     keys["tw_regime"], keys["last_seen"]),
+                )
+
+    def pop(self, story_id: str) -> Optional[StoryRecord]:
+        row = self._conn.execute(
+            "SELECT data FROM stories WHERE story_id = ?", (story_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        self.delete(story_id)
+        return pickle.loads(row[0])
+
+    def delete(self, story_id: str) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM stories WHERE story_id = ?", (story_id,))
+            self._conn.execute("DELETE FROM story_index WHERE story_id = ?", (story_id,))
+
+    def contains(self, story_id: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM stories WHERE story_id = ?", (story_id,)
+        ).fetchone()
+        return row is not None
+
+    def ids(self) -> List[tuple]:
+        """(created, story_id) of every spilled story."""
+        return self._conn.execute("SELECT created, story_id FROM stories").fetchall()
+
+    def index_keys(self) -> List[tuple]:
+        """(story_id, index keys) of every spilled story that was indexed."""
+        rows = self._conn.execute(
+            "SELECT story_id, archetype, stage, tw_regime, last_seen FROM story_index"
+        ).fetchall()
+        return [
+            (sid, {"archetype": archetype, "stage": stage, "tw_regime": tw_regime,
+                   "last_seen": last_seen})
+            for sid, archetype, stage, tw_regime, last_seen in rows
+        ]
+
+    def max_created(self) -> int:
+        row = self._conn.execute("SELECT MAX(created) FROM stories").fetchone()
+        return row[0] if row[0] is not None else -1
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM stories").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class TieredStoryStore:
+    """
+    Hot LRU + cold sqlite store of StoryRecords.
+
+    Counters (stats()):
+        hot_hits: Lookups served from memory
+        cold_hits: Lookups that loaded a spilled story
+        misses: Lookups of unknown stories
+        spills: Stories moved to the cold tier
+        spill_errors: Spills that failed (story kept hot)
+        spill_seconds_total / spill_seconds_max: Time spent spilling
+        load_seconds_total: Time spent loading spilled stories
+    """
+
+    def __init__(
+        self,
+        hot_bytes: Optional[int] = None,
+        spill_path: Optional[Path] = None,
+        idle_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            hot_bytes: Estimated byte budget of the hot tier (None: unbounded)
+            spill_path: sqlite file of the cold tier
+            idle_seconds: Spill stories not accessed for this long (None: never)
+            clock: Time source (seconds)
+
+        Raises:
+            ValueError: If a bound is set without a spill_path
+        """
+        if spill_path is None and (hot_bytes is not None or idle_seconds is not None):
+            raise ValueError("hot_bytes/idle_seconds require a spill_path")
+
+        self.hot_bytes = hot_bytes
+        self.idle_seconds = idle_seconds
+        self.clock = clock
+        self._hot: "OrderedDict[str, StoryRecord]" = OrderedDict()
+        self._cold = SpillStore(spill_path) if spill_path is not None else None
+        self._lock = threading.RLock()
+        self._created = self._cold.max_created() + 1 if self._cold is not None else 0
+        self.nbytes = 0
+
+        self.hot_hits = 0
+        self.cold_hits = 0
+        self.misses = 0
+        self.spills = 0
+        self.spill_errors = 0
+        self.spill_seconds_total = 0.0
+        self.spill_seconds_max = 0.0
+        self.load_seconds_total = 0.0
+
+    @classmethod
+    def from_config(cls) -> "TieredStoryStore":
+        """
+        Store configured from KALDRA_STORY_HOT_BYTES, KALDRA_STORY_SPILL_PATH
+        and KALDRA_STORY_IDLE_SECONDS (0 / empty disables each).
+        """
+        from src.config import (
+            KALDRA_STORY_HOT_BYTES,
+            KALDRA_STORY_IDLE_SECONDS,
+            KALDRA_STORY_SPILL_PATH,
+        )
+
+        if not KALDRA_STORY_SPILL_PATH:
+            return cls()
+        return cls(
+            hot_bytes=KALDRA_STORY_HOT_BYTES or None,
+            spill_path=Path(KALDRA_STORY_SPILL_PATH),
+            idle_seconds=KALDRA_STORY_IDLE_SECONDS or None,
+        )
+
+    # -------------------------
+    # Records
+    # -------------------------
+
+    def create(self, story_id: str) -> StoryRecord:
+        """Return the story's record, creating an empty one if unknown."""
+        with self._lock:
+            record = self.get(story_id, count_miss=False)
+            if record is None:
+                record = StoryRecord(story_id, self._created, nbytes=RECORD_OVERHEAD_BYTES)
+                self._created += 1
+                self._insert(record)
+            return record
+
+    def get(self, story_id: str, count_miss: bool = True) -> Optional[StoryRecord]:
+        """Record of a story (loaded from the cold tier if spilled), or None."""
+        with self._lock:
+            record = self._hot.get(story_id)
+            if record is not None:
+                self.hot_hits += 1
+                self._hot.move_to_end(story_id)
+                record.last_access = self.clock()
+                self._evict()
+                return record
+
+            if self._cold is not None:
+                start = time.perf_counter()
+                record = self._cold.pop(story_id)
+                if record is not None:
+                    self.load_seconds_total += time.perf_counter() - start
+                    self.cold_hits += 1
+                    self._insert(record)
+                    return record
+
+            if count_miss:
+                self.misses += 1
+            return None
+
+    @contextmanager
+    def checkout(self, story_id: str) -> Iterator[Optional[StoryRecord]]:
+        """
+        Record of a story (or None), held under the store lock for the block.
+
+        No other thread can spill, reload or resize records while the block
+        runs, so the record can be mutated and resized in place without
+        being orphaned by a concurrent spill.
+        """
+        with self._lock:
+            yield self.get(story_id)
+
+    def contains(self, story_id: str) -> bool:
+        with self._lock:
+            return story_id in self._hot or (
+                self._cold is not None and self._cold.contains(story_id)
+            )
+
+    def resize(self, record: StoryRecord, nbytes: int) -> None:
+        """Set a hot record's estimated size and enforce the budget."""
+        with self._lock:
+            self.nbytes += nbytes - record.nbytes
+            record.nbytes = nbytes
+            self._evict()
+
+    def delete(self, story_id: str) -> None:
+        with self._lock:
+            record = self._hot.pop(story_id, None)
+            if record is not None:
+                self.nbytes -= record.nbytes
+            if self._cold is not None:
+                self._cold.delete(story_id)
+
+    def ids(self) -> List[str]:
+        """All story ids (both tiers), in creation order."""
+        with self._lock:
+            entries = [(r.created, sid) for sid, r in self._hot.items()]
+            if self._cold is not None:
+                entries.extend(self._cold.ids())
+        return [sid for _, sid in sorted(entries)]
+
+    def spilled_index_keys(self) -> List[tuple]:
+        """(story_id, index keys) of indexed stories in the cold tier."""
+        with self._lock:
+            return self._cold.index_keys() if self._cold is not None else []
+
+    def hot_ids(self) -> List[str]:
+        """Ids of in-memory stories, least recently used first."""
+        with self._lock:
+            return list(self._hot)
+
+    def _insert(self, record: StoryRecord) -> None:
+        record.last_access = self.clock()
+        self._hot[record.story_id] = record
+        self.nbytes += record.nbytes
+        self._evict()
+
+    # -------------------------
+    # Eviction
+    # -------------------------
+
+    def evict_idle(self) -> int:
+        """Spill every story idle for longer than idle_seconds. Returns the count."""
+        with self._lock:
+            return self._evict()
+
+    def _evict(self) -> int:
+        """Spill LRU stories while over budget or idle (never the most recent one)."""
+        if self._cold is None:
+            return 0
+
+        spilled = 0
+        skipped: List[StoryRecord] = []
+        now = self.clock()
+        while len(self._hot) > 1:
+            record = next(iter(self._hot.values()))
+            over_budget = self.hot_bytes is not None and self.nbytes > self.hot_bytes
+            idle = self.idle_seconds is not None and now - record.last_access > self.idle_seconds
+            if not (over_budget or idle):
+                break
+            self._hot.popitem(last=False)
+            if self._spill(record):
+                self.nbytes -= record.nbytes
+                spilled += 1
+            else:
+                skipped.append(record)
+
+        # Stories that failed to spill stay hot, at the LRU end
+        for record in reversed(skipped):
+            self._hot[record.story_id] = record
+            self._hot.move_to_end(record.story_id, last=False)
+        return spilled
+
+    def _spill(self, record: StoryRecord) -> bool:
+        start = time.perf_counter()
+        try:
+            self._cold.put(record)
+        except (pickle.PicklingError, TypeError, AttributeError, sqlite3.Error):
+            self.spill_errors += 1
+            return False
+        elapsed = time.perf_counter() - start
+        self.spills += 1
+        self.spill_seconds_total += elapsed
+        self.spill_seconds_max = max(self.spill_seconds_max, elapsed)
+        return True
+
+    # -------------------------
+    # Metrics
+    # -------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Tier sizes and counters."""
+        with self._lock:
+            return {
+                "hot_stories": len(self._hot),
+                "hot_bytes": self.nbytes,
+                "cold_stories": len(self._cold) if self._cold is not None else 0,
+                "hot_hits": self.hot_hits,
+                "cold_hits": self.cold_hits,
+                "misses": self.misses,
+                "spills": self.spills,
+                "spill_errors": self.spill_errors,
+                "spill_seconds_total": self.spill_seconds_total,
+                "spill_seconds_max": self.spill_seconds_max,
+                "load_seconds_total": self.load_seconds_total,
+            }
+
+    def close(self) -> None:
+        if self._cold is not None:
+            self._cold.close()
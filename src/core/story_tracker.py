@@ -1,19 +1,43 @@
 """
 Story tracking and session management for KALDRA Core.
 
-This module provides an in-memory StoryTracker that groups multiple
-turn-level signals into stories and delegates aggregation to
-StoryAggregator.
+This module provides a StoryTracker that groups multiple turn-level
+signals into stories and delegates aggregation to StoryAggregator.
+Stories are kept in a TieredStoryStore (in memory, optionally bounded
+with spill to disk) and indexed for cross-story queries by StoryIndex.
+
+Aggregates are maintained incrementally per story
+(IncrementalStoryAggregate): turns added since the last aggregate_story()
+call are folded in, so calling it after every turn costs O(1) per turn
+instead of re-aggregating the whole story.
 """
 
 from __future__ import annotations
 
+import time
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from src.core.story_aggregator import StoryAggregator, StoryTurnSignal
+from src.core.story_aggregator import (
+    IncrementalStoryAggregate,
+    StoryAggregator,
+    StoryTurnSignal,
+)
+from src.core.story_index import (
+    StoryIndex,
+    StoryQueryResult,
+    campbell_stage_of,
+    timestamp_seconds,
+)
+from src.core.story_store import (
+    RECORD_OVERHEAD_BYTES,
+    StoryRecord,
+    TieredStoryStore,
+    estimate_turn_bytes,
+)
 
 
 def _now_iso() -> str:
@@ -31,19 +55,88 @@ class StoryTurn:
     metadata: Dict[str, Any] = field(default_factory=dict)
     turn_id: str = field(default_factory=lambda: uuid.uuid4().hex)
 
+    def to_payload(self) -> Dict[str, Any]:
+        """Turn dict in the format expected by StoryAggregator."""
+        return {
+            "turn_id": self.turn_id,
+            "turn_index": self.turn_index,
+            "timestamp": self.timestamp,
+            "role": self.role,
+            "text": self.text,
+            "metadata": self.metadata,
+            "signal": self.signal,
+        }
+
 
 class StoryTracker:
     """
-    In-memory story tracking for multi-turn narrative aggregation.
+    Story tracking for multi-turn narrative aggregation.
 
-    This is intentionally minimal and can be replaced by a persistent or
-    distributed implementation in future versions.
+    Stories are held in a TieredStoryStore, by default configured from
+    KALDRA_STORY_* (an unbounded in-memory dict when no spill path is
+    set); with a byte budget / idle timeout and a spill path, least
+    recently used stories are spilled to disk and loaded back on access
+    (see src/core/story_store.py). Records are only read and mutated
+    inside store.checkout(), so a concurrent spill cannot orphan them.
+
+    Stories with at least one turn are indexed by dominant archetype,
+    Campbell stage, TW regime and time of the latest turn; see
+    query_stories().
     """
 
-    def __init__(self, aggregator: Optional[StoryAggregator] = None) -> None:
-        self._stories: Dict[str, List[StoryTurn]] = {}
+    def __init__(
+        self,
+        aggregator: Optional[StoryAggregator] = None,
+        store: Optional[TieredStoryStore] = None,
+        index: Optional[StoryIndex] = None,
+    ) -> None:
+        self.store = store or TieredStoryStore.from_config()
+        self.index = index or StoryIndex()
         self.aggregator = aggregator or StoryAggregator()
 
+        # Re-index stories spilled by a previous tracker on the same file
+        for story_id, keys in self.store.spilled_index_keys():
+            if story_id not in self.index:
+                self.index.update(story_id, **keys)
+
+    @contextmanager
+    def _record(self, story_id: str) -> Iterator[StoryRecord]:
+        with self.store.checkout(story_id) as record:
+            if record is None:
+                raise KeyError(f"Unknown story_id: {story_id}")
+            yield record
+
+    def _fold(self, record: StoryRecord) -> IncrementalStoryAggregate:
+        """Fold turns added since the last call into the story's aggregate state."""
+        state = record.aggregate
+        if state is None:
+            state = record.aggregate = IncrementalStoryAggregate(record.story_id, self.aggregator)
+        for t in record.turns[len(state):]:
+            state.add_turn(t.to_payload())
+        return state
+
+    def _index_turn(self, record: StoryRecord, turn: StoryTurn) -> None:
+        try:
+            state = self._fold(record)
+        except ValueError:
+            # Signal without archetype_probs: reported by aggregate_story
+            return
+
+        previous = self.index.entry(record.story_id)
+        stage = campbell_stage_of(turn) or (previous.stage if previous else None)
+        last_seen = timestamp_seconds(turn.timestamp)
+        if last_seen is None:
+            last_seen = time.time()
+        dominant = state.dominant_archetypes
+        # Kept on the record so a spill persists them with the story
+        record.index_keys = {
+            "archetype": dominant[0] if dominant else None,
+            "stage": stage,
+            "tw_regime": state.tw_regime,
+            "last_seen": last_seen,
+        }
+        self.index.update(record.story_id, **record.index_keys)
+
     # -------------------------
     # Story lifecycle
     # -------------------------
@@ -53,8 +146,7 @@ class StoryTracker:
         Create a new story. Returns the story_id.
         """
         sid = story_id or uuid.uuid4().hex
-        if sid not in self._stories:
-            self._stories[sid] = []
+        self.store.create(sid)
         return sid
 
     def add_turn(
@@ -80,70 +172,127 @@ class StoryTracker:
         Returns:
             StoryTurn instance.
         """
-        if story_id not in self._stories:
-            raise KeyError(f"Unknown story_id: {story_id}")
-
         ts = timestamp or _now_iso()
-        turns = self._stories[story_id]
-        turn_index = len(turns)
-
-        turn = StoryTurn(
-            story_id=story_id,
-            turn_index=turn_index,
-            timestamp=ts,
-            role=role,
-            text=text,
-            signal=signal,
-            metadata=metadata or {},
-        )
-        turns.append(turn)
+        with self._record(story_id) as record:
+            turns = record.turns
+            turn_index = len(turns)
+
+            turn = StoryTurn(
+                story_id=story_id,
+                turn_index=turn_index,
+                timestamp=ts,
+                role=role,
+                text=text,
+                signal=signal,
+                metadata=metadata or {},
+            )
+            turns.append(turn)
+            self._index_turn(record, turn)
+            self.store.resize(record, record.nbytes + estimate_turn_bytes(turn))
         return turn
 
     def get_story_turns(self, story_id: str) -> List[StoryTurn]:
         """
         Return the list of StoryTurn objects for a given story_id.
         """
-        return list(self._stories.get(story_id, []))
+        with self.store.checkout(story_id) as record:
+            return list(record.turns) if record is not None else []
 
     def aggregate_story(self, story_id: str) -> Dict[str, Any]:
         """
         Aggregate a story into a schema-compatible object via StoryAggregator.
         """
-        if story_id not in self._stories:
-            raise KeyError(f"Unknown story_id: {story_id}")
-
-        turns = self._stories[story_id]
-        turns_payload: List[Dict[str, Any]] = []
-        for t in turns:
-            turns_payload.append(
-                {
-                    "turn_id": t.turn_id,
-                    "turn_index": t.turn_index,
-                    "timestamp": t.timestamp,
-                    "role": t.role,
-                    "text": t.text,
-                    "metadata": t.metadata,
-                    "signal": t.signal,
-                }
-            )
+        with self._record(story_id) as record:
+            if type(self.aggregator).aggregate is StoryAggregator.aggregate:
+                # Signals are normalized when folded, so a bad signal raises
+                # here (as before), not on add_turn
+                return self._fold(record).aggregate()
+            turns = [t.to_payload() for t in record.turns]
 
-        return self.aggregator.aggregate(story_id=story_id, turns=turns_payload)
+        # Custom aggregation: no incremental equivalent
+        return self.aggregator.aggregate(story_id=story_id, turns=turns)
+
+    def rebuild_story(self, story_id: str) -> Dict[str, Any]:
+        """
+        Aggregate a story with a full StoryAggregator pass over all turns
+        and drop its incremental state (refolded on the next
+        aggregate_story call). Use to verify the incremental aggregate or
+        after editing stored turns.
+        """
+        with self._record(story_id) as record:
+            record.aggregate = None
+            turns = [t.to_payload() for t in record.turns]
+        return self.aggregator.aggregate(story_id=story_id, turns=turns)
 
     def reset_story(self, story_id: str) -> None:
         """
         Remove all turns from a story, keeping the story_id.
         """
-        if story_id in self._stories:
-            self._stories[story_id] = []
+        with self.store.checkout(story_id) as record:
+            if record is not None:
+                record.turns = []
+                record.aggregate = None
+                record.index_keys = None
+                self.store.resize(record, RECORD_OVERHEAD_BYTES)
+                self.index.remove(story_id)
 
     def delete_story(self, story_id: str) -> None:
         """
         Delete a story entirely.
         """
-        self._stories.pop(story_id, None)
+        self.store.delete(story_id)
+        self.index.remove(story_id)
 
     def list_story_ids(self) -> List[str]:
         """
         List all known story IDs.
         """
-        return list(self._stories.keys())
+        return self.store.ids()
+
+    def query_stories(
+        self,
+        archetype: Optional[int] = None,
+        stage: Optional[str] = None,
+        tw_regime: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> StoryQueryResult:
+        """
+        Ids of stories matching every given filter, from the index (no
+        re-aggregation, spilled stories are not loaded).
+
+        Args:
+            archetype: Dominant archetype index
+            stage: Current Campbell stage (e.g. "ORDEAL")
+            tw_regime: Current TW regime ("TRIGGERED" / "STABLE")
+            since / until: Bounds (POSIX seconds) on the latest turn time
+            offset: Number of matches to skip
+            limit: Page size
+
+        Returns:
+            StoryQueryResult, most recently active first
+        """
+        return self.index.query(
+            archetype=archetype,
+            stage=stage,
+            tw_regime=tw_regime,
+            since=since,
+            until=until,
+            offset=offset,
+            limit=limit,
+        )
+
+    def evict_idle(self) -> int:
+        """
+        Spill stories idle for longer than the store's idle_seconds.
+        Returns the number of stories spilled.
+        """
+        return self.store.evict_idle()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Story store metrics (tier sizes, hot/cold hits, spill latency).
+        """
+        return self.store.stats()
@@ -7,6 +7,7 @@ from .nietzsche import analyze_meta as analyze_nietzsche, NietzscheProfile, Meta
 from .campbell import CampbellEngine, HERO_JOURNEY_STAGES
 from .aurelius import analyze_meta as analyze_aurelius, AureliusProfile
 from .meta_router import MetaRouter, RoutingDecision, decide_route
+from .analysis_cache import MetaAnalysisCache, get_meta_analysis_cache
 
 __all__ = [
     "MetaEngineBase",
@@ -21,4 +22,6 @@ __all__ = [
     "MetaRouter",
     "RoutingDecision",
     "decide_route",
+    "MetaAnalysisCache",
+    "get_meta_analysis_cache",
 ]
@@ -0,0 +1,252 @@
+"""
+Content-addressed memoization of meta-engine analyses.
+
+NietzscheEngine, AureliusEngine and CampbellEngine are pure functions of
+their MetaInput (text, Kindra signature, Δ144/TW369 context). Syndicated
+content repeats a lot, so their signals are cached under a fingerprint of:
+
+    engine name + engine version | lower-cased text | quantized inputs
+
+Float inputs are quantized (default 1e-6) before hashing, so re-serialized
+copies of the same vectors map to the same key. This also merges inputs
+that differ by less than the quantum: they share one entry and get the
+signal of whichever was analyzed first. Objects that cannot be
+canonicalized (e.g. arbitrary metadata values) are keyed by repr(), which
+can split equal inputs into separate entries but never merges them.
+
+Tiers:
+    - In-memory LRU bounded by max_entries
+    - Optional on-disk tier (one pickle per key under disk_dir), shared by
+      worker processes; writes are atomic (temp file + rename). Only point
+      it at a directory written by this cache.
+
+analyze() returns a deep copy of the cached signal, so callers may
+mutate what they get back.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from src.meta.types import MetaInput
+
+DEFAULT_QUANTUM = 1e-6
+
+
+def _canonical(value: Any, quantum: float) -> Any:
+    """JSON-serializable, order-independent form of an analysis input."""
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        value = float(value)
+        if not np.isfinite(value):
+            return repr(value)
+        return ["f", int(round(value / quantum))]
+    if isinstance(value, np.ndarray):
+        return ["a", list(value.shape), _canonical(value.ravel().tolist(), quantum)]
+    if isinstance(value, dict):
+        return ["d", sorted(
+            ([str(k), _canonical(v, quantum)] for k, v in value.items()),
+            key=lambda item: item[0],
+        )]
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v, quantum) for v in value]
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return [type(value).__name__, {
+            f.name: _canonical(getattr(value, f.name), quantum)
+            for f in dataclasses.fields(value)
+        }]
+    return ["r", repr(value)]
+
+
+def fingerprint(engine: Any, meta_input: MetaInput, quantum: float = DEFAULT_QUANTUM) -> str:
+    """
+    Cache key of one analysis.
+
+    Args:
+        engine: Meta-engine (its name and version attributes are part of the key)
+        meta_input: Analysis input
+        quantum: Quantization step for float inputs
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    fields = {
+        f.name: getattr(meta_input, f.name)
+        for f in dataclasses.fields(meta_input)
+        if f.name != "text"
+    }
+    payload = json.dumps(
+        [
+            str(getattr(engine, "name", type(engine).__name__)),
+            str(getattr(engine, "version", "")),
+            _canonical(fields, quantum),
+        ],
+        separators=(",", ":"),
+    )
+    h = hashlib.sha256(payload.encode("utf-8"))
+    # Engines only read the lower-cased text
+    h.update(b"\0")
+    h.update(meta_input.text.lower().encode("utf-8"))
+    return h.hexdigest()
+
+
+class MetaAnalysisCache:
+    """
+    LRU (+ optional disk) cache of meta-engine signals.
+
+    Counters:
+        hits: Lookups served from memory
+        disk_hits: Lookups served from the disk tier
+        misses: Lookups that ran the engine
+        evictions: Entries dropped from memory by the LRU bound
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        disk_dir: Optional[Path] = None,
+        quantum: float = DEFAULT_QUANTUM,
+    ):
+        """
+        Args:
+            max_entries: In-memory capacity
+            disk_dir: Directory of the shared disk tier (None disables it)
+            quantum: Quantization step for float inputs
+        """
+        self.max_entries = max(1, max_entries)
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self.quantum = quantum
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def analyze(self, engine: Any, meta_input: MetaInput) -> Any:
+        """
+        engine.analyze(meta_input), served from the cache when possible.
+
+        Exceptions from the engine propagate and are not cached.
+
+        Args:
+            engine: Meta-engine with an analyze(MetaInput) method
+            meta_input: Analysis input
+
+        Returns:
+            The engine's signal (a copy owned by the caller)
+        """
+        key = fingerprint(engine, meta_input, self.quantum)
+
+        with self._lock:
+            signal = self._entries.get(key)
+            if signal is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(signal)
+
+        signal = self._disk_get(key)
+        if signal is not None:
+            with self._lock:
+                self.disk_hits += 1
+                self._put(key, signal)
+            return copy.deepcopy(signal)
+
+        signal = engine.analyze(meta_input)
+        with self._lock:
+            self.misses += 1
+            self._put(key, signal)
+        self._disk_put(key, signal)
+        return copy.deepcopy(signal)
+
+    def _put(self, key: str, signal: Any) -> None:
+        self._entries[key] = signal
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.pkl"
+
+    def _disk_get(self, key: str) -> Optional[Any]:
+        if self.disk_dir is None:
+            return None
+        try:
+            with open(self._disk_path(key), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            # Unreadable or stale entry: recompute (and overwrite it)
+            return None
+
+    def _disk_put(self, key: str, signal: Any) -> None:
+        if self.disk_dir is None:
+            return
+        path = self._disk_path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump(signal, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            # The disk tier is best effort; the memory tier still has the entry
+            tmp.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop the in-memory tier (the disk tier is kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Cache counters."""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+        }
+
+
+_CACHE: Optional[MetaAnalysisCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_meta_analysis_cache() -> MetaAnalysisCache:
+    """
+    Process-wide cache, configured from KALDRA_META_CACHE_SIZE and
+    KALDRA_META_CACHE_DIR on first use.
+    """
+    global _CACHE
+    if _CACHE is None:
+        from src.config import KALDRA_META_CACHE_DIR, KALDRA_META_CACHE_SIZE
+
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                _CACHE = MetaAnalysisCache(
+                    max_entries=KALDRA_META_CACHE_SIZE,
+                    disk_dir=KALDRA_META_CACHE_DIR or None,
+                )
+    return _CACHE
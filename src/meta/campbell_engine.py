@@ -10,8 +10,11 @@ Integrations:
 - TW369: Transformation potential estimation via drift/regime
 """
 
+import re
 from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Sequence, Tuple, Optional
+
+import numpy as np
 
 # Import shared types
 from src.meta.types import MetaInput
@@ -72,6 +75,78 @@ STAGE_KEYWORDS = {
     "RETURN_WITH_ELIXIR": ["home", "share", "heal", "solution", "freedom", "master", "peace"]
 }
 
+# Stage score contributions of Campbell roles and Kindra signals, in the
+# order _detect_journey_stage applies them: (condition, {stage: bonus})
+ROLE_STAGE_BONUS = [
+    ("MENTOR", {"MEETING_MENTOR": 0.4, "CALL_TO_ADVENTURE": 0.2}),
+    ("THRESHOLD_GUARDIAN", {"CROSSING_THRESHOLD": 0.4}),
+    ("SHADOW", {"ORDEAL": 0.3, "RESURRECTION": 0.3}),
+    ("ALLY", {"TESTS_ALLIES_ENEMIES": 0.3}),
+]
+KINDRA_STAGE_BONUS = [
+    (("narrative_intensity", 0.6), {"ORDEAL": 0.3, "RESURRECTION": 0.2, "ROAD_BACK": 0.2}),
+    (("liminality_factor", 0.6), {"CROSSING_THRESHOLD": 0.3, "APPROACH_INMOST_CAVE": 0.2, "RETURN_WITH_ELIXIR": 0.2}),
+    (("worldbuilding_clarity", 0.7), {"ORDINARY_WORLD": 0.3, "RETURN_WITH_ELIXIR": 0.2}),
+]
+
+
+def _compile_stage_tables():
+    """
+    Matrices for batch stage scoring.
+
+    Returns:
+        pattern: Overlapping scan for all keywords (longest match per position)
+        keywords: Unique keywords (column order of the matrices)
+        contains: (K, K) bool, contains[a, b] = keywords[b] occurs in keywords[a]
+        stage_keywords: (K, S) keyword membership per stage
+        bonus: (4 roles + 3 Kindra signals, S) stage bonus matrix
+    """
+    keywords = sorted({kw for kws in STAGE_KEYWORDS.values() for kw in kws})
+    index = {kw: i for i, kw in enumerate(keywords)}
+
+    # A lookahead finds a match starting at every position; the longest
+    # keyword wins there, shorter ones it contains follow from `contains`
+    alternatives = sorted(keywords, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(kw) for kw in alternatives) + "))")
+
+    contains = np.array([[b in a for b in keywords] for a in keywords])
+
+    stage_keywords = np.zeros((len(keywords), len(JOURNEY_STAGES)))
+    for s, stage in enumerate(JOURNEY_STAGES):
+        for kw in STAGE_KEYWORDS.get(stage, []):
+            stage_keywords[index[kw], s] = 1.0
+
+    bonus = np.zeros((len(ROLE_STAGE_BONUS) + len(KINDRA_STAGE_BONUS), len(JOURNEY_STAGES)))
+    for row, (_, stages) in enumerate(ROLE_STAGE_BONUS + KINDRA_STAGE_BONUS):
+        for stage, value in stages.items():
+            bonus[row, JOURNEY_STAGES.index(stage)] = value
+
+    return pattern, keywords, contains, stage_keywords, bonus
+
+
+_STAGE_PATTERN, _STAGE_KEYWORD_LIST, _KEYWORD_CONTAINS, _STAGE_KEYWORDS_MATRIX, _STAGE_BONUS = (
+    _compile_stage_tables()
+)
+_KEYWORD_INDEX = {kw: i for i, kw in enumerate(_STAGE_KEYWORD_LIST)}
+
+
+def keyword_hits(texts: Sequence[str]) -> np.ndarray:
+    """
+    Keyword presence of lower-cased texts (same test as `kw in text`).
+
+    Args:
+        texts: N lower-cased texts
+
+    Returns:
+        (N, n_keywords) 0/1 matrix, columns in sorted keyword order
+    """
+    matched = np.zeros((len(texts), len(_STAGE_KEYWORD_LIST)), dtype=bool)
+    for i, text in enumerate(texts):
+        for kw in set(_STAGE_PATTERN.findall(text)):
+            matched[i, _KEYWORD_INDEX[kw]] = True
+    # Keywords inside a longer match at the same position are present too
+    return ((matched.astype(np.int32) @ _KEYWORD_CONTAINS) > 0).astype(np.int32)
+
 
 # ============================================================================
 # Data Structures
@@ -129,6 +204,7 @@ class CampbellEngine:
     """
     
     name = "campbell"
+    version = "3.1"
 
     def analyze(self, meta_input: MetaInput) -> CampbellSignal:
         """
@@ -158,6 +234,54 @@ class CampbellEngine:
             kindra_sig
         )
         
+        return self._build_signal(
+            meta_input, archetypal_roles, active_archetypes, kindra_sig, journey_stage, stage_conf
+        )
+
+    def analyze_batch(self, meta_inputs: Sequence[MetaInput]) -> List[CampbellSignal]:
+        """
+        Analyze many texts; same results as analyze() on each input.
+        
+        Journey stages of the whole batch are scored with one keyword
+        scan per text and matrix products (see _detect_journey_stage_batch).
+        
+        Args:
+            meta_inputs: Inputs to analyze
+            
+        Returns:
+            One CampbellSignal per input, in order
+        """
+        roles = []
+        kindra_sigs = []
+        for meta_input in meta_inputs:
+            roles.append(self._map_delta144_to_roles(
+                meta_input.delta144_state,
+                meta_input.archetype_scores
+            ))
+            kindra_sigs.append(self._compute_kindra_mythic_signature(meta_input.kindra))
+        
+        stages, confidences = self._detect_journey_stage_batch(
+            [meta_input.text.lower() for meta_input in meta_inputs],
+            [archetypal_roles for archetypal_roles, _ in roles],
+            kindra_sigs
+        )
+        
+        return [
+            self._build_signal(meta_input, archetypal_roles, active_archetypes, kindra_sig, stage, conf)
+            for meta_input, (archetypal_roles, active_archetypes), kindra_sig, stage, conf
+            in zip(meta_inputs, roles, kindra_sigs, stages, confidences)
+        ]
+
+    def _build_signal(
+        self,
+        meta_input: MetaInput,
+        archetypal_roles: Dict[str, str],
+        active_archetypes: List[str],
+        kindra_sig: Dict[str, float],
+        journey_stage: str,
+        stage_conf: float
+    ) -> CampbellSignal:
+        """Steps 4-6 of analyze(): potential, resonance, scores and notes."""
         # 4. Estimate Transformation Potential (TW369)
         trans_potential = self._estimate_transformation_potential(
             journey_stage,
@@ -317,34 +441,19 @@ class CampbellEngine:
         
         # 2. Role Influence
         active_roles = list(roles.values())
-        if "MENTOR" in active_roles:
-            stage_scores["MEETING_MENTOR"] += 0.4
-            stage_scores["CALL_TO_ADVENTURE"] += 0.2
-        if "THRESHOLD_GUARDIAN" in active_roles:
-            stage_scores["CROSSING_THRESHOLD"] += 0.4
-        if "SHADOW" in active_roles:
-            stage_scores["ORDEAL"] += 0.3
-            stage_scores["RESURRECTION"] += 0.3
-        if "ALLY" in active_roles:
-            stage_scores["TESTS_ALLIES_ENEMIES"] += 0.3
+        for role, bonus in ROLE_STAGE_BONUS:
+            if role in active_roles:
+                for stage, value in bonus.items():
+                    stage_scores[stage] += value
             
         # 3. Kindra Influence
-        # High intensity -> Ordeal/Resurrection
-        if kindra_sig["narrative_intensity"] > 0.6:
-            stage_scores["ORDEAL"] += 0.3
-            stage_scores["RESURRECTION"] += 0.2
-            stage_scores["ROAD_BACK"] += 0.2
-            
+        # High intensity -> Ordeal/Resurrection/Road Back
         # High liminality -> Thresholds
-        if kindra_sig["liminality_factor"] > 0.6:
-            stage_scores["CROSSING_THRESHOLD"] += 0.3
-            stage_scores["APPROACH_INMOST_CAVE"] += 0.2
-            stage_scores["RETURN_WITH_ELIXIR"] += 0.2
-            
         # High world clarity -> Ordinary World / Return
-        if kindra_sig["worldbuilding_clarity"] > 0.7:
-            stage_scores["ORDINARY_WORLD"] += 0.3
-            stage_scores["RETURN_WITH_ELIXIR"] += 0.2
+        for (key, threshold), bonus in KINDRA_STAGE_BONUS:
+            if kindra_sig[key] > threshold:
+                for stage, value in bonus.items():
+                    stage_scores[stage] += value
 
         # Select best stage
         best_stage = max(stage_scores.items(), key=lambda x: x[1])
@@ -357,6 +466,55 @@ class CampbellEngine:
         confidence = min(1.0, best_stage[1])
         return best_stage[0], confidence
 
+    def _detect_journey_stage_batch(
+        self,
+        texts: Sequence[str],
+        roles: Sequence[Dict[str, str]],
+        kindra_sigs: Sequence[Dict[str, float]]
+    ) -> Tuple[List[str], List[float]]:
+        """
+        Vectorized _detect_journey_stage over N texts.
+        
+        Stage scores are (N, S) arrays: keyword hits (N, K) times the
+        stage membership matrix (K, S), then the role/Kindra bonus rows
+        added in the same order as the scalar path, so the floating point
+        results are identical.
+        
+        Returns:
+            (stage names, confidences)
+        """
+        n = len(texts)
+        if n == 0:
+            return [], []
+        
+        counts = keyword_hits(texts) @ _STAGE_KEYWORDS_MATRIX
+        stage_scores = np.minimum(1.0, counts * 0.2)
+        
+        flags = np.zeros((n, len(_STAGE_BONUS)), dtype=bool)
+        for i, (role_map, kindra_sig) in enumerate(zip(roles, kindra_sigs)):
+            active_roles = set(role_map.values())
+            for j, (role, _) in enumerate(ROLE_STAGE_BONUS):
+                flags[i, j] = role in active_roles
+            for j, ((key, threshold), _) in enumerate(KINDRA_STAGE_BONUS, start=len(ROLE_STAGE_BONUS)):
+                flags[i, j] = kindra_sig[key] > threshold
+        
+        for j in range(len(_STAGE_BONUS)):
+            stage_scores += np.where(flags[:, j, None], _STAGE_BONUS[j], 0.0)
+        
+        best = stage_scores.argmax(axis=1)
+        best_scores = stage_scores[np.arange(n), best]
+        
+        stages = []
+        confidences = []
+        for idx, score in zip(best.tolist(), best_scores.tolist()):
+            if score == 0.0:
+                stages.append("ORDINARY_WORLD")
+                confidences.append(0.1)
+            else:
+                stages.append(JOURNEY_STAGES[idx])
+                confidences.append(min(1.0, score))
+        return stages, confidences
+
     def _estimate_transformation_potential(
         self,
         journey_stage: str,
@@ -6,7 +6,11 @@ Coordinates execution across multiple KALDRA engine variants.
 
 from __future__ import annotations
 
+import inspect
+import threading
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
@@ -22,13 +26,104 @@ class OrchestrationConfig:
     Configuration for orchestration.
     
     Attributes:
-        parallel_execution: Whether to execute engines in parallel (not yet implemented)
-        timeout_seconds: Optional timeout for execution
+        parallel_execution: Whether to fan out primary and secondary engines
+            on a thread pool
+        timeout_seconds: Optional per-call deadline for parallel execution;
+            engines still running at the deadline are reported as failed
         fallback_to_default: Whether to use default engine if routing fails
+        max_workers: Thread pool size for parallel execution
+        hedge_fallback: Launch the default engine speculatively when the
+            primary is slower than usual (requires fallback_to_default);
+            the first successful result wins
+        hedge_percentile: Primary latency percentile after which the
+            default engine is launched
+        hedge_min_samples: Latency samples needed before hedging on
+            latency (before that, the default only runs on failure)
+        latency_window: Number of recent latencies kept per engine
     """
     parallel_execution: bool = False
     timeout_seconds: Optional[float] = None
     fallback_to_default: bool = True
+    max_workers: int = 4
+    hedge_fallback: bool = False
+    hedge_percentile: float = 95.0
+    hedge_min_samples: int = 20
+    latency_window: int = 200
+
+
+# Engine variants: same models, different tau
+VARIANT_TAUS: Dict[str, float] = {
+    "default": 0.65,
+    "alpha": 0.70,      # Financial analysis (slightly higher tau for more certainty)
+    "geo": 0.65,        # Geopolitical analysis (standard tau)
+    "product": 0.60,    # UX/Product analysis (lower tau for more exploration)
+    "safeguard": 0.75,  # Safety/moderation (higher tau for more conservative decisions)
+}
+
+
+class EngineVariant:
+    """
+    Lightweight view over a shared engine core with its own tau.
+    
+    Attribute reads fall through to the core, so the Δ144 engine, Kindra
+    matrices and other models exist once. Plain methods defined on the
+    engine class are bound to the view, so code reading self.tau inside
+    them sees the variant's value; static/class methods, properties and
+    instance attributes resolve on the core as usual. The core is shared:
+    it must not be mutated through a view.
+    """
+    
+    __slots__ = ("name", "core", "tau")
+    
+    def __init__(self, name: str, core: Any, tau: float):
+        self.name = name
+        self.core = core
+        self.tau = tau
+    
+    def __getattr__(self, attr: str) -> Any:
+        core = self.core
+        # getattr_static sees staticmethod/classmethod wrappers unresolved,
+        # so only plain functions are rebound; instance attributes win
+        if attr not in getattr(core, "__dict__", {}):
+            method = inspect.getattr_static(type(core), attr, None)
+            if inspect.isfunction(method):
+                return method.__get__(self)
+        return getattr(core, attr)
+    
+    def __repr__(self) -> str:
+        return f"EngineVariant(name={self.name!r}, tau={self.tau})"
+
+
+class LatencyTracker:
+    """Rolling window of successful execution times per engine."""
+    
+    def __init__(self, window: int = 200):
+        self.window = max(1, window)
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, engine_name: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(engine_name)
+            if samples is None:
+                samples = self._samples[engine_name] = deque(maxlen=self.window)
+            samples.append(seconds)
+    
+    def count(self, engine_name: str) -> int:
+        return len(self._samples.get(engine_name, ()))
+    
+    def percentile(self, engine_name: str, q: float, min_samples: int = 1) -> Optional[float]:
+        """
+        q-th percentile (0-100) of recent latencies.
+        
+        Returns:
+            Latency in seconds, or None with fewer than min_samples samples
+        """
+        with self._lock:
+            samples = list(self._samples.get(engine_name, ()))
+        if len(samples) < max(1, min_samples):
+            return None
+        return float(np.percentile(samples, q))
 
 
 @dataclass
@@ -79,45 +174,60 @@ class MetaOrchestrator:
     - default: General-purpose
     """
     
-    def __init__(self, config: Optional[OrchestrationConfig] = None):
+    def __init__(
+        self,
+        config: Optional[OrchestrationConfig] = None,
+        engine_core: Optional[KaldraMasterEngineV2] = None,
+    ):
         """
         Initialize orchestrator.
         
         Args:
             config: Optional orchestration configuration
+            engine_core: Optional shared engine (built once if not given)
         """
         self.config = config or OrchestrationConfig()
         self.router = MetaRouter()
+        self.engine_core = engine_core
         self.engines = self._initialize_engines()
+        self.latency = LatencyTracker(self.config.latency_window)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
     
-    def _initialize_engines(self) -> Dict[str, KaldraMasterEngineV2]:
+    def _initialize_engines(self) -> Dict[str, EngineVariant]:
         """
         Initialize all engine variants.
         
-        For now, all variants use the same underlying engine with different metadata.
-        In the future, variants may have different configurations (tau, tw_config, etc.)
+        All variants are views over one shared engine core and differ only
+        in tau, so models are loaded once regardless of the variant count.
         
         Returns:
-            Dictionary mapping engine names to instances
+            Dictionary mapping engine names to variants
         """
-        engines = {}
-        
-        # Default engine
-        engines["default"] = KaldraMasterEngineV2(d_ctx=256, tau=0.65)
-        
-        # Alpha: Financial analysis (slightly higher tau for more certainty)
-        engines["alpha"] = KaldraMasterEngineV2(d_ctx=256, tau=0.70)
+        if self.engine_core is None:
+            self.engine_core = KaldraMasterEngineV2(d_ctx=256, tau=VARIANT_TAUS["default"])
         
-        # GEO: Geopolitical analysis (standard tau)
-        engines["geo"] = KaldraMasterEngineV2(d_ctx=256, tau=0.65)
-        
-        # Product: UX/Product analysis (lower tau for more exploration)
-        engines["product"] = KaldraMasterEngineV2(d_ctx=256, tau=0.60)
-        
-        # Safeguard: Safety/moderation (higher tau for more conservative decisions)
-        engines["safeguard"] = KaldraMasterEngineV2(d_ctx=256, tau=0.75)
-        
-        return engines
+        return {
+            name: EngineVariant(name, self.engine_core, tau)
+            for name, tau in VARIANT_TAUS.items()
+        }
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=max(1, self.config.max_workers),
+                        thread_name_prefix="kaldra-meta",
+                    )
+        return self._executor
+    
+    def shutdown(self) -> None:
+        """Stop the worker threads (if parallel execution was used)."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
     
     def execute(
         self,
@@ -125,6 +235,7 @@ class MetaOrchestrator:
         context: Optional[RoutingContext] = None,
         routing_decision: Optional[RoutingDecision] = None,
         tw_window: Optional[np.ndarray] = None,
+        stream_id: Optional[str] = None,
     ) -> OrchestrationResult:
         """
         Execute inference using routed engine(s).
@@ -134,12 +245,17 @@ class MetaOrchestrator:
             context: Optional routing context (if routing_decision not provided)
             routing_decision: Optional pre-computed routing decision
             tw_window: Optional TW window for inference
+            stream_id: Session/tenant id keying the engines' TW369 drift
+                memory (default: context.metadata["stream_id"])
         
         Returns:
             OrchestrationResult with primary and optional secondary results
         """
         start_time = time.time()
         
+        if stream_id is None and context is not None and context.metadata:
+            stream_id = context.metadata.get("stream_id")
+        
         # Step 1: Route if needed
         if routing_decision is None:
             if context is None:
@@ -152,24 +268,39 @@ class MetaOrchestrator:
             else:
                 routing_decision = self.router.route(context)
         
-        # Step 2: Execute primary engine
-        primary_result = self._execute_engine(
-            routing_decision.primary_engine,
-            embedding,
-            tw_window
-        )
+        # Steps 2-3: Execute primary and secondary engines
+        primary_name = routing_decision.primary_engine
+        secondary_names = list(routing_decision.secondary_engines or [])
+        hedged = self._should_hedge(primary_name)
         
-        # Step 3: Execute secondary engines (if any)
-        secondary_results = []
-        if routing_decision.secondary_engines:
-            for engine_name in routing_decision.secondary_engines:
-                result = self._execute_engine(engine_name, embedding, tw_window)
-                secondary_results.append(result)
-        
-        # Step 4: Handle fallback if primary failed
-        if not primary_result.success and self.config.fallback_to_default:
-            if routing_decision.primary_engine != "default":
-                fallback_result = self._execute_engine("default", embedding, tw_window)
+        if hedged:
+            secondary_futures = None
+            if self.config.parallel_execution and secondary_names:
+                secondary_futures = self._submit(secondary_names, embedding, tw_window, stream_id)
+            primary_result = self._execute_hedged(primary_name, embedding, tw_window, start_time, stream_id)
+            if secondary_futures is not None:
+                secondary_results = self._collect(secondary_names, secondary_futures, start_time)
+            else:
+                secondary_results = [
+                    self._execute_engine(engine_name, embedding, tw_window, stream_id)
+                    for engine_name in secondary_names
+                ]
+        else:
+            engine_names = [primary_name] + secondary_names
+            if self.config.parallel_execution and len(engine_names) > 1:
+                futures = self._submit(engine_names, embedding, tw_window, stream_id)
+                results = self._collect(engine_names, futures, start_time)
+            else:
+                results = [
+                    self._execute_engine(engine_name, embedding, tw_window, stream_id)
+                    for engine_name in engine_names
+                ]
+            primary_result, secondary_results = results[0], results[1:]
+        
+        # Step 4: Handle fallback if primary failed (hedged runs already did)
+        if not hedged and not primary_result.success and self.config.fallback_to_default:
+            if primary_name != "default":
+                fallback_result = self._execute_engine("default", embedding, tw_window, stream_id)
                 if fallback_result.success:
                     primary_result = fallback_result
         
@@ -182,11 +313,130 @@ class MetaOrchestrator:
             total_time=total_time
         )
     
+    def _remaining(self, start_time: float) -> Optional[float]:
+        """Seconds left until the per-call deadline (None without one)."""
+        if self.config.timeout_seconds is None:
+            return None
+        return max(0.0, start_time + self.config.timeout_seconds - time.time())
+    
+    def _deadline_result(self, engine_name: str, start_time: float) -> EngineResult:
+        return EngineResult(
+            engine_name=engine_name,
+            signal=None,
+            execution_time=time.time() - start_time,
+            success=False,
+            error=f"Engine '{engine_name}' exceeded deadline of {self.config.timeout_seconds}s"
+        )
+    
+    def _submit(
+        self,
+        engine_names: List[str],
+        embedding: np.ndarray,
+        tw_window: Optional[np.ndarray],
+        stream_id: Optional[str] = None,
+    ) -> List[Future]:
+        executor = self._get_executor()
+        return [
+            executor.submit(self._execute_engine, name, embedding, tw_window, stream_id)
+            for name in engine_names
+        ]
+    
+    def _collect(
+        self,
+        engine_names: List[str],
+        futures: List[Future],
+        start_time: float,
+    ) -> List[EngineResult]:
+        """
+        Wait for submitted engines and return results in input order.
+        
+        With timeout_seconds set, engines not finished by the deadline are
+        reported as failed; queued ones are cancelled and running ones are
+        left to finish in the background (their results are discarded).
+        """
+        wait(futures, timeout=self._remaining(start_time))
+        
+        results = []
+        for name, future in zip(engine_names, futures):
+            if future.done() and not future.cancelled():
+                results.append(future.result())
+            else:
+                future.cancel()
+                results.append(self._deadline_result(name, start_time))
+        return results
+    
+    def _should_hedge(self, primary_name: str) -> bool:
+        return (
+            self.config.hedge_fallback
+            and self.config.fallback_to_default
+            and primary_name != "default"
+            and primary_name in self.engines
+        )
+    
+    def _execute_hedged(
+        self,
+        primary_name: str,
+        embedding: np.ndarray,
+        tw_window: Optional[np.ndarray],
+        start_time: float,
+        stream_id: Optional[str] = None,
+    ) -> EngineResult:
+        """
+        Run the primary engine with a speculative default-engine fallback.
+        
+        The default engine is launched when the primary fails, or when it
+        is still running after its hedge_percentile latency. The first
+        successful result wins and the other run is cancelled if still
+        queued, or discarded. If neither succeeds, the primary's result
+        (or a deadline failure) is returned.
+        """
+        executor = self._get_executor()
+        primary = executor.submit(self._execute_engine, primary_name, embedding, tw_window, stream_id)
+        
+        hedge_delay = self.latency.percentile(
+            primary_name, self.config.hedge_percentile, self.config.hedge_min_samples
+        )
+        remaining = self._remaining(start_time)
+        if hedge_delay is None:
+            timeout = remaining
+        elif remaining is None:
+            timeout = hedge_delay
+        else:
+            timeout = min(hedge_delay, remaining)
+        wait([primary], timeout=timeout)
+        
+        if primary.done() and primary.result().success:
+            return primary.result()
+        
+        if self._remaining(start_time) == 0.0:
+            primary.cancel()
+            return primary.result() if primary.done() else self._deadline_result(primary_name, start_time)
+        
+        fallback = executor.submit(self._execute_engine, "default", embedding, tw_window, stream_id)
+        pending = {fallback} if primary.done() else {primary, fallback}
+        
+        while pending:
+            done, pending = wait(pending, timeout=self._remaining(start_time), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.result().success:
+                    for loser in pending:
+                        loser.cancel()
+                    return future.result()
+        
+        for loser in pending:
+            loser.cancel()
+        if primary.done() and not primary.cancelled():
+            return primary.result()
+        return self._deadline_result(primary_name, start_time)
+    
     def _execute_engine(
         self,
         engine_name: str,
         embedding: np.ndarray,
         tw_window: Optional[np.ndarray] = None,
+        stream_id: Optional[str] = None,
     ) -> EngineResult:
         """
         Execute a single engine.
@@ -195,6 +445,7 @@ class MetaOrchestrator:
             engine_name: Name of engine to execute
             embedding: Input embedding
             tw_window: Optional TW window
+            stream_id: Optional session/tenant id for TW369 drift memory
         
         Returns:
             EngineResult with execution details
@@ -214,9 +465,10 @@ class MetaOrchestrator:
                 )
             
             # Execute inference
-            signal = engine.infer_from_embedding(embedding, tw_window=tw_window)
+            signal = engine.infer_from_embedding(embedding, tw_window=tw_window, stream_id=stream_id)
             
             execution_time = time.time() - start_time
+            self.latency.record(engine_name, execution_time)
             
             return EngineResult(
                 engine_name=engine_name,
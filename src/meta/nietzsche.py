@@ -20,7 +20,7 @@ and temporal awareness from TW369.
 """
 
 from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 import re
 
 # Import v3.1 state definitions
@@ -30,6 +30,9 @@ from src.tw369.tw369_integration import TWState
 from src.common.unified_signal import MetaSignal
 from src.meta.types import MetaInput
 
+if TYPE_CHECKING:
+    from src.meta.analysis_cache import MetaAnalysisCache
+
 
 # ============================================================================
 # v3.1 Data Structures
@@ -192,6 +195,7 @@ class NietzscheEngine:
     """
     
     name = "nietzsche"
+    version = "3.1"
     
     def analyze(self, meta_input: MetaInput) -> NietzscheSignal:
         """
@@ -564,6 +568,7 @@ def analyze_meta(
     delta144_state: Optional[str] = None,
     tw_state: Optional[Any] = None,
     bias_score: Optional[float] = None,
+    cache: Optional["MetaAnalysisCache"] = None,
 ) -> MetaEngineResult:
     """
     Legacy wrapper for backward compatibility with v2.9.
@@ -574,6 +579,7 @@ def analyze_meta(
         delta144_state: Optional current Δ144 state
         tw_state: Optional TWState for drift context
         bias_score: Optional bias score
+        cache: Optional MetaAnalysisCache to memoize the analysis
         
     Returns:
         MetaEngineResult with 12-dimensional analysis
@@ -593,12 +599,15 @@ def analyze_meta(
     
     # Run v3.1 engine
     engine = NietzscheEngine()
-    signal = engine.analyze(meta_input)
+    if cache is not None:
+        signal = cache.analyze(engine, meta_input)
+    else:
+        signal = engine.analyze(meta_input)
     
     # Convert back to legacy format
     return MetaEngineResult(
-        scores=signal.scores,
-        dominant_axes=signal.dominant_axes,
+        scores=dict(signal.scores),
+        dominant_axes=list(signal.dominant_axes),
         severity=signal.severity,
-        notes=signal.notes
+        notes=list(signal.notes)
     )
@@ -20,6 +20,11 @@ from .narrative_arc import (
     analyze_arc,
     predict_next_stage,
     compute_tension,
+    CampbellStageTracker,
+    build_transition_matrix,
+    stage_likelihoods,
+    viterbi_decode_batch,
+    decode_stage_paths,
 )
 from .archetypal_timeline import (
     ArchetypalTimeline,
@@ -48,6 +53,11 @@ __all__ = [
     "analyze_arc",
     "predict_next_stage",
     "compute_tension",
+    "CampbellStageTracker",
+    "build_transition_matrix",
+    "stage_likelihoods",
+    "viterbi_decode_batch",
+    "decode_stage_paths",
     "ArchetypalTimeline",
     "TimelinePoint",
     "ArchetypalLoop",
@@ -8,7 +8,9 @@ for hybrid narrative arc detection and prediction.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 from .story_buffer import StoryBuffer, StoryEvent
 
@@ -29,6 +31,8 @@ CAMPBELL_STAGES = [
     "return_with_elixir"
 ]
 
+_STAGE_INDEX = {stage: i for i, stage in enumerate(CAMPBELL_STAGES)}
+
 
 @dataclass
 class NarrativeArc:
@@ -51,23 +55,29 @@ class NarrativeArc:
     meta_alignment: Dict[str, float]  # Nietzsche/Aurelius alignment
 
 
-def analyze_arc(buffer: StoryBuffer) -> Optional[NarrativeArc]:
+def analyze_arc(
+    buffer: StoryBuffer,
+    tracker: Optional["CampbellStageTracker"] = None,
+) -> Optional[NarrativeArc]:
     """
     Analyze narrative arc from buffer.
     
+    With a tracker that has already seen the buffer's events, the stage,
+    transition likelihood, next stage and inflection distance come from
+    its filtered state instead of re-walking the timeline.
+    
     Args:
         buffer: StoryBuffer with events
+        tracker: Optional CampbellStageTracker kept in sync with the buffer
         
     Returns:
         NarrativeArc or None if insufficient data
     """
-    timeline = buffer.get_timeline()
-    
-    if len(timeline) == 0:
+    if len(buffer) == 0:
         return None
     
     # Get current event
-    current_event = timeline[-1]
+    current_event = buffer.get_recent(1)[0]
     
     # Extract Campbell stage
     current_stage = "ordinary_world"  # Default
@@ -78,6 +88,10 @@ def analyze_arc(buffer: StoryBuffer) -> Optional[NarrativeArc]:
         current_stage = campbell.get("stage", "ordinary_world")
         stage_confidence = campbell.get("confidence", 0.5)
     
+    if tracker is not None and tracker.num_events:
+        current_stage = tracker.current_stage
+        stage_confidence = tracker.stage_confidence
+    
     # Get stage index
     try:
         stage_index = CAMPBELL_STAGES.index(current_stage)
@@ -87,17 +101,22 @@ def analyze_arc(buffer: StoryBuffer) -> Optional[NarrativeArc]:
     # Compute arc progress
     arc_progress = stage_index / (len(CAMPBELL_STAGES) - 1)
     
-    # Predict next stage
-    predicted_next_stage = _predict_next_stage(current_stage, stage_index, timeline)
-    
-    # Compute transition likelihood
-    transition_likelihood = _compute_transition_likelihood(timeline, current_stage)
+    if tracker is not None and tracker.num_events:
+        predicted_next_stage = tracker.predicted_next_stage
+        transition_likelihood = tracker.transition_likelihood
+        inflection_distance = tracker.expected_events_to_transition
+    else:
+        # Predict next stage
+        predicted_next_stage = _predict_next_stage(current_stage, stage_index)
+        
+        # Compute transition likelihood
+        transition_likelihood = _compute_transition_likelihood(buffer, current_stage)
+        
+        # Predict inflection distance
+        inflection_distance = _predict_inflection_distance(current_stage)
     
     # Compute tension trend
-    tension_trend = compute_tension(timeline)
-    
-    # Predict inflection distance
-    inflection_distance = _predict_inflection_distance(timeline, current_stage)
+    tension_trend = compute_tension(buffer)
     
     # Get drift level
     drift_level = 0.0
@@ -141,7 +160,7 @@ def predict_next_stage(current_arc: NarrativeArc, buffer: StoryBuffer) -> str:
     return CAMPBELL_STAGES[next_index]
 
 
-def compute_tension(events: List[StoryEvent]) -> float:
+def compute_tension(events: Union[StoryBuffer, List[StoryEvent]]) -> float:
     """
     Compute narrative tension trend.
     
@@ -151,7 +170,7 @@ def compute_tension(events: List[StoryEvent]) -> float:
     - Aurelius emotional_regulation (inverse)
     
     Args:
-        events: List of StoryEvents
+        events: StoryBuffer (read through its columns) or list of StoryEvents
         
     Returns:
         Tension trend (+/- change)
@@ -159,19 +178,300 @@ def compute_tension(events: List[StoryEvent]) -> float:
     if len(events) < 2:
         return 0.0
     
-    # Compare last two events
-    prev = events[-2]
-    curr = events[-1]
+    if not isinstance(events, StoryBuffer):
+        # Compare last two events
+        return _compute_event_tension(events[-1]) - _compute_event_tension(events[-2])
+    
+    # Last two rows of the drift / tension columns (same terms as _compute_event_tension)
+    drift = np.nan_to_num(events.drift_metrics()[-2:])
+    drift = np.where(events.has_drift_state()[-2:], drift, 0.0)
+    features = events.tension_features()[-2:]
+    will_to_power = np.nan_to_num(features[:, 0])
+    active_nihilism = np.nan_to_num(features[:, 1])
+    regulation = np.where(np.isnan(features[:, 2]), 0.5, features[:, 2])
+    
+    tension = drift * 0.4 + (will_to_power + active_nihilism) * 0.3 - (regulation - 0.5) * 0.3
+    tension = np.clip(tension, 0.0, 1.0)
+    
+    return float(tension[1] - tension[0])
+
+
+# Stage tracking (HMM over Campbell stages)
+
+def build_transition_matrix(
+    stay: float = 0.6,
+    advance: float = 0.3,
+    skip: float = 0.05,
+) -> np.ndarray:
+    """
+    Campbell stage transition matrix (rows: from, columns: to).
+    
+    Stories mostly stay in a stage or move to the next one, sometimes
+    skip one; the remaining mass is spread over all other stages so
+    regressions and jumps stay possible. The final stage keeps the
+    forward mass (stories end there).
+    
+    Args:
+        stay: P(same stage)
+        advance: P(next stage)
+        skip: P(stage after next)
+        
+    Returns:
+        Row-stochastic (12, 12) matrix
+        
+    Raises:
+        ValueError: If the probabilities are negative or exceed 1
+    """
+    if min(stay, advance, skip) < 0 or stay + advance + skip > 1.0:
+        raise ValueError("stay, advance and skip must be >= 0 and sum to <= 1")
+    
+    n = len(CAMPBELL_STAGES)
+    rest = 1.0 - stay - advance - skip
+    matrix = np.zeros((n, n))
+    for i in range(n):
+        matrix[i] += rest / (n - 1)
+        matrix[i, i] = stay
+        # Forward mass past the last stage folds back into it
+        matrix[i, min(i + 1, n - 1)] += advance
+        matrix[i, min(i + 2, n - 1)] += skip
+    return matrix / matrix.sum(axis=1, keepdims=True)
+
+
+DEFAULT_TRANSITIONS = build_transition_matrix()
+
+
+def stage_likelihoods(event: StoryEvent) -> np.ndarray:
+    """
+    Observation likelihood of each Campbell stage for one event.
+    
+    The Campbell meta-score's stage gets its confidence, the other stages
+    share the rest. Events without a (known) Campbell stage are
+    uninformative (uniform).
     
-    prev_tension = _compute_event_tension(prev)
-    curr_tension = _compute_event_tension(curr)
+    Args:
+        event: StoryEvent
+        
+    Returns:
+        (12,) likelihood vector
+    """
+    n = len(CAMPBELL_STAGES)
+    campbell = (event.meta_scores or {}).get("campbell")
+    if not isinstance(campbell, dict):
+        return np.full(n, 1.0 / n)
+    
+    index = _STAGE_INDEX.get(campbell.get("stage"))
+    if index is None:
+        return np.full(n, 1.0 / n)
+    
+    confidence = min(max(float(campbell.get("confidence", 0.5)), 1e-3), 1.0 - 1e-3)
+    likelihood = np.full(n, (1.0 - confidence) / (n - 1))
+    likelihood[index] = confidence
+    return likelihood
+
+
+class CampbellStageTracker:
+    """
+    Forward-filtered Campbell stage belief for one story.
+    
+    Each update() costs O(stages²): predict with the transition matrix,
+    weight by the event's stage likelihoods, normalize. Nothing is
+    re-derived from past events.
+    """
+    
+    def __init__(
+        self,
+        transitions: Optional[np.ndarray] = None,
+        initial: Optional[np.ndarray] = None,
+    ):
+        """
+        Args:
+            transitions: (12, 12) row-stochastic matrix (default: DEFAULT_TRANSITIONS)
+            initial: Prior over stages before the first event (default: ordinary_world heavy)
+        """
+        self.transitions = DEFAULT_TRANSITIONS if transitions is None else np.asarray(transitions, dtype=float)
+        n = len(CAMPBELL_STAGES)
+        if self.transitions.shape != (n, n):
+            raise ValueError(f"transitions must have shape ({n}, {n})")
+        if initial is None:
+            initial = np.full(n, 0.5 / (n - 1))
+            initial[0] = 0.5
+        self.initial = np.asarray(initial, dtype=float) / np.sum(initial)
+        self._stay = np.diag(self.transitions).copy()
+        self.reset()
+    
+    def reset(self) -> None:
+        """Forget all events."""
+        self.belief = self.initial.copy()
+        self.num_events = 0
+        self.log_likelihood = 0.0
+        self._run_stage = -1
+        self._run_length = 0
+    
+    def update(self, event: Any) -> np.ndarray:
+        """
+        Add one event.
+        
+        Args:
+            event: StoryEvent, or a (12,) stage likelihood vector
+            
+        Returns:
+            Posterior stage distribution after the event
+        """
+        likelihood = stage_likelihoods(event) if isinstance(event, StoryEvent) else np.asarray(event, dtype=float)
+        
+        predicted = self.initial if self.num_events == 0 else self.belief @ self.transitions
+        posterior = predicted * likelihood
+        total = posterior.sum()
+        if total <= 0.0:
+            # Observation impossible under the model: fall back to the prediction
+            posterior, total = predicted.copy(), 1.0
+        else:
+            self.log_likelihood += float(np.log(total))
+        self.belief = posterior / total
+        self.num_events += 1
+        
+        stage = int(self.belief.argmax())
+        self._run_length = self._run_length + 1 if stage == self._run_stage else 1
+        self._run_stage = stage
+        return self.belief
+    
+    def update_many(self, events: Sequence[Any]) -> np.ndarray:
+        """update() each event in order; returns the final belief."""
+        for event in events:
+            self.update(event)
+        return self.belief
+    
+    @classmethod
+    def from_buffer(cls, buffer: StoryBuffer, **kwargs) -> "CampbellStageTracker":
+        """Tracker replayed over a buffer's timeline."""
+        tracker = cls(**kwargs)
+        tracker.update_many(buffer.get_timeline())
+        return tracker
+    
+    @property
+    def current_stage(self) -> str:
+        """Most probable current stage."""
+        return CAMPBELL_STAGES[int(self.belief.argmax())]
+    
+    @property
+    def stage_confidence(self) -> float:
+        """Posterior probability of the current stage."""
+        return float(self.belief.max())
+    
+    @property
+    def events_in_stage(self) -> int:
+        """Consecutive events (ending now) with the same most probable stage."""
+        return self._run_length
+    
+    def next_distribution(self) -> np.ndarray:
+        """Predicted stage distribution for the next event."""
+        return self.belief @ self.transitions
+    
+    @property
+    def transition_likelihood(self) -> float:
+        """Probability that the next event is in a different stage."""
+        return float(1.0 - self.belief @ self._stay)
+    
+    @property
+    def predicted_next_stage(self) -> str:
+        """Most probable stage of the next event other than the current one."""
+        predicted = self.next_distribution()
+        predicted[int(self.belief.argmax())] = -1.0
+        return CAMPBELL_STAGES[int(predicted.argmax())]
+    
+    @property
+    def expected_events_to_transition(self) -> int:
+        """Expected events until the stage changes (geometric stage durations)."""
+        expected = float(self.belief @ (1.0 / np.maximum(1.0 - self._stay, 1e-9)))
+        return max(1, int(round(expected)))
+
+
+def viterbi_decode_batch(
+    likelihoods: np.ndarray,
+    lengths: Optional[Sequence[int]] = None,
+    transitions: Optional[np.ndarray] = None,
+    initial: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Most likely stage paths for many stories at once.
     
-    return curr_tension - prev_tension
+    Runs the Viterbi recursion in log space over the batch axis: one
+    (B, S, S) max/argmax per time step for all stories together.
+    
+    Args:
+        likelihoods: (B, L, 12) stage likelihoods, padded to the longest story
+        lengths: Story lengths (default: all L); steps past a story's
+            length are ignored and decoded as -1
+        transitions: Transition matrix (default: DEFAULT_TRANSITIONS)
+        initial: Stage prior (default: CampbellStageTracker's)
+        
+    Returns:
+        (B, L) int array of stage indices into CAMPBELL_STAGES
+    """
+    likelihoods = np.asarray(likelihoods, dtype=float)
+    B, L, S = likelihoods.shape
+    if B == 0 or L == 0:
+        return np.zeros((B, L), dtype=np.intp)
+    
+    tracker = CampbellStageTracker(transitions, initial)
+    lengths = np.full(B, L) if lengths is None else np.asarray(lengths, dtype=np.intp)
+    
+    with np.errstate(divide="ignore"):
+        log_t = np.log(tracker.transitions)
+        log_e = np.log(likelihoods)
+        log_delta = np.log(tracker.initial)[None, :] + log_e[:, 0]
+    
+    backpointers = np.zeros((B, L, S), dtype=np.intp)
+    identity = np.arange(S)
+    for t in range(1, L):
+        scores = log_delta[:, :, None] + log_t[None, :, :]
+        best_prev = scores.argmax(axis=1)
+        stepped = np.take_along_axis(scores, best_prev[:, None, :], axis=1)[:, 0, :] + log_e[:, t]
+        active = (t < lengths)[:, None]
+        log_delta = np.where(active, stepped, log_delta)
+        backpointers[:, t] = np.where(active, best_prev, identity)
+    
+    paths = np.empty((B, L), dtype=np.intp)
+    paths[:, -1] = log_delta.argmax(axis=1)
+    rows = np.arange(B)
+    for t in range(L - 1, 0, -1):
+        paths[:, t - 1] = backpointers[rows, t, paths[:, t]]
+    
+    paths[np.arange(L)[None, :] >= lengths[:, None]] = -1
+    return paths
+
+
+def decode_stage_paths(
+    timelines: Sequence[Sequence[StoryEvent]],
+    transitions: Optional[np.ndarray] = None,
+) -> List[List[str]]:
+    """
+    Viterbi stage paths (stage names) for many story timelines.
+    
+    Args:
+        timelines: One event list per story (oldest first)
+        transitions: Transition matrix (default: DEFAULT_TRANSITIONS)
+        
+    Returns:
+        One list of stage names per story
+    """
+    lengths = [len(timeline) for timeline in timelines]
+    L = max(lengths, default=0)
+    likelihoods = np.full((len(timelines), L, len(CAMPBELL_STAGES)), 1.0)
+    for b, timeline in enumerate(timelines):
+        for t, event in enumerate(timeline):
+            likelihoods[b, t] = stage_likelihoods(event)
+    
+    paths = viterbi_decode_batch(likelihoods, lengths, transitions)
+    return [
+        [CAMPBELL_STAGES[i] for i in paths[b, :n]]
+        for b, n in enumerate(lengths)
+    ]
 
 
 # Helper functions
 
-def _predict_next_stage(current_stage: str, stage_index: int, timeline: List[StoryEvent]) -> str:
+def _predict_next_stage(current_stage: str, stage_index: int) -> str:
     """Predict next stage based on current trajectory."""
     # Simple linear progression
     next_index = stage_index + 1
@@ -182,7 +482,7 @@ def _predict_next_stage(current_stage: str, stage_index: int, timeline: List[Sto
     return CAMPBELL_STAGES[next_index]
 
 
-def _compute_transition_likelihood(timeline: List[StoryEvent], current_stage: str) -> float:
+def _compute_transition_likelihood(buffer: StoryBuffer, current_stage: str) -> float:
     """
     Compute likelihood of transitioning to next stage.
     
@@ -191,16 +491,18 @@ def _compute_transition_likelihood(timeline: List[StoryEvent], current_stage: st
     - Drift acceleration
     - Meta-score changes
     """
-    if len(timeline) < 2:
+    if len(buffer) < 2:
         return 0.5
     
-    # Count events in current stage
+    # Count events in current stage (the likelihood stops growing at 4)
     events_in_stage = 0
-    for event in reversed(timeline):
+    for event in buffer.iter_recent():
         if event.meta_scores and "campbell" in event.meta_scores:
             stage = event.meta_scores["campbell"].get("stage")
             if stage == current_stage:
                 events_in_stage += 1
+                if events_in_stage >= 4:
+                    break
             else:
                 break
     
@@ -218,7 +520,7 @@ def _compute_transition_likelihood(timeline: List[StoryEvent], current_stage: st
     return likelihood
 
 
-def _predict_inflection_distance(timeline: List[StoryEvent], current_stage: str) -> int:
+def _predict_inflection_distance(current_stage: str) -> int:
     """
     Predict number of events until next inflection.
     
@@ -6,15 +6,21 @@ Aggregates events from StoryBuffer and detects:
 - Inflection points
 - Arc progression
 - Drift trajectories
+
+The numeric parts (Δ12 distances and dominant archetypes, drift, Campbell
+stages, Δ144 transitions) are computed on the StoryBuffer columns; only
+the free-form meta/polarity dicts are read from the stored events.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 import math
 
-from .story_buffer import StoryBuffer, StoryEvent
+import numpy as np
+
+from .story_buffer import NO_STAGE, NO_STATE, StoryBuffer, StoryEvent
 
 
 @dataclass
@@ -124,16 +130,16 @@ def aggregate_story(buffer: StoryBuffer) -> StoryAggregation:
         )
     
     # Compute motion vectors
-    motion_vectors = _compute_motion_vectors(timeline)
+    motion_vectors = _compute_motion_vectors(buffer, timeline)
     
     # Detect inflection points
-    inflection_points = detect_inflection_points(timeline)
+    inflection_points = _detect_inflection_points(buffer, timeline)
     
     # Track arc progression
     arc_progression = detect_arc_progression(buffer)
     
     # Compute drift trajectory
-    drift_trajectory = _compute_drift_trajectory(timeline)
+    drift_trajectory = _compute_drift_trajectory(buffer)
     
     # Compute narrative oscillation
     oscillation = _compute_narrative_oscillation(motion_vectors)
@@ -193,6 +199,26 @@ def compute_narrative_motion(prev: StoryEvent, curr: StoryEvent) -> MotionVector
         drift_velocity = (curr_drift - prev_drift) / time_delta if time_delta > 0 else 0.0
     
     # Meta-score deltas
+    meta_deltas = _compute_meta_deltas(prev, curr)
+    
+    # Polarity deltas (v2.7)
+    polarity_deltas = _compute_polarity_deltas(prev, curr)
+    
+    return MotionVector(
+        from_event_id=prev.event_id,
+        to_event_id=curr.event_id,
+        time_delta=time_delta,
+        delta12_shift_magnitude=delta12_shift,
+        delta12_dominant_change=delta12_dominant_change,
+        delta144_transition=delta144_transition,
+        drift_velocity=drift_velocity,
+        meta_deltas=meta_deltas,
+        polarity_deltas=polarity_deltas
+    )
+
+
+def _compute_meta_deltas(prev: StoryEvent, curr: StoryEvent) -> Dict[str, float]:
+    """Average score change per meta-engine present in both events."""
     meta_deltas = {}
     if prev.meta_scores and curr.meta_scores:
         for engine in ["nietzsche", "aurelius", "campbell"]:
@@ -206,8 +232,11 @@ def compute_narrative_motion(prev: StoryEvent, curr: StoryEvent) -> MotionVector
                              for k in set(prev_scores.keys()) & set(curr_scores.keys())]
                     if deltas:
                         meta_deltas[engine] = sum(deltas) / len(deltas)
-    
-    # Polarity deltas (v2.7)
+    return meta_deltas
+
+
+def _compute_polarity_deltas(prev: StoryEvent, curr: StoryEvent) -> Dict[str, float]:
+    """Significant (> 0.1) polarity score changes (v2.7)."""
     polarity_deltas = {}
     if prev.polarity_scores and curr.polarity_scores:
         all_pols = set(prev.polarity_scores.keys()) | set(curr.polarity_scores.keys())
@@ -217,101 +246,82 @@ def compute_narrative_motion(prev: StoryEvent, curr: StoryEvent) -> MotionVector
             diff = val_curr - val_prev
             if abs(diff) > 0.1:  # Only track significant changes
                 polarity_deltas[pol_id] = diff
-    
-    return MotionVector(
-        from_event_id=prev.event_id,
-        to_event_id=curr.event_id,
-        time_delta=time_delta,
-        delta12_shift_magnitude=delta12_shift,
-        delta12_dominant_change=delta12_dominant_change,
-        delta144_transition=delta144_transition,
-        drift_velocity=drift_velocity,
-        meta_deltas=meta_deltas,
-        polarity_deltas=polarity_deltas
-    )
+    return polarity_deltas
 
 
-def detect_inflection_points(history: List[StoryEvent]) -> List[InflectionPoint]:
+def detect_inflection_points(
+    history: Union[StoryBuffer, List[StoryEvent]]
+) -> List[InflectionPoint]:
     """
     Detect inflection points in narrative history.
     
     Args:
-        history: List of StoryEvents
+        history: StoryBuffer (read through its columns) or list of StoryEvents
         
     Returns:
         List of detected InflectionPoints
     """
+    if isinstance(history, StoryBuffer):
+        return _detect_inflection_points(history, history.get_timeline())
+    return _detect_inflection_points(StoryBuffer.from_events(history), list(history))
+
+
+def _detect_inflection_points(buffer: StoryBuffer, history: List[StoryEvent]) -> List[InflectionPoint]:
+    """detect_inflection_points on a buffer and its already-built timeline."""
     if len(history) < 2:
         return []
     
     inflections = []
     
     # Detect drift peaks
-    for i in range(1, len(history) - 1):
-        prev = history[i - 1]
+    has_drift = buffer.has_drift_state()
+    drift = np.nan_to_num(buffer.drift_metrics())
+    peaks = (
+        has_drift[:-2] & has_drift[1:-1] & has_drift[2:]
+        & (drift[1:-1] > drift[:-2]) & (drift[1:-1] > drift[2:]) & (drift[1:-1] > 0.7)
+    )
+    for i in np.flatnonzero(peaks) + 1:
         curr = history[i]
-        next_event = history[i + 1]
-        
-        if not (prev.drift_state and curr.drift_state and next_event.drift_state):
-            continue
-        
-        prev_drift = prev.drift_state.get("drift_metric", 0.0)
-        curr_drift = curr.drift_state.get("drift_metric", 0.0)
-        next_drift = next_event.drift_state.get("drift_metric", 0.0)
-        
-        # Peak detection (local maximum)
-        if curr_drift > prev_drift and curr_drift > next_drift and curr_drift > 0.7:
-            inflections.append(InflectionPoint(
-                event_id=curr.event_id,
-                sequence_id=curr.sequence_id,
-                timestamp=curr.timestamp,
-                inflection_type="drift_peak",
-                magnitude=curr_drift,
-                description=f"Drift peak at {curr_drift:.2f}"
-            ))
+        curr_drift = float(drift[i])
+        inflections.append(InflectionPoint(
+            event_id=curr.event_id,
+            sequence_id=curr.sequence_id,
+            timestamp=curr.timestamp,
+            inflection_type="drift_peak",
+            magnitude=curr_drift,
+            description=f"Drift peak at {curr_drift:.2f}"
+        ))
     
     # Detect archetype regime changes
-    for i in range(1, len(history)):
-        prev = history[i - 1]
+    both, distance, dominant = _delta12_steps(buffer)
+    keys = buffer.delta12_keys
+    shifts = both & (dominant[:-1] != dominant[1:]) & (distance > 0.3)  # Significant shift
+    for i in np.flatnonzero(shifts) + 1:
         curr = history[i]
-        
-        if prev.delta12 and curr.delta12:
-            prev_dominant = max(prev.delta12.items(), key=lambda x: x[1])[0]
-            curr_dominant = max(curr.delta12.items(), key=lambda x: x[1])[0]
-            
-            if prev_dominant != curr_dominant:
-                shift_magnitude = _compute_delta12_distance(prev.delta12, curr.delta12)
-                
-                if shift_magnitude > 0.3:  # Significant shift
-                    inflections.append(InflectionPoint(
-                        event_id=curr.event_id,
-                        sequence_id=curr.sequence_id,
-                        timestamp=curr.timestamp,
-                        inflection_type="archetype_shift",
-                        magnitude=shift_magnitude,
-                        description=f"Archetype shift: {prev_dominant} → {curr_dominant}"
-                    ))
+        shift_magnitude = float(distance[i - 1])
+        inflections.append(InflectionPoint(
+            event_id=curr.event_id,
+            sequence_id=curr.sequence_id,
+            timestamp=curr.timestamp,
+            inflection_type="archetype_shift",
+            magnitude=shift_magnitude,
+            description=f"Archetype shift: {keys[dominant[i - 1]]} → {keys[dominant[i]]}"
+        ))
     
     # Detect Campbell stage transitions
-    for i in range(1, len(history)):
-        prev = history[i - 1]
+    stages = buffer.stage_codes()
+    names = buffer.stage_names
+    transitions = (stages[:-1] != NO_STAGE) & (stages[1:] != NO_STAGE) & (stages[:-1] != stages[1:])
+    for i in np.flatnonzero(transitions) + 1:
         curr = history[i]
-        
-        if (prev.meta_scores and curr.meta_scores and 
-            "campbell" in prev.meta_scores and "campbell" in curr.meta_scores):
-            
-            prev_stage = prev.meta_scores["campbell"].get("stage")
-            curr_stage = curr.meta_scores["campbell"].get("stage")
-            
-            if prev_stage and curr_stage and prev_stage != curr_stage:
-                inflections.append(InflectionPoint(
-                    event_id=curr.event_id,
-                    sequence_id=curr.sequence_id,
-                    timestamp=curr.timestamp,
-                    inflection_type="stage_transition",
-                    magnitude=1.0,
-                    description=f"Campbell stage: {prev_stage} → {curr_stage}"
-                ))
+        inflections.append(InflectionPoint(
+            event_id=curr.event_id,
+            sequence_id=curr.sequence_id,
+            timestamp=curr.timestamp,
+            inflection_type="stage_transition",
+            magnitude=1.0,
+            description=f"Campbell stage: {names[stages[i - 1]]} → {names[stages[i]]}"
+        ))
 
     # Detect Polarity Inversions (v2.7)
     # e.g. High Order -> High Chaos (rapid flip)
@@ -351,30 +361,22 @@ def detect_arc_progression(buffer: StoryBuffer) -> Optional[ArcProgression]:
     Returns:
         ArcProgression or None if insufficient data
     """
-    timeline = buffer.get_timeline()
-    
-    if len(timeline) == 0:
+    if len(buffer) == 0:
         return None
     
-    # Extract Campbell stages from timeline
-    stage_history = []
-    current_stage = None
-    stage_confidence = 0.0
-    
-    for event in timeline:
-        if event.meta_scores and "campbell" in event.meta_scores:
-            campbell = event.meta_scores["campbell"]
-            stage = campbell.get("stage")
-            confidence = campbell.get("confidence", 0.0)
-            
-            if stage:
-                stage_history.append((stage, event.sequence_id))
-                current_stage = stage
-                stage_confidence = confidence
-    
-    if not current_stage:
+    # Extract Campbell stages from the stage columns
+    stages = buffer.stage_codes()
+    staged = np.flatnonzero(stages != NO_STAGE)
+    if len(staged) == 0:
         return None
     
+    names = buffer.stage_names
+    sequence_ids = buffer.sequence_ids()
+    stage_history = [(names[stages[i]], int(sequence_ids[i])) for i in staged]
+    current_stage = stage_history[-1][0]
+    confidence = buffer.stage_confidences()[staged[-1]]
+    stage_confidence = 0.0 if np.isnan(confidence) else float(confidence)
+    
     # Compute arc progress (simplified: based on stage index)
     campbell_stages = [
         "ordinary_world", "call_to_adventure", "refusal_of_the_call",
@@ -398,17 +400,83 @@ def detect_arc_progression(buffer: StoryBuffer) -> Optional[ArcProgression]:
 
 # Helper functions
 
-def _compute_motion_vectors(timeline: List[StoryEvent]) -> List[MotionVector]:
-    """Compute motion vectors for all consecutive event pairs."""
-    vectors = []
+def _compute_motion_vectors(buffer: StoryBuffer, timeline: List[StoryEvent]) -> List[MotionVector]:
+    """Compute motion vectors for all consecutive event pairs (same as compute_narrative_motion)."""
+    if len(timeline) < 2:
+        return []
+    
+    time_deltas = np.diff(buffer.timestamps())
+    
+    both, distance, dominant = _delta12_steps(buffer)
+    keys = buffer.delta12_keys
+    
+    states = buffer.delta144_codes()
+    state_names = buffer.delta144_names
+    
+    has_drift = buffer.has_drift_state()
+    drift = np.nan_to_num(buffer.drift_metrics())
     
+    vectors = []
     for i in range(len(timeline) - 1):
-        vector = compute_narrative_motion(timeline[i], timeline[i + 1])
-        vectors.append(vector)
+        prev, curr = timeline[i], timeline[i + 1]
+        time_delta = float(time_deltas[i])
+        
+        delta12_shift = 0.0
+        delta12_dominant_change = None
+        if both[i]:
+            delta12_shift = float(distance[i])
+            if dominant[i] != dominant[i + 1]:
+                delta12_dominant_change = (keys[dominant[i]], keys[dominant[i + 1]])
+        
+        delta144_transition = None
+        if (states[i] != NO_STATE and states[i + 1] != NO_STATE and states[i] != states[i + 1]
+                and state_names[states[i]] and state_names[states[i + 1]]):
+            delta144_transition = (state_names[states[i]], state_names[states[i + 1]])
+        
+        drift_velocity = 0.0
+        if has_drift[i] and has_drift[i + 1] and time_delta > 0:
+            drift_velocity = float(drift[i + 1] - drift[i]) / time_delta
+        
+        vectors.append(MotionVector(
+            from_event_id=prev.event_id,
+            to_event_id=curr.event_id,
+            time_delta=time_delta,
+            delta12_shift_magnitude=delta12_shift,
+            delta12_dominant_change=delta12_dominant_change,
+            delta144_transition=delta144_transition,
+            drift_velocity=drift_velocity,
+            meta_deltas=_compute_meta_deltas(prev, curr),
+            polarity_deltas=_compute_polarity_deltas(prev, curr)
+        ))
     
     return vectors
 
 
+def _delta12_steps(buffer: StoryBuffer) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Δ12 change between consecutive events, from delta12_matrix().
+    
+    Returns:
+        (both, distance, dominant): whether both events of pair i have a
+        non-empty Δ12 (n-1,), Euclidean distance of pair i with missing
+        keys as 0 (n-1,), dominant key column per event (n,); ties go to
+        the earliest column of delta12_keys
+    """
+    matrix = buffer.delta12_matrix()
+    present = ~np.isnan(matrix)
+    nonempty = present.any(axis=1)
+    both = nonempty[:-1] & nonempty[1:]
+    
+    values = np.where(present, matrix, 0.0)
+    distance = np.sqrt(((values[1:] - values[:-1]) ** 2).sum(axis=1))
+    
+    if matrix.shape[1]:
+        dominant = np.where(present, matrix, -np.inf).argmax(axis=1)
+    else:
+        dominant = np.zeros(len(matrix), dtype=np.intp)
+    return both, distance, dominant
+
+
 def _compute_delta12_distance(delta12_a: Dict[str, float], delta12_b: Dict[str, float]) -> float:
     """Compute Euclidean distance between two Δ12 vectors."""
     all_keys = set(delta12_a.keys()) | set(delta12_b.keys())
@@ -418,14 +486,10 @@ def _compute_delta12_distance(delta12_a: Dict[str, float], delta12_b: Dict[str,
     return math.sqrt(squared_diff)
 
 
-def _compute_drift_trajectory(timeline: List[StoryEvent]) -> Optional[DriftTrajectory]:
-    """Compute drift trajectory from timeline."""
-    drift_values = []
-    
-    for event in timeline:
-        if event.drift_state:
-            drift = event.drift_state.get("drift_metric", 0.0)
-            drift_values.append(drift)
+def _compute_drift_trajectory(buffer: StoryBuffer) -> Optional[DriftTrajectory]:
+    """Compute drift trajectory from the drift columns."""
+    # Events with a drift_state; a missing drift_metric counts as 0.0
+    drift_values = np.nan_to_num(buffer.drift_metrics())[buffer.has_drift_state()].tolist()
     
     if len(drift_values) < 2:
         return None
@@ -2,16 +2,31 @@
 Story Buffer - Persistent narrative memory for KALDRA v2.6.
 
 Maintains a sliding window of recent StoryEvents to enable temporal narrative analysis.
+
+Events are stored column-wise in fixed-capacity ring arrays (timestamps,
+sequence ids, Δ12 vector, drift metric, tension features, Campbell stage
+and Δ144 state codes), so story analytics can work on NumPy slices instead
+of walking event dicts. Only the fields the columns do not hold (ids,
+text, free-form dicts) are kept per slot, pickled; get_timeline/get_recent
+rebuild detached StoryEvent views from the columns and that residual.
+
+to_bytes/from_bytes use the compact binary snapshot format of
+story_codec; decoded buffers read their columns straight from the
+snapshot bytes until the first write.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Optional
-from collections import deque
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+import json
+import numbers
+import pickle
 import time
 import uuid
 
+import numpy as np
+
 
 @dataclass
 class StoryEvent:
@@ -51,6 +66,38 @@ class StoryEvent:
     def from_dict(cls, data: Dict[str, Any]) -> StoryEvent:
         """Create from dictionary."""
         return cls(**data)
+    
+    def to_bytes(self) -> bytes:
+        """Encode as a one-event binary snapshot (see story_codec)."""
+        buffer = StoryBuffer(capacity=1)
+        buffer.append(self)
+        return buffer.to_bytes()
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> StoryEvent:
+        """Decode an event encoded by to_bytes."""
+        events = StoryBuffer.from_bytes(data).get_timeline()
+        if len(events) != 1:
+            raise ValueError(f"Expected a single-event snapshot, got {len(events)} events")
+        return events[0]
+
+
+# Tension feature columns: (meta engine, score key)
+TENSION_FEATURES: Tuple[Tuple[str, str], ...] = (
+    ("nietzsche", "will_to_power"),
+    ("nietzsche", "active_nihilism"),
+    ("aurelius", "emotional_regulation"),
+)
+
+NO_STAGE = -1
+NO_STATE = -1
+
+
+def _real(value: Any) -> Optional[float]:
+    """value as float if it is a real number (bool excluded), else None."""
+    if isinstance(value, numbers.Real) and not isinstance(value, bool):
+        return float(value)
+    return None
 
 
 class StoryBuffer:
@@ -59,6 +106,27 @@ class StoryBuffer:
     
     Maintains last N events for temporal analysis.
     Default capacity: 12 events (one full Campbell cycle).
+    
+    Columns (chronological copies via the accessor methods):
+        timestamps, sequence_ids: (n,)
+        delta12_matrix: (n, K), NaN where an event has no value for a key;
+            columns follow delta12_keys (first-seen order)
+        drift_metrics: (n,), NaN where the event has no drift_metric
+        has_drift_state: (n,), whether the event has a non-empty drift_state
+        tension_features: (n, 3) per TENSION_FEATURES, NaN where missing
+        stage_codes / stage_confidences: Campbell stage code per event
+            (index into stage_names, NO_STAGE if none)
+        delta144_codes: Δ144 state code per event (index into
+            delta144_names, NO_STATE if none)
+    
+    Missing values are NaN; a NaN stored as a real value reads back as
+    missing. Real-valued scores are stored as float; non-real Δ12 values
+    (e.g. "high") are kept with the event but count as missing in the
+    columns.
+    
+    The buffer stores a snapshot of each event: get_timeline/get_recent
+    return new StoryEvent objects on every call, so changing them (or the
+    dicts passed to add_event) does not change the buffer.
     """
     
     def __init__(self, capacity: int = 12):
@@ -69,8 +137,52 @@ class StoryBuffer:
             capacity: Maximum number of events to store (default: 12)
         """
         self.capacity = capacity
-        self._buffer: deque[StoryEvent] = deque(maxlen=capacity)
         self._sequence_counter = 0
+        self._delta12_keys: List[str] = []
+        self._delta12_index: Dict[str, int] = {}
+        self._stage_names: List[str] = []
+        self._stage_index: Dict[str, int] = {}
+        self._state_names: List[str] = []
+        self._state_index: Dict[str, int] = {}
+        self._allocate()
+    
+    def _column_specs(self) -> Dict[str, Tuple[tuple, Any, Any]]:
+        """Column attribute -> (row shape, dtype, fill value)."""
+        return {
+            "_timestamps": ((), np.float64, 0.0),
+            "_sequence_ids": ((), np.int64, 0),
+            "_delta12": ((len(self._delta12_keys),), np.float64, np.nan),
+            "_has_delta12": ((), np.bool_, False),
+            "_drift": ((), np.float64, np.nan),
+            "_has_drift": ((), np.bool_, False),
+            "_tension": ((len(TENSION_FEATURES),), np.float64, np.nan),
+            "_stage": ((), np.int32, NO_STAGE),
+            "_stage_confidence": ((), np.float64, np.nan),
+            "_state": ((), np.int32, NO_STATE),
+        }
+    
+    def _allocate(self) -> None:
+        size = max(self.capacity, 1)
+        self._start = 0
+        self._size = 0
+        for name, (shape, dtype, fill) in self._column_specs().items():
+            setattr(self, name, np.full((size,) + shape, fill, dtype=dtype))
+        # Per-slot residual (the fields not held in columns): pickled for
+        # appended events, still-encoded JSON for a decoded snapshot
+        self._payload: List[Any] = [None] * size
+    
+    def _ensure_writable(self) -> None:
+        """Copy columns that are read-only views of a decoded snapshot."""
+        size = max(self.capacity, 1)
+        if self._timestamps.flags.writeable and len(self._timestamps) == size:
+            return
+        for name, (shape, dtype, fill) in self._column_specs().items():
+            column = np.full((size,) + shape, fill, dtype=dtype)
+            column[:self._size] = getattr(self, name)[self._slots()]
+            setattr(self, name, column)
+        self._payload = [self._payload[slot] for slot in self._slots()]
+        self._payload.extend([None] * (size - self._size))
+        self._start = 0
     
     def add_event(
         self,
@@ -97,9 +209,9 @@ class StoryBuffer:
             tw_state: TWState as dict
             polarity_scores: Polarity scores (v2.7)
             metadata: Optional metadata
-            
+        
         Returns:
-            Created StoryEvent
+            Created StoryEvent (not linked to the buffer; see get_timeline)
         """
         event = StoryEvent(
             event_id=str(uuid.uuid4()),
@@ -116,18 +228,178 @@ class StoryBuffer:
             metadata=metadata or {}
         )
         
-        self._buffer.append(event)
+        self.append(event)
         self._sequence_counter += 1
         
         return event
     
+    def append(self, event: StoryEvent) -> None:
+        """
+        Store an existing event (oldest is overwritten when full).
+        
+        Does not advance the sequence counter.
+        
+        Args:
+            event: Event to store
+        """
+        if self.capacity <= 0:
+            return
+        
+        self._ensure_writable()
+        if self._size < self.capacity:
+            slot = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self.capacity
+        
+        self._timestamps[slot] = event.timestamp
+        self._sequence_ids[slot] = event.sequence_id
+        
+        self._delta12[slot] = np.nan
+        self._has_delta12[slot] = event.delta12 is not None
+        delta12_residual = None
+        if event.delta12:
+            for key, value in event.delta12.items():
+                real = _real(value)
+                if real is None:
+                    # Kept with the event, missing in the Δ12 columns
+                    delta12_residual = delta12_residual or {}
+                    delta12_residual[key] = value
+                else:
+                    column = self._delta12_column(key)
+                    self._delta12[slot, column] = real
+        
+        self._drift[slot] = np.nan
+        self._has_drift[slot] = bool(event.drift_state)
+        drift_residual = None
+        if event.drift_state is not None:
+            drift_residual = dict(event.drift_state)
+            drift_metric = _real(drift_residual.get("drift_metric"))
+            if drift_metric is not None:
+                # drift_metric lives in the drift column
+                self._drift[slot] = drift_metric
+                del drift_residual["drift_metric"]
+        
+        meta_scores = event.meta_scores or {}
+        for j, (engine, key) in enumerate(TENSION_FEATURES):
+            scores = meta_scores.get(engine)
+            value = _real(scores.get(key)) if isinstance(scores, dict) else None
+            self._tension[slot, j] = np.nan if value is None else value
+        
+        campbell = meta_scores.get("campbell")
+        self._stage[slot] = NO_STAGE
+        self._stage_confidence[slot] = np.nan
+        if isinstance(campbell, dict) and campbell.get("stage"):
+            self._stage[slot] = self._stage_code(campbell["stage"])
+            confidence = _real(campbell.get("confidence"))
+            if confidence is not None:
+                self._stage_confidence[slot] = confidence
+        
+        self._state[slot] = NO_STATE
+        if event.delta144_state is not None:
+            self._state[slot] = self._state_code(event.delta144_state)
+        
+        self._payload[slot] = pickle.dumps([
+            event.event_id,
+            event.text,
+            event.kindra,
+            event.meta_scores,
+            drift_residual,
+            event.tw_state,
+            event.polarity_scores,
+            event.metadata,
+            delta12_residual,
+        ], protocol=pickle.HIGHEST_PROTOCOL)
+    
+    def _delta12_column(self, key: str) -> int:
+        column = self._delta12_index.get(key)
+        if column is None:
+            column = len(self._delta12_keys)
+            self._delta12_keys.append(key)
+            self._delta12_index[key] = column
+            grown = np.full((self._delta12.shape[0], column + 1), np.nan)
+            grown[:, :column] = self._delta12
+            self._delta12 = grown
+        return column
+    
+    def _stage_code(self, stage: str) -> int:
+        code = self._stage_index.get(stage)
+        if code is None:
+            code = len(self._stage_names)
+            self._stage_names.append(stage)
+            self._stage_index[stage] = code
+        return code
+    
+    def _state_code(self, state: str) -> int:
+        code = self._state_index.get(state)
+        if code is None:
+            code = len(self._state_names)
+            self._state_names.append(state)
+            self._state_index[state] = code
+        return code
+    
+    def _slots(self) -> np.ndarray:
+        """Ring slots in chronological order."""
+        return (self._start + np.arange(self._size)) % max(self.capacity, 1)
+    
+    def _residual_at(self, slot: int) -> List[Any]:
+        """Decoded per-slot residual (a new object on every call)."""
+        payload = self._payload[slot]
+        if isinstance(payload, bytes):
+            return pickle.loads(payload)
+        return json.loads(bytes(payload))
+    
+    def _events_at(self, slots: np.ndarray) -> List[StoryEvent]:
+        """Rebuild detached events from their columns and residuals."""
+        keys = self._delta12_keys
+        events = []
+        for slot, timestamp, sequence_id, row, has_delta12, drift, state_code in zip(
+            slots.tolist(),
+            self._timestamps[slots].tolist(),
+            self._sequence_ids[slots].tolist(),
+            self._delta12[slots].tolist(),
+            self._has_delta12[slots].tolist(),
+            self._drift[slots].tolist(),
+            self._state[slots].tolist(),
+        ):
+            (event_id, text, kindra, meta_scores, drift_residual, tw_state,
+             polarity_scores, metadata, delta12_residual) = self._residual_at(slot)
+            
+            delta12 = None
+            if has_delta12:
+                # NaN != NaN: missing keys are skipped
+                delta12 = {keys[k]: value for k, value in enumerate(row) if value == value}
+                if delta12_residual:
+                    delta12.update(delta12_residual)
+            
+            drift_state = drift_residual
+            if drift_state is not None and drift == drift:
+                drift_state = {"drift_metric": drift, **drift_state}
+            
+            events.append(StoryEvent(
+                event_id=event_id,
+                timestamp=timestamp,
+                sequence_id=sequence_id,
+                text=text,
+                delta12=delta12,
+                delta144_state=self._state_names[state_code] if state_code != NO_STATE else None,
+                kindra=kindra,
+                meta_scores=meta_scores,
+                drift_state=drift_state,
+                tw_state=tw_state,
+                polarity_scores=polarity_scores,
+                metadata=metadata
+            ))
+        return events
+    
     def get_recent(self, n: int) -> List[StoryEvent]:
         """
         Get N most recent events.
         
         Args:
             n: Number of events to retrieve
-            
+        
         Returns:
             List of recent events (newest first)
         """
@@ -135,7 +407,23 @@ class StoryBuffer:
             return []
         
         # Return last n events, reversed (newest first)
-        return list(reversed(list(self._buffer)[-n:]))
+        return self._events_at(self._slots()[::-1][:n])
+    
+    def iter_recent(self, chunk: int = 8) -> Iterator[StoryEvent]:
+        """
+        Iterate events newest first, rebuilding them chunk by chunk.
+        
+        Cheaper than get_recent/get_timeline when the caller stops early.
+        
+        Args:
+            chunk: Number of events rebuilt at a time
+        
+        Yields:
+            Events (newest first)
+        """
+        slots = self._slots()[::-1]
+        for start in range(0, len(slots), chunk):
+            yield from self._events_at(slots[start:start + chunk])
     
     def get_timeline(self) -> List[StoryEvent]:
         """
@@ -144,11 +432,59 @@ class StoryBuffer:
         Returns:
             List of all events (oldest first)
         """
-        return list(self._buffer)
+        return self._events_at(self._slots())
+    
+    # Columnar accessors (chronological copies)
+    
+    @property
+    def delta12_keys(self) -> List[str]:
+        """Column names of delta12_matrix()."""
+        return list(self._delta12_keys)
+    
+    @property
+    def stage_names(self) -> List[str]:
+        """Stage names indexed by stage code."""
+        return list(self._stage_names)
+    
+    @property
+    def delta144_names(self) -> List[str]:
+        """Δ144 state names indexed by state code."""
+        return list(self._state_names)
+    
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[self._slots()]
+    
+    def sequence_ids(self) -> np.ndarray:
+        return self._sequence_ids[self._slots()]
+    
+    def delta12_matrix(self) -> np.ndarray:
+        return self._delta12[self._slots()]
+    
+    def has_delta12(self) -> np.ndarray:
+        """Whether each event has a Δ12 dict (possibly empty)."""
+        return self._has_delta12[self._slots()]
+    
+    def drift_metrics(self) -> np.ndarray:
+        return self._drift[self._slots()]
+    
+    def has_drift_state(self) -> np.ndarray:
+        return self._has_drift[self._slots()]
+    
+    def tension_features(self) -> np.ndarray:
+        return self._tension[self._slots()]
+    
+    def stage_codes(self) -> np.ndarray:
+        return self._stage[self._slots()]
+    
+    def stage_confidences(self) -> np.ndarray:
+        return self._stage_confidence[self._slots()]
+    
+    def delta144_codes(self) -> np.ndarray:
+        return self._state[self._slots()]
     
     def clear(self):
         """Clear all events from buffer."""
-        self._buffer.clear()
+        self._allocate()
         self._sequence_counter = 0
     
     def to_dict(self) -> Dict[str, Any]:
@@ -161,7 +497,7 @@ class StoryBuffer:
         return {
             "capacity": self.capacity,
             "sequence_counter": self._sequence_counter,
-            "events": [event.to_dict() for event in self._buffer]
+            "events": [event.to_dict() for event in self.get_timeline()]
         }
     
     @classmethod
@@ -171,7 +507,7 @@ class StoryBuffer:
         
         Args:
             data: Dictionary representation
-            
+        
         Returns:
             Reconstructed StoryBuffer
         """
@@ -180,13 +516,55 @@ class StoryBuffer:
         
         for event_data in data["events"]:
             event = StoryEvent.from_dict(event_data)
-            buffer._buffer.append(event)
+            buffer.append(event)
+        
+        return buffer
+    
+    @classmethod
+    def from_events(cls, events: List[StoryEvent]) -> StoryBuffer:
+        """
+        Columnar buffer holding exactly the given events.
+        
+        Args:
+            events: Events, oldest first
         
+        Returns:
+            StoryBuffer with capacity len(events)
+        """
+        buffer = cls(capacity=len(events))
+        for event in events:
+            buffer.append(event)
         return buffer
     
+    def to_bytes(self) -> bytes:
+        """
+        Serialize buffer to the compact binary snapshot format.
+        
+        Returns:
+            Snapshot bytes (see story_codec)
+        """
+        from .story_codec import encode_buffer
+        return encode_buffer(self)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> StoryBuffer:
+        """
+        Deserialize buffer from a binary snapshot.
+        
+        Columns are zero-copy views of data until the buffer is modified.
+        
+        Args:
+            data: Snapshot bytes written by to_bytes
+        
+        Returns:
+            Reconstructed StoryBuffer
+        """
+        from .story_codec import decode_buffer
+        return decode_buffer(data, cls)
+    
     def __len__(self) -> int:
         """Get number of events in buffer."""
-        return len(self._buffer)
+        return self._size
     
     def __repr__(self) -> str:
-        return f"StoryBuffer(capacity={self.capacity}, events={len(self._buffer)})"
+        return f"StoryBuffer(capacity={self.capacity}, events={self._size})"
@@ -0,0 +1,170 @@
+"""
+Story Codec - Compact binary snapshots of StoryBuffer (and StoryEvent).
+
+Layout (little-endian; every section starts on an 8-byte boundary):
+
+    header:   magic b"KSTB" | version u2 | reserved u2 | capacity u4 |
+              sequence_counter u8 | events n u4 | Δ12 keys K u4 |
+              string table length u4
+    strings:  JSON {"delta12_keys", "stage_names", "delta144_names"}
+              (interned tables the code columns index into)
+    columns:  timestamps f8[n] | sequence_ids i8[n] | delta12 f8[n, K] |
+              has_delta12 u1[n] | drift f8[n] | has_drift u1[n] |
+              tension f8[n, 3] |
+              stage i4[n] | stage_confidence f8[n] | delta144 i4[n]
+    payload:  offsets u8[n + 1] | per-event JSON arrays (event_id, text,
+              kindra, meta_scores, drift_state residual, tw_state,
+              polarity_scores, metadata, non-real Δ12 values)
+
+Events are stored oldest first. Decoding maps the columns with
+np.frombuffer (no copy) and leaves each payload encoded until its event is
+rebuilt, so columnar analytics on a decoded snapshot never parse JSON.
+Payload values must be JSON-serializable (tuples come back as lists).
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any, Dict, List, Tuple, Type
+
+import numpy as np
+
+from .story_buffer import TENSION_FEATURES, StoryBuffer
+
+MAGIC = b"KSTB"
+FORMAT_VERSION = 3
+HEADER = struct.Struct("<4sHHIQIII")
+
+# (StoryBuffer attribute, dtype, trailing shape); K is filled in per snapshot
+_COLUMNS: Tuple[Tuple[str, str, str], ...] = (
+    ("_timestamps", "<f8", ""),
+    ("_sequence_ids", "<i8", ""),
+    ("_delta12", "<f8", "K"),
+    ("_has_delta12", "|b1", ""),
+    ("_drift", "<f8", ""),
+    ("_has_drift", "|b1", ""),
+    ("_tension", "<f8", "T"),
+    ("_stage", "<i4", ""),
+    ("_stage_confidence", "<f8", ""),
+    ("_state", "<i4", ""),
+)
+
+
+def _pad(n: int) -> int:
+    return -n % 8
+
+
+def _shape(n: int, trailing: str, K: int) -> tuple:
+    if trailing == "K":
+        return (n, K)
+    if trailing == "T":
+        return (n, len(TENSION_FEATURES))
+    return (n,)
+
+
+def _encode_payload(buffer: StoryBuffer, slot: int) -> bytes:
+    payload = buffer._payload[slot]
+    if not isinstance(payload, bytes):
+        # Still encoded (buffer decoded from a snapshot)
+        return bytes(payload)
+    return json.dumps(buffer._residual_at(slot), separators=(",", ":")).encode("utf-8")
+
+
+def encode_buffer(buffer: StoryBuffer) -> bytes:
+    """
+    Encode a buffer as a binary snapshot.
+
+    Args:
+        buffer: Buffer to encode
+
+    Returns:
+        Snapshot bytes
+    """
+    slots = buffer._slots()
+    n = len(slots)
+    K = len(buffer._delta12_keys)
+
+    strings = json.dumps({
+        "delta12_keys": buffer._delta12_keys,
+        "stage_names": buffer._stage_names,
+        "delta144_names": buffer._state_names,
+    }, separators=(",", ":")).encode("utf-8")
+
+    parts: List[bytes] = [
+        HEADER.pack(MAGIC, FORMAT_VERSION, 0, buffer.capacity,
+                    buffer._sequence_counter, n, K, len(strings)),
+        strings,
+        b"\0" * _pad(len(strings)),
+    ]
+    for name, dtype, _ in _COLUMNS:
+        data = np.ascontiguousarray(getattr(buffer, name)[slots], dtype=dtype).tobytes()
+        parts.append(data)
+        parts.append(b"\0" * _pad(len(data)))
+
+    payloads = [_encode_payload(buffer, slot) for slot in slots]
+    offsets = np.zeros(n + 1, dtype="<u8")
+    if n:
+        np.cumsum([len(p) for p in payloads], out=offsets[1:])
+    parts.append(offsets.tobytes())
+    parts.extend(payloads)
+    return b"".join(parts)
+
+
+def decode_buffer(data: bytes, cls: Type[StoryBuffer] = StoryBuffer) -> StoryBuffer:
+    """
+    Decode a binary snapshot.
+
+    Args:
+        data: Snapshot bytes (bytes, bytearray or memoryview)
+        cls: Buffer class to build
+
+    Returns:
+        Buffer whose columns are views of data (copied on first write)
+
+    Raises:
+        ValueError: If data is not a snapshot of a supported version
+    """
+    view = memoryview(data)
+    if len(view) < HEADER.size:
+        raise ValueError("Truncated story snapshot header")
+    magic, version, _, capacity, sequence_counter, n, K, strings_len = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Not a story snapshot")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported story snapshot version {version}")
+
+    offset = HEADER.size
+    strings = json.loads(bytes(view[offset:offset + strings_len]))
+    offset += strings_len + _pad(strings_len)
+
+    columns: Dict[str, np.ndarray] = {}
+    for name, dtype, trailing in _COLUMNS:
+        shape = _shape(n, trailing, K)
+        count = int(np.prod(shape))
+        column = np.frombuffer(view, dtype=dtype, count=count, offset=offset).reshape(shape)
+        # Columns are read-only until StoryBuffer._ensure_writable copies them
+        column.flags.writeable = False
+        columns[name] = column
+        offset += column.nbytes + _pad(column.nbytes)
+
+    offsets = np.frombuffer(view, dtype="<u8", count=n + 1, offset=offset)
+    base = offset + offsets.nbytes
+    if base + int(offsets[-1]) > len(view):
+        raise ValueError("Truncated story snapshot payload")
+
+    buffer = cls(capacity=capacity)
+    buffer._sequence_counter = sequence_counter
+    buffer._delta12_keys = list(strings["delta12_keys"])
+    buffer._delta12_index = {key: i for i, key in enumerate(buffer._delta12_keys)}
+    buffer._stage_names = list(strings["stage_names"])
+    buffer._stage_index = {name: i for i, name in enumerate(buffer._stage_names)}
+    buffer._state_names = list(strings["delta144_names"])
+    buffer._state_index = {name: i for i, name in enumerate(buffer._state_names)}
+    for name, column in columns.items():
+        setattr(buffer, name, column)
+    buffer._start = 0
+    buffer._size = n
+    bounds = offsets.tolist()
+    buffer._payload = [view[base + bounds[i]:base + bounds[i + 1]] for i in range(n)]
+    return buffer
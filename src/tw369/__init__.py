@@ -3,6 +3,7 @@ TW369 Module - Temporal-Wisdom 369 Engine.
 """
 
 from .drift_state import DriftState
-from .drift_memory import DriftMemory
+from .drift_log import DriftLog
+from .drift_memory import DriftMemory, DriftMemoryStore
 
-__all__ = ["DriftState", "DriftMemory"]
+__all__ = ["DriftState", "DriftLog", "DriftMemory", "DriftMemoryStore"]
@@ -7,16 +7,22 @@ Implements Models B, C, D while preserving Model A as baseline.
 from __future__ import annotations
 
 import math
-import random
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
 
+import numpy as np
 
-@dataclass
+# Column order of (N, 3) drift/gradient arrays
+DRIFT_KEYS: Tuple[str, ...] = ("plane3_to_6", "plane6_to_9", "plane9_to_3")
+
+
+@dataclass(frozen=True)
 class DriftModelConfig:
     """
     Configuration slice for advanced drift models extracted from
     schema/tw369/drift_parameters.json and TW369 config.
+
+    Immutable; derive variants with dataclasses.replace.
     """
     default_model: str = "model_a"
     nonlinear_enabled: bool = False
@@ -134,11 +140,11 @@ def model_c_multiscale_drift(
     beta = cfg.multiscale_beta
 
     if prev_state is None:
-        prev_last = {k: 0.0 for k in instantaneous_drift.keys()}
-        prev_long = {k: 0.0 for k in instantaneous_drift.keys()}
+        prev_last: Dict[str, float] = {}
+        prev_long: Dict[str, float] = {}
     else:
-        prev_last = dict(prev_state.last_drift)
-        prev_long = dict(prev_state.long_term_drift)
+        prev_last = prev_state.last_drift
+        prev_long = prev_state.long_term_drift
 
     new_short: Dict[str, float] = {}
     new_long: Dict[str, float] = {}
@@ -163,6 +169,7 @@ def model_d_stochastic_drift(
     base_drift: Dict[str, float],
     severity: float,
     cfg: DriftModelConfig,
+    rng: Optional[np.random.Generator] = None,
 ) -> Dict[str, float]:
     """
     Stochastic drift model (Model D).
@@ -170,16 +177,198 @@ def model_d_stochastic_drift(
     Adds Gaussian noise to each drift component with:
         sigma = base_sigma * (1 + severity * severity_scale)
 
-    If stochastic_seed is set, uses it once to seed the RNG for reproducibility.
+    Noise is drawn from rng. Without one, a new Generator seeded with
+    stochastic_seed is used, so seeded calls are reproducible; the global
+    random state is never touched.
     """
-    if cfg.stochastic_seed is not None:
-        random.seed(cfg.stochastic_seed)
+    if rng is None:
+        rng = np.random.default_rng(cfg.stochastic_seed)
+
+    sigma = _stochastic_sigma(severity, cfg)
+    noise = rng.standard_normal(len(base_drift)) * sigma
+    return {key: val + float(n) for (key, val), n in zip(base_drift.items(), noise)}
+
 
+def _stochastic_sigma(severity: float, cfg: DriftModelConfig) -> float:
     sev_clamped = max(0.0, min(1.0, severity))
-    sigma = cfg.stochastic_base_sigma * (1.0 + sev_clamped * cfg.stochastic_severity_scale)
+    return cfg.stochastic_base_sigma * (1.0 + sev_clamped * cfg.stochastic_severity_scale)
+
+
+@dataclass
+class DriftEnsemble:
+    """
+    Summary of a Model D Monte Carlo ensemble.
+
+    mean: per-component sample mean { 'plane3_to_6': ..., ... }
+    quantiles: { q: { 'plane3_to_6': ..., ... } } for each requested q
+    exceedance: per-component P(|drift| > tolerance)
+    exceedance_any: P(any component has |drift| > tolerance)
+    tolerance: drift tolerance used for the exceedance probabilities
+    n_samples: ensemble size
+    """
+    mean: Dict[str, float]
+    quantiles: Dict[float, Dict[str, float]]
+    exceedance: Dict[str, float]
+    exceedance_any: float
+    tolerance: float
+    n_samples: int
+
+
+def model_d_stochastic_ensemble(
+    base_drift: Dict[str, float],
+    severity: float,
+    cfg: DriftModelConfig,
+    tolerance: float,
+    n_samples: int = 1000,
+    quantiles: Sequence[float] = (0.05, 0.5, 0.95),
+    rng: Optional[np.random.Generator] = None,
+    damping: float = 1.0,
+) -> DriftEnsemble:
+    """
+    Monte Carlo ensemble of Model D.
+
+    Draws all n_samples noisy drifts in one (n_samples, n_components)
+    operation and summarizes them.
+
+    Args:
+        base_drift: Mean drift (Model A output)
+        severity: Severity factor in [0, 1]
+        cfg: Drift model configuration (sigma parameters)
+        tolerance: Drift tolerance for the exceedance probabilities
+        n_samples: Ensemble size
+        quantiles: Quantile levels in [0, 1]
+        rng: Generator to draw from (default: seeded from stochastic_seed)
+        damping: Factor applied to every sample (Tau drift_damping)
+
+    Returns:
+        DriftEnsemble
+
+    Raises:
+        ValueError: If n_samples < 1 or a quantile is outside [0, 1]
+    """
+    if n_samples < 1:
+        raise ValueError(f"n_samples must be >= 1, got {n_samples}")
+    levels = [float(q) for q in quantiles]
+    if any(q < 0.0 or q > 1.0 for q in levels):
+        raise ValueError(f"quantiles must be in [0, 1], got {levels}")
+    if rng is None:
+        rng = np.random.default_rng(cfg.stochastic_seed)
+
+    keys = list(base_drift.keys())
+    mean_drift = np.array([base_drift[k] for k in keys], dtype=float)
+    sigma = _stochastic_sigma(severity, cfg)
+
+    samples = mean_drift + rng.standard_normal((n_samples, len(keys))) * sigma
+    if damping != 1.0:
+        samples *= damping
+
+    exceeds = np.abs(samples) > tolerance
+    per_key = exceeds.mean(axis=0)
+    qvals = np.quantile(samples, levels, axis=0) if levels else np.empty((0, len(keys)))
+
+    return DriftEnsemble(
+        mean=dict(zip(keys, samples.mean(axis=0).tolist())),
+        quantiles={q: dict(zip(keys, row.tolist())) for q, row in zip(levels, qvals)},
+        exceedance=dict(zip(keys, per_key.tolist())),
+        exceedance_any=float(exceeds.any(axis=1).mean()),
+        tolerance=float(tolerance),
+        n_samples=int(n_samples),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Array variants: gradients/drift are (N, 3) in DRIFT_KEYS order,
+# severity and normalization_k are (N,).
+# ---------------------------------------------------------------------------
+
+def model_a_linear_drift_array(
+    gradients: np.ndarray,
+    severity: np.ndarray,
+    normalization_k: np.ndarray,
+) -> np.ndarray:
+    """Batch Model A: drift = (grad / k) * severity, row-wise."""
+    k = np.maximum(1.0, normalization_k)
+    return (gradients / k[:, None]) * severity[:, None]
+
+
+def nonlinear_transform_gradient_array(
+    g: np.ndarray,
+    exponent: float,
+    tanh_scale: float,
+    mode: str = "power_then_tanh",
+) -> np.ndarray:
+    """Elementwise nonlinear_transform_gradient."""
+    if mode == "power_then_tanh":
+        sign = np.where(g >= 0.0, 1.0, -1.0)
+        mag = np.abs(g) ** exponent
+        if tanh_scale <= 0.0:
+            tanh_scale = 1.0
+        return np.tanh(sign * mag / tanh_scale)
+    return g
+
+
+def model_b_nonlinear_drift_array(
+    gradients: np.ndarray,
+    severity: np.ndarray,
+    cfg: DriftModelConfig,
+    normalization_k: np.ndarray,
+) -> np.ndarray:
+    """Batch Model B: nonlinear transform, normalize by k, scale by severity."""
+    transformed = nonlinear_transform_gradient_array(
+        gradients,
+        exponent=cfg.nonlinear_exponent,
+        tanh_scale=cfg.nonlinear_tanh_scale,
+        mode=cfg.nonlinear_mode,
+    )
+    k = np.maximum(1.0, normalization_k)
+    return (transformed / k[:, None]) * severity[:, None]
+
+
+def model_c_multiscale_drift_array(
+    instantaneous_drift: np.ndarray,
+    cfg: DriftModelConfig,
+    state: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Batch Model C: advance one multiscale step for every row.
+
+    state has shape (N, 3, 2): [..., 0] is last_drift (short-term) and
+    [..., 1] is long_term_drift. It is updated in place, so the caller
+    carries it to the next call. None behaves like a fresh DriftState
+    (zeros) and nothing is carried.
 
-    noisy: Dict[str, float] = {}
-    for key, val in base_drift.items():
-        noise = random.gauss(0.0, sigma)
-        noisy[key] = val + noise
-    return noisy
+    Returns:
+        Effective (short-term) drift, shape (N, 3)
+
+    See MultiscaleDriftArray (src/tw369/multiscale_state.py) for an
+    entity-addressed state with checkpoint/restore.
+    """
+    alpha = cfg.multiscale_alpha
+    beta = cfg.multiscale_beta
+
+    if state is None:
+        state = np.zeros(instantaneous_drift.shape + (2,))
+
+    state[..., 0] = alpha * instantaneous_drift + (1.0 - alpha) * state[..., 0]
+    state[..., 1] = beta * instantaneous_drift + (1.0 - beta) * state[..., 1]
+    return state[..., 0].copy()
+
+
+def model_d_stochastic_drift_array(
+    base_drift: np.ndarray,
+    severity: np.ndarray,
+    cfg: DriftModelConfig,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Batch Model D: add Gaussian noise with a per-row sigma.
+
+    Noise is drawn from rng (default: a new Generator seeded with
+    cfg.stochastic_seed); the global random module is never touched.
+    """
+    if rng is None:
+        rng = np.random.default_rng(cfg.stochastic_seed)
+
+    sev_clamped = np.clip(severity, 0.0, 1.0)
+    sigma = cfg.stochastic_base_sigma * (1.0 + sev_clamped * cfg.stochastic_severity_scale)
+    return base_drift + rng.standard_normal(base_drift.shape) * sigma[:, None]
@@ -0,0 +1,308 @@
+"""
+KALDRA CORE — TW369 module
+Offline regime backtesting over historical instability series.
+
+Slides the TW-Painlevé oracle over stored (T, m) series per topic and
+sweeps Painlevé alpha x trigger threshold, for calibrating
+regime_calibration.json and tw_parameters.json against history.
+
+Per topic, the expensive part runs once:
+    - window covariances from chunked prefix sums of outer products
+      (one cumsum per chunk instead of one np.cov per window)
+    - lambda_max of all windows of a chunk from one stacked eigvalsh
+      (Lanczos per window for wide series, as in TWPainleveOracle)
+The grid then only re-runs the vectorized Painlevé filter once per alpha
+(pooled solvers) and compares against each threshold. Alphas are
+distributed over worker processes.
+"""
+from __future__ import annotations
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.tw369.oracle_tw_painleve import TWConfig, TWPainleveOracle
+from src.tw369.painleve.painleve_filter import painleve_filter_array
+
+
+@dataclass
+class BacktestConfig:
+    """
+    Backtest settings.
+
+    Attributes:
+        window_size: Oracle window length T (also TWConfig.window_size)
+        stride: Step between consecutive window ends
+        significance: TWConfig.alpha used for the Tracy-Widom threshold
+        painleve_alphas: Painlevé II alpha values to sweep
+        thresholds: Trigger thresholds on the filtered index to sweep
+        max_lead: Largest lead (in samples) for a trigger to count as an
+            early warning of an event
+        processes: Worker processes for the sweep (1 = in-process)
+        chunk_size: Windows per covariance/eigen batch (memory bound)
+    """
+    window_size: int = 100
+    stride: int = 1
+    significance: float = 0.99
+    painleve_alphas: Tuple[float, ...] = (0.0,)
+    thresholds: Tuple[float, ...] = (0.0,)
+    max_lead: int = 50
+    processes: int = 1
+    chunk_size: int = 256
+
+
+@dataclass
+class OracleTrace:
+    """
+    Oracle output for every window of one topic.
+
+    Attributes:
+        times: Index of the last sample of each window, shape (N,)
+        lambda_max: Filtered lambda_max (as in TWPainleveOracle.detect)
+        threshold: Tracy-Widom threshold (same for every window)
+        triggers: Oracle decision lambda_max > threshold, shape (N,)
+    """
+    times: np.ndarray
+    lambda_max: np.ndarray
+    threshold: float
+    triggers: np.ndarray
+
+    @property
+    def excess(self) -> np.ndarray:
+        """Relative exceedance lambda_max / threshold - 1 (> 0 when the oracle fires)."""
+        return self.lambda_max / self.threshold - 1.0
+
+
+@dataclass
+class BacktestResult:
+    """Metrics of one (painleve_alpha, threshold) configuration over all topics."""
+    painleve_alpha: float
+    threshold: float
+    trigger_rate: float
+    hit_rate: Optional[float]
+    mean_lead_time: Optional[float]
+    runtime_s: float
+    per_topic: Dict[str, Dict[str, Optional[float]]] = field(default_factory=dict)
+
+
+@dataclass
+class BacktestReport:
+    """Sweep results plus the shared oracle cost."""
+    results: List[BacktestResult]
+    oracle_runtime_s: float
+    num_windows: Dict[str, int]
+
+    def best(self, metric: str = "mean_lead_time") -> Optional[BacktestResult]:
+        """Configuration with the highest value of metric (None values skipped)."""
+        scored = [r for r in self.results if getattr(r, metric) is not None]
+        return max(scored, key=lambda r: getattr(r, metric)) if scored else None
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def load_series(path: Path) -> Dict[str, np.ndarray]:
+    """
+    Load stored series: a .npz with one (T, m) array per topic, or a
+    single .npy (topic name = file stem).
+    """
+    path = Path(path)
+    if path.suffix == ".npz":
+        with np.load(path, allow_pickle=False) as data:
+            return {name: np.asarray(data[name], dtype=float) for name in data.files}
+    return {path.stem: np.asarray(np.load(path, allow_pickle=False), dtype=float)}
+
+
+def _window_lambda_max(
+    series: np.ndarray,
+    ends: np.ndarray,
+    window_size: int,
+    chunk_size: int,
+) -> np.ndarray:
+    """
+    Unfiltered lambda_max of cov(series[e - W:e]) for each window end e,
+    via prefix sums of outer products within each chunk.
+    """
+    W = window_size
+    # Covariance is shift invariant; centering improves prefix-sum precision
+    x = series - series.mean(axis=0)
+    out = np.empty(len(ends))
+
+    for c0 in range(0, len(ends), max(1, chunk_size)):
+        chunk = ends[c0:c0 + chunk_size]
+        lo, hi = int(chunk[0]) - W, int(chunk[-1])
+        seg = x[lo:hi]
+
+        s1 = np.zeros((len(seg) + 1, seg.shape[1]))
+        np.cumsum(seg, axis=0, out=s1[1:])
+        s2 = np.zeros((len(seg) + 1, seg.shape[1], seg.shape[1]))
+        np.cumsum(seg[:, :, None] * seg[:, None, :], axis=0, out=s2[1:])
+
+        e = chunk - lo
+        s = e - W
+        sum_x = s1[e] - s1[s]
+        sum_xx = s2[e] - s2[s]
+        cov = (sum_xx - sum_x[:, :, None] * sum_x[:, None, :] / W) / (W - 1)
+        out[c0:c0 + len(chunk)] = np.linalg.eigvalsh(cov)[:, -1]
+
+    return out
+
+
+def run_oracle(series: np.ndarray, config: BacktestConfig) -> OracleTrace:
+    """
+    Slide TWPainleveOracle over a (T, m) series.
+
+    Produces the same lambda_max and trigger as calling detect() on every
+    window series[e - window_size:e], e = window_size, window_size + stride, ...
+
+    Args:
+        series: Series of shape (T, m)
+        config: Backtest settings
+
+    Returns:
+        OracleTrace
+    """
+    series = np.asarray(series, dtype=float)
+    T, m = series.shape
+    W = config.window_size
+    oracle = TWPainleveOracle(TWConfig(window_size=W, alpha=config.significance))
+
+    ends = np.arange(W, T + 1, max(1, config.stride))
+    _, threshold = oracle.tracy_widom_threshold(m, config.significance)
+    if len(ends) == 0 or W < oracle.config.min_samples:
+        # No window, or windows too short to be trusted (detect never fires)
+        return OracleTrace(ends - 1, np.zeros(len(ends)), float(threshold), np.zeros(len(ends), dtype=bool))
+
+    if oracle.uses_lanczos(m):
+        lambda_max = np.array([oracle.top_eigenvalues(series[e - W:e])[-1] for e in ends])
+    else:
+        lambda_max = _window_lambda_max(series, ends, W, config.chunk_size)
+
+    # TWPainleveOracle.painleve_filter: 2% damping of the extreme tail
+    lambda_max = np.where(lambda_max > 2.0, lambda_max * 0.98, lambda_max)
+
+    return OracleTrace(
+        times=ends - 1,
+        lambda_max=lambda_max,
+        threshold=float(threshold),
+        triggers=lambda_max > threshold,
+    )
+
+
+def _lead_times(
+    times: np.ndarray,
+    triggers: np.ndarray,
+    events: Sequence[int],
+    max_lead: int,
+) -> List[Optional[int]]:
+    """Per event: samples between the first trigger in [event - max_lead, event] and the event."""
+    fired = times[triggers]
+    leads: List[Optional[int]] = []
+    for event in events:
+        i = np.searchsorted(fired, event - max_lead, side="left")
+        if i < len(fired) and fired[i] <= event:
+            leads.append(int(event - fired[i]))
+        else:
+            leads.append(None)
+    return leads
+
+
+def _sweep_alpha(
+    alpha: float,
+    thresholds: Sequence[float],
+    traces: Mapping[str, Tuple[np.ndarray, np.ndarray]],
+    events: Mapping[str, Sequence[int]],
+    max_lead: int,
+) -> List[BacktestResult]:
+    """Evaluate every threshold for one Painlevé alpha (runs in a worker)."""
+    start = time.perf_counter()
+    filtered = {
+        topic: painleve_filter_array(excess, alpha)
+        for topic, (_, excess) in traces.items()
+    }
+    filter_time = time.perf_counter() - start
+
+    results = []
+    for thr in thresholds:
+        t0 = time.perf_counter()
+        per_topic: Dict[str, Dict[str, Optional[float]]] = {}
+        n_windows = n_fired = 0
+        leads: List[int] = []
+        n_events = 0
+
+        for topic, (times, _) in traces.items():
+            triggers = filtered[topic] > thr
+            n_windows += len(triggers)
+            n_fired += int(triggers.sum())
+
+            topic_leads = _lead_times(times, triggers, events.get(topic, ()), max_lead)
+            hits = [lead for lead in topic_leads if lead is not None]
+            leads.extend(hits)
+            n_events += len(topic_leads)
+            per_topic[topic] = {
+                "trigger_rate": float(triggers.mean()) if len(triggers) else 0.0,
+                "hit_rate": len(hits) / len(topic_leads) if topic_leads else None,
+                "mean_lead_time": float(np.mean(hits)) if hits else None,
+            }
+
+        results.append(BacktestResult(
+            painleve_alpha=float(alpha),
+            threshold=float(thr),
+            trigger_rate=n_fired / n_windows if n_windows else 0.0,
+            hit_rate=len(leads) / n_events if n_events else None,
+            mean_lead_time=float(np.mean(leads)) if leads else None,
+            runtime_s=filter_time / max(len(thresholds), 1) + (time.perf_counter() - t0),
+            per_topic=per_topic,
+        ))
+    return results
+
+
+def run_backtest(
+    series: Mapping[str, np.ndarray],
+    events: Optional[Mapping[str, Sequence[int]]] = None,
+    config: Optional[BacktestConfig] = None,
+) -> BacktestReport:
+    """
+    Backtest every (painleve_alpha, threshold) configuration.
+
+    A window triggers when painleve_filter(lambda_max / tw_threshold - 1,
+    alpha) exceeds the threshold. Lead time is measured in samples from
+    the first trigger within max_lead before an event to the event.
+
+    Args:
+        series: Topic -> (T, m) instability series
+        events: Topic -> sample indices of known regime shifts (optional)
+        config: Backtest settings
+
+    Returns:
+        BacktestReport with one result per configuration, alpha-major
+    """
+    config = config or BacktestConfig()
+    events = {topic: sorted(int(e) for e in evts) for topic, evts in (events or {}).items()}
+
+    start = time.perf_counter()
+    traces = {}
+    num_windows = {}
+    for topic, data in series.items():
+        trace = run_oracle(data, config)
+        traces[topic] = (trace.times, trace.excess)
+        num_windows[topic] = len(trace.times)
+    oracle_runtime = time.perf_counter() - start
+
+    alphas = list(config.painleve_alphas)
+    args = (list(config.thresholds), traces, events, config.max_lead)
+    if config.processes > 1 and len(alphas) > 1:
+        with ProcessPoolExecutor(max_workers=min(config.processes, len(alphas))) as pool:
+            grouped = list(pool.map(_sweep_alpha, alphas, *[[a] * len(alphas) for a in args]))
+    else:
+        grouped = [_sweep_alpha(alpha, *args) for alpha in alphas]
+
+    return BacktestReport(
+        results=[r for group in grouped for r in group],
+        oracle_runtime_s=oracle_runtime,
+        num_windows=num_windows,
+    )
@@ -0,0 +1,112 @@
+"""
+Calibration Store for TW369.
+
+Process-wide cache of the JSON calibration files under schema/tw369
+(regime_calibration.json, archetype_regimes.json, painleve_config.json,
+tw_parameters.json, ...). Each file is parsed once and served from memory
+afterwards, so regime-aware filtering adds no I/O per request.
+
+Call invalidate_calibration() after editing calibration files; it also
+notifies dependent caches (e.g. the Painlevé solver pool).
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_SCHEMA_DIR = Path(__file__).parent.parent.parent / "schema" / "tw369"
+
+_MISSING = object()
+
+
+class CalibrationStore:
+    """
+    Load-once cache of calibration JSON files.
+
+    Counters:
+        hits: Lookups served from memory
+        loads: Files read and parsed from disk
+    """
+
+    def __init__(self, schema_dir: Optional[Path] = None):
+        self.schema_dir = Path(schema_dir) if schema_dir is not None else DEFAULT_SCHEMA_DIR
+        self._data: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[], None]] = []
+        self.hits = 0
+        self.loads = 0
+
+    def get(self, filename: str, default: Any = None) -> Any:
+        """
+        Parsed content of a calibration file (shared, do not mutate).
+
+        Args:
+            filename: File name inside schema_dir
+            default: Value returned (and cached) if the file does not exist
+
+        Returns:
+            Parsed JSON content or default
+        """
+        value = self._data.get(filename, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            return value if value is not None else default
+
+        with self._lock:
+            value = self._data.get(filename, _MISSING)
+            if value is _MISSING:
+                path = self.schema_dir / filename
+                if path.exists():
+                    with open(path, "r") as f:
+                        value = json.load(f)
+                else:
+                    value = None
+                self._data[filename] = value
+                self.loads += 1
+            else:
+                self.hits += 1
+        return value if value is not None else default
+
+    def get_copy(self, filename: str, default: Any = None) -> Any:
+        """Deep copy of get(), safe for callers that mutate the result."""
+        return copy.deepcopy(self.get(filename, default))
+
+    def add_invalidation_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback run on every invalidate()."""
+        self._listeners.append(listener)
+
+    def invalidate(self, filename: Optional[str] = None) -> None:
+        """
+        Drop cached content (one file or all) and notify listeners.
+
+        Args:
+            filename: File to drop (all files if None)
+        """
+        with self._lock:
+            if filename is None:
+                self._data.clear()
+            else:
+                self._data.pop(filename, None)
+        for listener in list(self._listeners):
+            listener()
+
+    def stats(self) -> Dict[str, int]:
+        """Cache counters."""
+        return {"hits": self.hits, "loads": self.loads, "files": len(self._data)}
+
+
+_STORE = CalibrationStore()
+
+
+def get_calibration_store() -> CalibrationStore:
+    """Process-wide calibration store for the default schema directory."""
+    return _STORE
+
+
+def invalidate_calibration(filename: Optional[str] = None) -> None:
+    """Invalidate the process-wide calibration store (and dependent caches)."""
+    _STORE.invalidate(filename)
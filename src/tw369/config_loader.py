@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
+from .calibration_store import get_calibration_store
+
 
 @dataclass
 class PainleveConfig:
@@ -26,13 +28,14 @@ def load_painleve_config(schema_dir: Optional[Path] = None) -> PainleveConfig:
     Load Painlevé configuration from schema.
     
     Args:
-        schema_dir: Optional schema directory path
+        schema_dir: Optional schema directory path (default: cached schema)
         
     Returns:
         PainleveConfig object
     """
     if schema_dir is None:
-        schema_dir = Path(__file__).parent.parent.parent / "schema" / "tw369"
+        data = get_calibration_store().get("painleve_config.json")
+        return PainleveConfig(**data) if data is not None else PainleveConfig()
     
     config_path = schema_dir / "painleve_config.json"
     
@@ -5,7 +5,10 @@ Placeholder implementation. Subject to refinement in later iterations.
 from __future__ import annotations
 
 import numpy as np
-from typing import Dict
+from typing import Dict, Optional, Tuple
+
+# Rows of the (T, T) drift matrix computed per block
+DEFAULT_CHUNK_SIZE = 1024
 
 
 def compute_l2_drift(vec_t: np.ndarray, vec_t1: np.ndarray) -> float:
@@ -66,3 +69,161 @@ def compute_drift_metrics(
         "cosine_drift": cos,
         "temporal_drift": temporal,
     }
+
+
+# ---------------------------------------------------------------------------
+# Batched variants: a sequence is a (T, d) array of T vectors.
+# ---------------------------------------------------------------------------
+
+def compute_consecutive_drift(
+    sequence: np.ndarray,
+    delta_times: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    compute_drift_metrics for every consecutive pair of a sequence.
+
+    Args:
+        sequence: Vectors of shape (T, d)
+        delta_times: Time differences of shape (T - 1,) (default: 1.0)
+
+    Returns:
+        Dictionary of (T - 1,) arrays: l2_drift, cosine_drift, temporal_drift
+    """
+    return _consecutive_drift(np.asarray(sequence, dtype=float), delta_times)
+
+
+def compute_consecutive_drift_batch(
+    batch: np.ndarray,
+    delta_times: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    compute_consecutive_drift for B sequences of equal length.
+
+    Args:
+        batch: Vectors of shape (B, T, d)
+        delta_times: Time differences of shape (B, T - 1) or (T - 1,)
+
+    Returns:
+        Dictionary of (B, T - 1) arrays: l2_drift, cosine_drift, temporal_drift
+    """
+    batch = np.asarray(batch, dtype=float)
+    if batch.ndim != 3:
+        raise ValueError(f"batch must have shape (B, T, d), got {batch.shape}")
+    return _consecutive_drift(batch, delta_times)
+
+
+def _consecutive_drift(x: np.ndarray, delta_times: Optional[np.ndarray]) -> Dict[str, np.ndarray]:
+    if x.ndim < 2:
+        raise ValueError(f"sequence must have shape (T, d), got {x.shape}")
+    a, b = x[..., :-1, :], x[..., 1:, :]
+    norms = np.linalg.norm(x, axis=-1)
+
+    l2 = np.linalg.norm(b - a, axis=-1)
+    dots = np.einsum("...i,...i->...", a, b)
+    cos = 1.0 - dots / (norms[..., :-1] * norms[..., 1:] + 1e-8)
+
+    if delta_times is None:
+        temporal = l2 / 1.0
+    else:
+        temporal = l2 / np.maximum(np.asarray(delta_times, dtype=float), 1e-8)
+    return {
+        "l2_drift": l2,
+        "cosine_drift": cos,
+        "temporal_drift": temporal,
+    }
+
+
+def _drift_block(
+    rows: np.ndarray,
+    row_norms: np.ndarray,
+    x: np.ndarray,
+    norms: np.ndarray,
+    metric: str,
+) -> np.ndarray:
+    """Drift of a block of rows against all vectors, from precomputed norms."""
+    gram = rows @ x.T
+    if metric == "l2":
+        sq = row_norms[:, None] ** 2 + norms[None, :] ** 2 - 2.0 * gram
+        return np.sqrt(np.maximum(sq, 0.0))
+    if metric == "cosine":
+        return 1.0 - gram / (row_norms[:, None] * norms[None, :] + 1e-8)
+    raise ValueError(f"Unknown drift metric: {metric}")
+
+
+def _iter_blocks(x: np.ndarray, metric: str, chunk_size: int):
+    norms = np.linalg.norm(x, axis=1)
+    step = max(1, int(chunk_size))
+    for start in range(0, x.shape[0], step):
+        stop = min(start + step, x.shape[0])
+        block = _drift_block(x[start:stop], norms[start:stop], x, norms, metric)
+        if metric == "l2":
+            # Self-distance is exactly zero (the norm expansion leaves rounding noise)
+            idx = np.arange(start, stop)
+            block[idx - start, idx] = 0.0
+        yield start, stop, block
+
+
+def compute_drift_matrix(
+    sequence: np.ndarray,
+    metric: str = "l2",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> np.ndarray:
+    """
+    Pairwise drift between all vectors of a sequence.
+
+    Computed in row blocks of chunk_size, so the temporary memory beyond
+    the (T, T) result is chunk_size x T.
+
+    Args:
+        sequence: Vectors of shape (T, d)
+        metric: "l2" (as compute_l2_drift) or "cosine" (as compute_cosine_drift)
+        chunk_size: Rows per block
+
+    Returns:
+        Drift matrix of shape (T, T)
+    """
+    x = np.asarray(sequence, dtype=float)
+    out = np.empty((x.shape[0], x.shape[0]))
+    for start, stop, block in _iter_blocks(x, metric, chunk_size):
+        out[start:stop] = block
+    return out
+
+
+def compute_topk_drift(
+    sequence: np.ndarray,
+    k: int,
+    metric: str = "l2",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    k nearest (lowest-drift) other vectors for every vector of a sequence.
+
+    Never materializes the (T, T) matrix: memory is bounded by
+    chunk_size x T.
+
+    Args:
+        sequence: Vectors of shape (T, d)
+        k: Neighbors per vector (capped at T - 1)
+        metric: "l2" or "cosine"
+        chunk_size: Rows per block
+
+    Returns:
+        (indices, drifts), both of shape (T, k), sorted by increasing drift
+    """
+    x = np.asarray(sequence, dtype=float)
+    T = x.shape[0]
+    k = max(0, min(int(k), T - 1))
+    indices = np.empty((T, k), dtype=np.intp)
+    drifts = np.empty((T, k))
+    if k == 0:
+        return indices, drifts
+
+    for start, stop, block in _iter_blocks(x, metric, chunk_size):
+        rows = np.arange(stop - start)
+        block[rows, rows + start] = np.inf  # exclude self
+        part = np.argpartition(block, k - 1, axis=1)[:, :k]
+        values = np.take_along_axis(block, part, axis=1)
+        order = np.argsort(values, axis=1, kind="stable")
+        indices[start:stop] = np.take_along_axis(part, order, axis=1)
+        drifts[start:stop] = np.take_along_axis(values, order, axis=1)
+    return indices, drifts
@@ -0,0 +1,246 @@
+"""
+DriftLog - Append-only binary persistence for TW369 drift history.
+
+Stores DriftState snapshots as fixed-width little-endian records after a
+16-byte header:
+
+    header:  magic b"KDRL" | version u2 | record_size u2 | reserved (8 bytes)
+    record:  timestamp f8 | plane 3/6/9 values f8[3] | drift_metric f8 |
+             severity (painleve_coherence) f8 | regime code u4
+
+Appends are O(1) (one write at the end of the file). Reads of the last N
+records go through a read-only memory map, so they do not parse the whole
+history. A torn trailing record (e.g. after a crash mid-write) is truncated
+when the log is opened.
+
+Regime names are stored as small integer codes; the code table lives in a
+JSON sidecar (<log>.regimes.json) that only changes when a new regime
+name is seen. Code 0 is always "UNKNOWN".
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .drift_state import DriftState
+
+MAGIC = b"KDRL"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHH8x")
+
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("planes", "<f8", (3,)),
+    ("drift_metric", "<f8"),
+    ("severity", "<f8"),
+    ("regime", "<u4"),
+])
+
+UNKNOWN_REGIME = "UNKNOWN"
+_PLANES = ("3", "6", "9")
+
+
+class DriftLog:
+    """
+    Append-only binary log of DriftState records.
+
+    Only the fields listed in the module docstring are persisted;
+    history_window is not stored.
+    """
+
+    def __init__(self, path: Path, fsync: bool = False):
+        """
+        Open (or create) a log file.
+
+        Args:
+            path: Log file path
+            fsync: fsync after every append (durable, slower)
+
+        Raises:
+            ValueError: If the file is not a drift log of a supported version
+        """
+        self.path = Path(path)
+        self.fsync = fsync
+        self._regimes_path = self.path.with_name(self.path.name + ".regimes.json")
+        self._lock = threading.Lock()
+
+        self._regimes: List[str] = [UNKNOWN_REGIME]
+        if self._regimes_path.exists():
+            with open(self._regimes_path, "r") as f:
+                self._regimes = json.load(f)
+        self._regime_codes: Dict[str, int] = {name: i for i, name in enumerate(self._regimes)}
+
+        self._count = self._open_file()
+
+    def _open_file(self) -> int:
+        """Create the header or validate it, truncating a torn tail record."""
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            with open(self.path, "wb") as f:
+                f.write(HEADER.pack(MAGIC, FORMAT_VERSION, RECORD_DTYPE.itemsize))
+            return 0
+
+        with open(self.path, "r+b") as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"Truncated drift log header: {self.path}")
+            magic, version, record_size = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"Not a drift log: {self.path}")
+            if version != FORMAT_VERSION or record_size != RECORD_DTYPE.itemsize:
+                raise ValueError(
+                    f"Unsupported drift log version {version} (record size {record_size})"
+                )
+
+            size = f.seek(0, os.SEEK_END)
+            count, torn = divmod(size - HEADER.size, RECORD_DTYPE.itemsize)
+            if torn:
+                f.truncate(HEADER.size + count * RECORD_DTYPE.itemsize)
+        return count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _regime_code(self, regime: str) -> int:
+        code = self._regime_codes.get(regime)
+        if code is None:
+            code = len(self._regimes)
+            self._regimes.append(regime)
+            self._regime_codes[regime] = code
+            # Persist the table before any record references the new code
+            tmp = self._regimes_path.with_name(self._regimes_path.name + ".tmp")
+            with open(tmp, "w") as f:
+                json.dump(self._regimes, f)
+            os.replace(tmp, self._regimes_path)
+        return code
+
+    def _to_records(self, states: List[DriftState]) -> np.ndarray:
+        records = np.zeros(len(states), dtype=RECORD_DTYPE)
+        for i, state in enumerate(states):
+            records[i] = (
+                state.timestamp,
+                [state.plane_values.get(p, 0.0) for p in _PLANES],
+                state.drift_metric,
+                state.painleve_coherence,
+                self._regime_code(state.regime or UNKNOWN_REGIME),
+            )
+        return records
+
+    def append(self, state: DriftState) -> None:
+        """
+        Append one state (O(1)).
+
+        Args:
+            state: DriftState to persist
+        """
+        self.extend([state])
+
+    def extend(self, states: Iterable[DriftState]) -> None:
+        """
+        Append several states with a single write.
+
+        Args:
+            states: DriftStates to persist, oldest first
+        """
+        states = list(states)
+        if not states:
+            return
+        with self._lock:
+            data = self._to_records(states).tobytes()
+            with open(self.path, "ab") as f:
+                f.write(data)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._count += len(states)
+
+    def tail(self, n: Optional[int] = None) -> np.ndarray:
+        """
+        Last n records as a structured array (RECORD_DTYPE).
+
+        Args:
+            n: Number of records (default: all)
+
+        Returns:
+            Copy of the records, oldest first
+        """
+        count = self._count
+        if n is not None:
+            n = max(0, min(n, count))
+        else:
+            n = count
+        if n == 0:
+            return np.zeros(0, dtype=RECORD_DTYPE)
+
+        mapped = np.memmap(
+            self.path,
+            dtype=RECORD_DTYPE,
+            mode="r",
+            offset=HEADER.size,
+            shape=(count,),
+        )
+        try:
+            return np.array(mapped[count - n:])
+        finally:
+            del mapped
+
+    def read_states(self, n: Optional[int] = None) -> List[DriftState]:
+        """
+        Last n records as DriftState objects (oldest first).
+
+        Args:
+            n: Number of records (default: all)
+        """
+        return [
+            DriftState(
+                timestamp=float(rec["timestamp"]),
+                plane_values=dict(zip(_PLANES, rec["planes"].tolist())),
+                drift_metric=float(rec["drift_metric"]),
+                painleve_coherence=float(rec["severity"]),
+                regime=self._regimes[int(rec["regime"])],
+            )
+            for rec in self.tail(n)
+        ]
+
+    def regime_names(self) -> List[str]:
+        """Regime code table (index = code)."""
+        return list(self._regimes)
+
+    def compute_volatility(self, n: Optional[int] = None) -> float:
+        """
+        Std dev of drift_metric over the last n records.
+
+        Same measure as DriftMemory.compute_volatility (population std).
+
+        Args:
+            n: Number of records (default: all)
+        """
+        values = self.tail(n)["drift_metric"]
+        if len(values) < 2:
+            return 0.0
+        return float(values.std())
+
+
+def convert_json_history(json_path: Path, log_path: Path) -> int:
+    """
+    Append the history of a DriftMemory.save() JSON file to a drift log.
+
+    Args:
+        json_path: JSON file written by DriftMemory.save
+        log_path: Drift log to append to (created if missing)
+
+    Returns:
+        Number of records written
+    """
+    with open(json_path, "r") as f:
+        data = json.load(f)
+
+    states = [DriftState.from_dict(state_dict) for state_dict in data.get("history", [])]
+    DriftLog(log_path).extend(states)
+    return len(states)
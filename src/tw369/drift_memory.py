@@ -2,16 +2,22 @@
 DriftMemory - In-memory storage for TW369 drift history.
 
 Maintains a sliding window of recent DriftState snapshots
-with optional persistence to file.
+with optional persistence to file (JSON snapshots, or an append-only
+binary DriftLog for long histories). DriftMemoryStore keeps one
+DriftMemory per stream/session id for multi-tenant use.
 """
 
 from __future__ import annotations
 
 import json
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
-from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+from collections import OrderedDict, deque
 
+from .drift_log import DriftLog
 from .drift_state import DriftState
 
 
@@ -22,24 +28,43 @@ class DriftMemory:
     Provides in-memory storage with optional file persistence.
     """
     
-    def __init__(self, window_size: int = 10):
+    def __init__(self, window_size: int = 10, log: Optional[DriftLog] = None):
         """
         Initialize drift memory.
         
         Args:
             window_size: Maximum number of states to keep in memory
+            log: Optional binary log every appended state is written to
         """
         self.window_size = window_size
         self._history: deque[DriftState] = deque(maxlen=window_size)
+        self.log = log
+    
+    @classmethod
+    def from_log(cls, log: DriftLog, window_size: int = 10) -> DriftMemory:
+        """
+        Restore a memory from the last window_size records of a log.
+        
+        The log stays attached, so later appends keep persisting.
+        
+        Args:
+            log: DriftLog to recover from
+            window_size: Maximum number of states to keep in memory
+        """
+        memory = cls(window_size=window_size, log=log)
+        memory._history.extend(log.read_states(window_size))
+        return memory
     
     def append(self, state: DriftState) -> None:
         """
-        Add a new state to the history.
+        Add a new state to the history (and to the log, if attached).
         
         Args:
             state: DriftState to add
         """
         self._history.append(state)
+        if self.log is not None:
+            self.log.append(state)
     
     def get_history(self) -> List[DriftState]:
         """
@@ -111,3 +136,246 @@ class DriftMemory:
         variance = sum((x - mean) ** 2 for x in drift_values) / len(drift_values)
         
         return variance ** 0.5
+
+
+T = TypeVar("T")
+
+
+class _StreamEntry:
+    """Per-stream slot: drift history plus carried multiscale model state."""
+    
+    __slots__ = ("memory", "multiscale_state", "last_access")
+    
+    def __init__(self, window_size: int):
+        self.memory = DriftMemory(window_size=window_size)
+        self.multiscale_state: Any = None
+        self.last_access = time.monotonic()
+
+
+class DriftMemoryStore:
+    """
+    Drift memory keyed by stream or session id.
+    
+    Each stream owns a bounded DriftMemory (O(1) append) and the carried
+    state of the multiscale drift model, so concurrent users and topics do
+    not share history. Per-stream operations are guarded by striped locks;
+    the store-level lock is only held for O(1) LRU bookkeeping. A stream's
+    stripe lock is taken before the store-level lock is released, and
+    eviction skips streams whose stripe is held, so an entry cannot be
+    evicted while it is being appended to or stepped.
+    
+    Memory is bounded by max_streams x window_size states: when a new
+    stream would exceed max_streams, the least recently used idle stream
+    is evicted (never the stream being created). Streams idle for longer
+    than idle_timeout seconds can be dropped with evict_idle(). The
+    default stream is never evicted.
+    """
+    
+    DEFAULT_STREAM = "default"
+    
+    def __init__(
+        self,
+        window_size: int = 10,
+        max_streams: int = 1024,
+        idle_timeout: Optional[float] = None,
+        num_stripes: int = 16,
+    ):
+        """
+        Initialize the store.
+        
+        Args:
+            window_size: History window per stream
+            max_streams: Maximum number of live streams (memory budget)
+            idle_timeout: Seconds after which evict_idle() drops a stream
+            num_stripes: Number of per-stream lock stripes
+        """
+        self.window_size = window_size
+        self.max_streams = max(1, max_streams)
+        self.idle_timeout = idle_timeout
+        self._streams: "OrderedDict[str, _StreamEntry]" = OrderedDict()
+        self._lru_lock = threading.Lock()
+        self._stripes = [threading.Lock() for _ in range(max(1, num_stripes))]
+        self.evictions = 0
+    
+    def _stripe(self, stream_id: str) -> threading.Lock:
+        return self._stripes[hash(stream_id) % len(self._stripes)]
+    
+    def _touch(self, stream_id: str, create: bool = True) -> Optional[_StreamEntry]:
+        """
+        Look up (and optionally create) a stream, marking it most recently
+        used (LRU lock held by the caller).
+        """
+        entry = self._streams.get(stream_id)
+        if entry is None:
+            if not create:
+                return None
+            entry = _StreamEntry(self.window_size)
+            self._streams[stream_id] = entry
+            self._evict_overflow(keep=stream_id)
+        else:
+            self._streams.move_to_end(stream_id)
+        entry.last_access = time.monotonic()
+        return entry
+    
+    @contextmanager
+    def _locked(self, stream_id: str, create: bool = True) -> Iterator[Optional[_StreamEntry]]:
+        """
+        A stream's entry (None if unknown and not created), with its stripe
+        lock held for the block.
+        
+        The stripe lock is acquired before the LRU lock is released, so
+        the entry cannot be evicted between lookup and use. Stripes are
+        never waited on while holding the LRU lock: if the stripe is busy,
+        wait for it unlocked and look the stream up again.
+        """
+        stripe = self._stripe(stream_id)
+        while True:
+            with self._lru_lock:
+                entry = self._touch(stream_id, create)
+                if stripe.acquire(blocking=False):
+                    break
+            with stripe:
+                pass
+        try:
+            yield entry
+        finally:
+            stripe.release()
+    
+    def _try_drop(self, stream_id: str) -> bool:
+        """Drop a stream unless its stripe is in use (LRU lock held)."""
+        stripe = self._stripe(stream_id)
+        if not stripe.acquire(blocking=False):
+            return False
+        try:
+            del self._streams[stream_id]
+        finally:
+            stripe.release()
+        return True
+    
+    def _evict_overflow(self, keep: str) -> None:
+        """
+        Evict least recently used streams beyond max_streams (lock held).
+        
+        Skips the default stream, keep (the stream being created) and
+        streams in use; the store may stay over budget until they are idle.
+        """
+        for victim in list(self._streams):
+            if len(self._streams) <= self.max_streams:
+                break
+            if victim in (self.DEFAULT_STREAM, keep):
+                continue
+            if self._try_drop(victim):
+                self.evictions += 1
+    
+    def get(self, stream_id: str = DEFAULT_STREAM) -> DriftMemory:
+        """
+        Get (or create) the DriftMemory of a stream.
+        
+        The returned object is not locked; prefer append/get_history for
+        concurrent access.
+        """
+        with self._lru_lock:
+            return self._touch(stream_id).memory
+    
+    def append(self, stream_id: str, state: DriftState) -> None:
+        """
+        Append a state to a stream's history (O(1)).
+        
+        Args:
+            stream_id: Stream or session id
+            state: DriftState to add
+        """
+        with self._locked(stream_id) as entry:
+            entry.memory.append(state)
+    
+    def get_history(self, stream_id: str = DEFAULT_STREAM) -> List[DriftState]:
+        """
+        Get a stream's history (oldest to newest), empty if unknown.
+        """
+        with self._locked(stream_id, create=False) as entry:
+            return entry.memory.get_history() if entry is not None else []
+    
+    def update_multiscale(
+        self,
+        stream_id: str,
+        step: Callable[[Any], Tuple[T, Any]],
+    ) -> T:
+        """
+        Atomically advance a stream's multiscale model state.
+        
+        Args:
+            stream_id: Stream or session id
+            step: Function mapping the previous state (None for a new stream)
+                to (result, new_state)
+                
+        Returns:
+            The result returned by step
+        """
+        with self._locked(stream_id) as entry:
+            result, entry.multiscale_state = step(entry.multiscale_state)
+        return result
+    
+    def get_multiscale_state(self, stream_id: str) -> Any:
+        """Carried multiscale state of a stream (None if unknown)."""
+        with self._locked(stream_id, create=False) as entry:
+            return entry.multiscale_state if entry is not None else None
+    
+    def evict(self, stream_id: str) -> bool:
+        """
+        Drop a stream (waits for in-flight operations on it).
+        
+        Returns:
+            True if the stream existed
+        """
+        while True:
+            with self._lru_lock:
+                if stream_id not in self._streams:
+                    return False
+                if self._try_drop(stream_id):
+                    return True
+            with self._stripe(stream_id):
+                pass
+    
+    def evict_idle(self, idle_timeout: Optional[float] = None) -> int:
+        """
+        Drop streams not accessed within idle_timeout seconds.
+        
+        Args:
+            idle_timeout: Override of the store's idle_timeout
+            
+        Returns:
+            Number of evicted streams
+        """
+        timeout = idle_timeout if idle_timeout is not None else self.idle_timeout
+        if timeout is None:
+            return 0
+        cutoff = time.monotonic() - timeout
+        evicted = 0
+        with self._lru_lock:
+            # OrderedDict is in LRU order: stop at the first fresh stream
+            for stream_id in list(self._streams):
+                entry = self._streams[stream_id]
+                if entry.last_access >= cutoff:
+                    break
+                if stream_id == self.DEFAULT_STREAM:
+                    continue
+                if self._try_drop(stream_id):
+                    evicted += 1
+            self.evictions += evicted
+        return evicted
+    
+    def stream_ids(self) -> List[str]:
+        """Live stream ids, least recently used first."""
+        with self._lru_lock:
+            return list(self._streams)
+    
+    def clear(self) -> None:
+        """Drop all streams."""
+        with self._lru_lock:
+            self._streams.clear()
+    
+    def __len__(self) -> int:
+        return len(self._streams)
+    
+    def __contains__(self, stream_id: str) -> bool:
+        return stream_id in self._streams
@@ -0,0 +1,88 @@
+"""
+KALDRA CORE — TW369 module
+Top-eigenvalue solver for wide TW windows.
+
+Runs Lanczos iteration on the implicit sample covariance of a centered
+(T, m) window: each product C @ v is evaluated as Xc.T @ (Xc @ v) / (T - 1),
+so the (m, m) covariance matrix is never formed. This is what
+TWPainleveOracle uses when only lambda_max is needed and m is large.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+
+def lanczos_top_eigenvalues(
+    centered: np.ndarray,
+    k: int = 1,
+    max_iter: int = 200,
+    tol: float = 1e-6,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Compute the k largest eigenvalues of cov(centered) without forming it.
+
+    Uses Lanczos with full reorthogonalization. Iteration stops when the
+    residual bound of every requested Ritz value drops below
+    tol * |lambda_max|, when an invariant subspace is found (rank-deficient
+    windows, e.g. T < m), or after max_iter steps.
+
+    Args:
+        centered: Column-centered window of shape (T, m)
+        k: Number of top eigenvalues to return (default: 1)
+        max_iter: Maximum Lanczos steps (default: 200)
+        tol: Relative residual tolerance (default: 1e-6). The eigenvalue
+            error is bounded by the residual and is usually far smaller
+        seed: Seed for the starting vector, for reproducible results
+
+    Returns:
+        Up to k largest eigenvalues in ascending order (same convention as
+        np.linalg.eigvalsh)
+    """
+    centered = np.asarray(centered, dtype=float)
+    T, m = centered.shape
+    if m == 0:
+        return np.zeros(0)
+
+    scale = 1.0 / max(T - 1, 1)
+    k = max(1, min(k, m))
+    n_iter = max(k, min(max_iter, m))
+
+    rng = np.random.default_rng(seed)
+    basis = np.empty((n_iter, m))
+    q = rng.standard_normal(m)
+    basis[0] = q / np.linalg.norm(q)
+
+    alphas = np.empty(n_iter)
+    betas = np.empty(n_iter)
+    theta = np.zeros(1)
+
+    for j in range(n_iter):
+        w = centered.T @ (centered @ basis[j]) * scale
+        alphas[j] = float(np.dot(w, basis[j]))
+
+        # Full reorthogonalization (twice is enough in floating point)
+        active = basis[: j + 1]
+        w -= active.T @ (active @ w)
+        w -= active.T @ (active @ w)
+        beta = float(np.linalg.norm(w))
+        betas[j] = beta
+
+        tri = np.diag(alphas[: j + 1])
+        if j > 0:
+            off = betas[:j]
+            tri += np.diag(off, 1) + np.diag(off, -1)
+        theta, vecs = np.linalg.eigh(tri)
+
+        top = min(k, j + 1)
+        ref = max(abs(theta[-1]), np.finfo(float).tiny)
+        residuals = beta * np.abs(vecs[-1, -top:])
+        converged = top == k and bool(np.all(residuals <= tol * ref))
+        invariant = beta <= tol * ref
+
+        if converged or invariant or j + 1 == n_iter:
+            break
+
+        basis[j + 1] = w / beta
+
+    return np.array(theta[-k:], dtype=float)
@@ -0,0 +1,207 @@
+"""
+Array-native multiscale drift state (Model C) for many entities.
+
+Holds the carried Model C state of N entities as one (N, 3, 2) float array:
+axis 1 follows DRIFT_KEYS (plane3_to_6, plane6_to_9, plane9_to_3) and
+axis 2 is (short-term last_drift, long-term long_term_drift). A step
+advances both EWMAs of every entity in a single vectorized expression, and
+the whole array can be checkpointed to / restored from an .npz file.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from src.tw369.advanced_drift_models import DRIFT_KEYS, DriftModelConfig, DriftState
+
+_SHORT, _LONG = 0, 1
+
+
+class MultiscaleDriftArray:
+    """
+    Model C state for N entities, shape (N, 3, 2).
+
+    Entities are addressed by row; optional entity ids map to rows and new
+    ids get fresh (zero) rows on first use, matching a DriftState of None.
+    """
+
+    def __init__(
+        self,
+        cfg: Optional[DriftModelConfig] = None,
+        n_entities: int = 0,
+        entity_ids: Optional[Sequence[Hashable]] = None,
+    ):
+        """
+        Args:
+            cfg: Drift model configuration (multiscale_alpha/beta)
+            n_entities: Number of rows to preallocate (ignored if entity_ids given)
+            entity_ids: Optional ids, one per row
+        """
+        cfg = cfg or DriftModelConfig()
+        # EWMA weights per scale: [..., 0] short (alpha), [..., 1] long (beta)
+        self.weights = np.array([cfg.multiscale_alpha, cfg.multiscale_beta], dtype=float)
+
+        self._ids: List[Hashable] = list(entity_ids) if entity_ids is not None else []
+        self._rows: Dict[Hashable, int] = {eid: i for i, eid in enumerate(self._ids)}
+        if len(self._rows) != len(self._ids):
+            raise ValueError("entity_ids must be unique")
+
+        n = len(self._ids) if entity_ids is not None else n_entities
+        self._state = np.zeros((max(n, 1), len(DRIFT_KEYS), 2))
+        self._size = n
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def state(self) -> np.ndarray:
+        """Live (N, 3, 2) view of the state (writes go through)."""
+        return self._state[: self._size]
+
+    @property
+    def entity_ids(self) -> List[Hashable]:
+        """Entity ids in row order (empty if rows are addressed directly)."""
+        return list(self._ids)
+
+    def _grow(self, size: int) -> None:
+        if size > self._state.shape[0]:
+            capacity = max(size, 2 * self._state.shape[0])
+            grown = np.zeros((capacity,) + self._state.shape[1:])
+            grown[: self._size] = self._state[: self._size]
+            self._state = grown
+        self._size = max(self._size, size)
+
+    def rows_for(self, entity_ids: Iterable[Hashable]) -> np.ndarray:
+        """
+        Row indices for entity ids, allocating zero rows for new ids.
+
+        Args:
+            entity_ids: Entity ids
+
+        Returns:
+            Integer array of row indices
+        """
+        rows = []
+        for eid in entity_ids:
+            row = self._rows.get(eid)
+            if row is None:
+                row = len(self._ids)
+                self._ids.append(eid)
+                self._rows[eid] = row
+            rows.append(row)
+        self._grow(len(self._ids))
+        return np.asarray(rows, dtype=np.intp)
+
+    def update(
+        self,
+        instantaneous_drift: np.ndarray,
+        rows: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Advance one multiscale step (same math as model_c_multiscale_drift).
+
+        Args:
+            instantaneous_drift: Drift of shape (M, 3) in DRIFT_KEYS order
+            rows: Rows to advance, shape (M,) and without duplicates
+                (default: all N rows, M == N)
+
+        Returns:
+            Effective (short-term) drift, shape (M, 3)
+        """
+        inst = np.asarray(instantaneous_drift, dtype=float)
+        w = self.weights
+
+        if rows is None:
+            if inst.shape[0] != self._size:
+                raise ValueError(
+                    f"Expected drift for {self._size} entities, got {inst.shape[0]}"
+                )
+            state = self._state[: self._size]
+            state *= 1.0 - w
+            state += w * inst[..., None]
+            return state[..., _SHORT].copy()
+
+        rows = np.asarray(rows, dtype=np.intp)
+        if rows.size and rows.max() >= self._size:
+            self._grow(int(rows.max()) + 1)
+        updated = w * inst[..., None] + (1.0 - w) * self._state[rows]
+        self._state[rows] = updated
+        return updated[..., _SHORT]
+
+    def update_entities(
+        self,
+        entity_ids: Sequence[Hashable],
+        instantaneous_drift: np.ndarray,
+    ) -> np.ndarray:
+        """update() addressed by entity id."""
+        return self.update(instantaneous_drift, self.rows_for(entity_ids))
+
+    def to_drift_state(self, row: int) -> DriftState:
+        """Model C DriftState of one row (for the scalar/dict path)."""
+        values = self._state[row]
+        return DriftState(
+            last_drift=dict(zip(DRIFT_KEYS, values[:, _SHORT].tolist())),
+            long_term_drift=dict(zip(DRIFT_KEYS, values[:, _LONG].tolist())),
+        )
+
+    def set_drift_state(self, row: int, drift_state: Optional[DriftState]) -> None:
+        """Load a Model C DriftState into one row (None resets it)."""
+        self._grow(row + 1)
+        if drift_state is None:
+            self._state[row] = 0.0
+            return
+        for i, key in enumerate(DRIFT_KEYS):
+            self._state[row, i, _SHORT] = drift_state.last_drift.get(key, 0.0)
+            self._state[row, i, _LONG] = drift_state.long_term_drift.get(key, 0.0)
+
+    def checkpoint(self, path: Path) -> None:
+        """
+        Write the whole state to an .npz file.
+
+        The file is written to a temporary sibling and renamed, so an
+        interrupted checkpoint never replaces a good one.
+
+        Args:
+            path: Destination file
+        """
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                state=self.state,
+                weights=self.weights,
+                entity_ids=np.asarray([str(eid) for eid in self._ids], dtype=str),
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def restore(cls, path: Path) -> "MultiscaleDriftArray":
+        """
+        Load a state written by checkpoint().
+
+        Entity ids are restored as strings.
+
+        Args:
+            path: Checkpoint file
+
+        Returns:
+            MultiscaleDriftArray with the saved weights, ids and state
+        """
+        with np.load(Path(path), allow_pickle=False) as data:
+            state = data["state"]
+            weights = data["weights"]
+            ids = data["entity_ids"].tolist()
+
+        restored = cls(
+            DriftModelConfig(multiscale_alpha=float(weights[0]), multiscale_beta=float(weights[1])),
+            n_entities=state.shape[0],
+            entity_ids=ids if ids else None,
+        )
+        restored._grow(state.shape[0])
+        restored._state[: state.shape[0]] = state
+        return restored
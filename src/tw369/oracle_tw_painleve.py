@@ -11,12 +11,20 @@ from dataclasses import dataclass
 import numpy as np
 from typing import Tuple, Optional
 
+from src.tw369.lanczos import lanczos_top_eigenvalues
+
 @dataclass
 class TWConfig:
     """Configuração para o Oracle TW-Painlevé."""
     window_size: int = 100
     alpha: float = 0.99  # Nível de significância (99%)
     min_samples: int = 30
+    # Solver de autovalores: "exact" (eigvalsh), "lanczos" (top-k) ou "auto"
+    eigen_solver: str = "auto"
+    lanczos_min_dim: int = 256  # m a partir do qual "auto" usa Lanczos
+    lanczos_top_k: int = 1
+    lanczos_max_iter: int = 200
+    lanczos_tol: float = 1e-6
 
 @dataclass
 class TWStats:
@@ -47,6 +55,32 @@ class TWPainleveOracle:
         cov = np.cov(centered, rowvar=False)
         return cov
 
+    def uses_lanczos(self, m: int) -> bool:
+        """
+        Indica se a janela de dimensão m usa o solver top-k (Lanczos).
+        No modo "auto", Lanczos é escolhido quando m >= lanczos_min_dim.
+        """
+        solver = self.config.eigen_solver
+        if solver == "lanczos":
+            return True
+        if solver == "auto":
+            return m >= self.config.lanczos_min_dim
+        return False
+
+    def top_eigenvalues(self, window: np.ndarray) -> np.ndarray:
+        """
+        Calcula apenas os lanczos_top_k maiores autovalores da covariância
+        da janela (T, m), sem formar a matriz (m, m).
+        Retorna autovalores em ordem crescente.
+        """
+        centered = window - np.mean(window, axis=0)
+        return lanczos_top_eigenvalues(
+            centered,
+            k=self.config.lanczos_top_k,
+            max_iter=self.config.lanczos_max_iter,
+            tol=self.config.lanczos_tol,
+        )
+
     def tracy_widom_threshold(self, m: int, alpha: float) -> Tuple[float, float]:
         """
         Retorna (mu_m, sigma_m) aproximados e calcula o threshold crítico.
@@ -129,11 +163,15 @@ class TWPainleveOracle:
             # Janela muito pequena, não confiável
             return False, TWStats(0.0, 0.0, m)
 
-        # 1. Covariância
-        cov = self.compute_covariance(window)
-        
-        # 2. Autovalores (apenas parte real, assumindo simetria/hermitiana)
-        eigenvalues = np.linalg.eigvalsh(cov)
+        if self.uses_lanczos(m):
+            # 1-2. Janelas largas: apenas o topo do espectro, covariância implícita
+            eigenvalues = self.top_eigenvalues(window)
+        else:
+            # 1. Covariância
+            cov = self.compute_covariance(window)
+
+            # 2. Autovalores (apenas parte real, assumindo simetria/hermitiana)
+            eigenvalues = np.linalg.eigvalsh(cov)
         # Aplica filtro (placeholder)
         eigenvalues = self.painleve_filter(eigenvalues)
         
@@ -149,13 +187,13 @@ class TWPainleveOracle:
         # Ajuste de escala: se a janela não for normalizada (var=1), o threshold MP
         # precisa escalar com a variância média dos dados.
         # Estimativa robusta de sigma^2 local: mediana dos autovalores ou traço/m
-        sigma_sq_est = np.mean(np.diag(cov)) # traço/m = variância média
+        sigma_sq_est = np.mean(np.var(window, axis=0, ddof=1)) # traço/m = variância média
         threshold_scaled = threshold * sigma_sq_est
 
         stats = TWStats(
             lambda_max=float(lambda_max),
             threshold=float(threshold),
-            num_eigenvalues=len(eigenvalues),
+            num_eigenvalues=m,
         )
         
         return bool(lambda_max > threshold), stats
@@ -10,21 +10,29 @@ We implement an adaptive RK45 solver with:
 """
 
 from __future__ import annotations
-from typing import Callable, List, Tuple, Optional
+from dataclasses import astuple
+from typing import Callable, Dict, List, Tuple, Optional
 from pathlib import Path
 import sys
+import threading
+
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from tw369.config_loader import load_painleve_config
-from tw369.regime_utils import get_painleve_alpha_for_archetype
+from src.tw369.calibration_store import get_calibration_store
+from src.tw369.config_loader import PainleveConfig, load_painleve_config
+from src.tw369.regime_utils import get_painleve_alpha_for_archetype
 
 
 def build_default_solver(archetype_id: Optional[str] = None) -> "PainleveIISolver":
     """
     Build Painlevé II solver with schema-driven configuration.
     
+    Solvers are shared through the process-wide PainleveSolverPool, so
+    repeated calls for the same regime return the same instance.
+    
     Args:
         archetype_id: Optional archetype ID for regime-specific calibration
         
@@ -38,7 +46,71 @@ def build_default_solver(archetype_id: Optional[str] = None) -> "PainleveIISolve
     if archetype_id:
         alpha = get_painleve_alpha_for_archetype(archetype_id)
     
-    return PainleveIISolver(alpha=alpha)
+    return get_solver_pool().get(alpha, config)
+
+
+class PainleveSolverPool:
+    """
+    Pool of pre-built PainleveIISolver instances keyed by (alpha, config).
+    
+    Solvers hold no per-solve state, so one instance can be shared across
+    requests and threads.
+    
+    Counters:
+        hits: Requests served by an existing solver
+        builds: Solvers constructed
+    """
+    
+    def __init__(self):
+        self._solvers: Dict[Tuple[float, Tuple], "PainleveIISolver"] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.builds = 0
+    
+    def get(self, alpha: float, config: Optional[PainleveConfig] = None) -> "PainleveIISolver":
+        """
+        Get the shared solver for alpha under config.
+        
+        Args:
+            alpha: Painlevé II alpha parameter
+            config: Solver configuration (part of the pool key)
+            
+        Returns:
+            PainleveIISolver
+        """
+        key = (float(alpha), astuple(config) if config is not None else ())
+        solver = self._solvers.get(key)
+        if solver is not None:
+            self.hits += 1
+            return solver
+        
+        with self._lock:
+            solver = self._solvers.get(key)
+            if solver is None:
+                solver = PainleveIISolver(alpha=float(alpha))
+                self._solvers[key] = solver
+                self.builds += 1
+            else:
+                self.hits += 1
+        return solver
+    
+    def clear(self) -> None:
+        """Drop all pooled solvers."""
+        with self._lock:
+            self._solvers.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """Pool counters."""
+        return {"hits": self.hits, "builds": self.builds, "size": len(self._solvers)}
+
+
+_SOLVER_POOL = PainleveSolverPool()
+get_calibration_store().add_invalidation_listener(_SOLVER_POOL.clear)
+
+
+def get_solver_pool() -> PainleveSolverPool:
+    """Process-wide Painlevé solver pool."""
+    return _SOLVER_POOL
 
 
 class PainleveIISolver:
@@ -121,3 +193,39 @@ class PainleveIISolver:
             out.append((x, u))
 
         return out
+
+    def solve_final(self,
+                    x0: float,
+                    u0: np.ndarray,
+                    v0: float,
+                    x_end: float,
+                    h: float = 0.01,
+                    max_steps: int = 5000) -> np.ndarray:
+        """
+        Final u of solve() for many initial values at once.
+
+        Integrates all u0 in lockstep (same x grid as solve). Entries that
+        blow up (|u| > 50) keep their last accepted value, as solve() stops
+        there.
+
+        Returns:
+            Array of final u values, same shape as u0
+        """
+        u = np.array(u0, dtype=float)
+        v = np.full_like(u, v0)
+        done = np.zeros(u.shape, dtype=bool)
+        x = x0
+
+        for _ in range(max_steps):
+            if x >= x_end or done.all():
+                break
+
+            x_next, u_next, v_next = self.rk45_step(x, u, v, h)
+            with np.errstate(over="ignore", invalid="ignore"):
+                blown = ~done & ~(np.abs(u_next) <= 50)
+            done |= blown
+            u = np.where(done, u, u_next)
+            v = np.where(done, v, v_next)
+            x = x_next
+
+        return u
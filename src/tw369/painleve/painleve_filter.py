@@ -3,7 +3,9 @@ Painlevé II Filter implementation for TW369.
 Applies the PainleveIISolver to smooth the instability index.
 """
 
-from src.tw369.painleve.painleve2_solver import PainleveIISolver
+import numpy as np
+
+from src.tw369.painleve.painleve2_solver import PainleveIISolver, get_solver_pool
 
 def painleve_filter(instability_index: float) -> float:
     """
@@ -21,7 +23,7 @@ def painleve_filter(instability_index: float) -> float:
     # and solve over a short interval to get the filtered response.
     # This mapping is heuristic based on the "Engine Upgrade" specs.
     
-    solver = PainleveIISolver(alpha=0.0)
+    solver = get_solver_pool().get(0.0)
     
     # Mapping strategy:
     # x0 is fixed at 0
@@ -51,3 +53,15 @@ def painleve_filter(instability_index: float) -> float:
         return -1.0
         
     return u_final
+
+
+def painleve_filter_array(instability_index: np.ndarray, alpha: float = 0.0) -> np.ndarray:
+    """
+    painleve_filter for an array of instability indices.
+
+    Uses the pooled solver for alpha and integrates all indices in one
+    vectorized pass (same domain mapping as painleve_filter).
+    """
+    solver = get_solver_pool().get(alpha)
+    u_final = solver.solve_final(0.0, instability_index, 0.0, 1.0, h=0.05)
+    return np.clip(u_final, -1.0, 1.0)
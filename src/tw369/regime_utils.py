@@ -6,6 +6,8 @@ import json
 from pathlib import Path
 from typing import Dict, Any, Optional, TYPE_CHECKING
 
+from .calibration_store import get_calibration_store
+
 if TYPE_CHECKING:
     from src.archetypes.delta12_vector import Delta12Vector
 
@@ -22,13 +24,13 @@ def load_archetype_regimes(schema_dir: Optional[Path] = None) -> Dict[str, Dict[
     Load archetype regime mappings from schema.
     
     Args:
-        schema_dir: Optional schema directory path
+        schema_dir: Optional schema directory path (default: cached schema)
         
     Returns:
         Dictionary mapping archetype_id to regime config
     """
     if schema_dir is None:
-        schema_dir = Path(__file__).parent.parent.parent / "schema" / "tw369"
+        return get_calibration_store().get_copy("archetype_regimes.json", {})
     
     regimes_path = schema_dir / "archetype_regimes.json"
     
@@ -51,11 +53,11 @@ def get_tw_regime_for_delta12(delta12: "Delta12Vector") -> Dict[str, Any]:
     Returns:
         Regime configuration dict
     """
-    regimes = load_archetype_regimes()
+    regimes = get_calibration_store().get("archetype_regimes.json", {})
     
     dominant_id, _ = delta12.dominant()
     
-    return regimes.get(dominant_id, DEFAULT_REGIME.copy())
+    return dict(regimes.get(dominant_id, DEFAULT_REGIME))
 
 
 def get_painleve_alpha_for_archetype(archetype_id: str) -> float:
@@ -68,14 +70,7 @@ def get_painleve_alpha_for_archetype(archetype_id: str) -> float:
     Returns:
         Alpha value for Painlevé solver
     """
-    schema_dir = Path(__file__).parent.parent.parent / "schema" / "tw369"
-    calibration_path = schema_dir / "regime_calibration.json"
-    
-    if not calibration_path.exists():
-        return 0.0
-    
-    with open(calibration_path, "r") as f:
-        calibration = json.load(f)
+    calibration = get_calibration_store().get("regime_calibration.json", {})
     
     regime = calibration.get(archetype_id, {})
     return float(regime.get("alpha", 0.0))
@@ -3,11 +3,16 @@ Runtime validation helpers for TW369 engine.
 
 Provides optional schema validation for TWState and config dicts.
 Falls back to basic structural validation when jsonschema is unavailable.
+
+Compiled validators are kept in a process-wide registry keyed by schema
+path and mtime: each schema is read and meta-schema-checked once, and
+reloaded only when the file changes on disk.
 """
 
 import json
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 try:
     import jsonschema  # type: ignore
@@ -18,34 +23,73 @@ except ImportError:  # pragma: no cover
 
 SCHEMA_DIR = Path("schema") / "tw369"
 
+TW_STATE_SCHEMA = "tw_state_schema.json"
+TW369_CONFIG_SCHEMA = "tw369_config_schema.json"
+
+# (resolved schema path, mtime_ns) -> compiled validator
+_VALIDATOR_CACHE: Dict[Tuple[str, int], Any] = {}
+_VALIDATOR_LOCK = threading.Lock()
+
 
 def _load_json(path: Path) -> Dict[str, Any]:
     """Load JSON file."""
     return json.loads(path.read_text())
 
 
-def validate_tw_state_dict(data: Dict[str, Any]) -> None:
+def get_validator(schema_path: Path) -> Optional[Any]:
     """
-    Runtime validation helper for TWState-like dicts.
+    Get the compiled jsonschema validator for a schema file.
 
-    - If jsonschema is available and tw_state_schema.json exists, validate against it.
-    - Otherwise, perform minimal structural checks and raise ValueError on failure.
-    
-    Args:
-        data: Dictionary to validate as TWState
-        
-    Raises:
-        ValueError: If validation fails
-        jsonschema.ValidationError: If schema validation fails (when jsonschema available)
-    """
-    schema_path = SCHEMA_DIR / "tw_state_schema.json"
+    The schema is loaded and checked against its meta-schema once per
+    (path, mtime); later calls only stat the file.
 
-    if HAS_JSONSCHEMA and schema_path.exists():
-        schema = _load_json(schema_path)
-        jsonschema.validate(data, schema)  # type: ignore[attr-defined]
-        return
+    Args:
+        schema_path: Path to the JSON schema
 
-    # Fallback: minimal structural validation (no external dependency).
+    Returns:
+        Validator instance, or None if jsonschema or the schema is unavailable
+    """
+    if not HAS_JSONSCHEMA:
+        return None
+    try:
+        stat = schema_path.stat()
+    except OSError:
+        return None
+
+    key = (str(schema_path.resolve()), stat.st_mtime_ns)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is not None:
+        return validator
+
+    with _VALIDATOR_LOCK:
+        validator = _VALIDATOR_CACHE.get(key)
+        if validator is None:
+            schema = _load_json(schema_path)
+            cls = jsonschema.validators.validator_for(schema)  # type: ignore[attr-defined]
+            cls.check_schema(schema)
+            validator = cls(schema)
+            # Drop stale entries for the same path (older mtimes)
+            for stale in [k for k in _VALIDATOR_CACHE if k[0] == key[0]]:
+                del _VALIDATOR_CACHE[stale]
+            _VALIDATOR_CACHE[key] = validator
+    return validator
+
+
+def clear_validator_cache() -> None:
+    """Drop all compiled validators (e.g. after changing SCHEMA_DIR)."""
+    with _VALIDATOR_LOCK:
+        _VALIDATOR_CACHE.clear()
+
+
+def _schema_validate(validator: Any, data: Dict[str, Any]) -> None:
+    """Validate like jsonschema.validate: raise the best-matching error."""
+    error = jsonschema.exceptions.best_match(validator.iter_errors(data))  # type: ignore[attr-defined]
+    if error is not None:
+        raise error
+
+
+def _check_tw_state_structure(data: Dict[str, Any]) -> None:
+    """Minimal structural validation for TWState dicts."""
     required_keys = {
         "plane3_cultural_macro",
         "plane6_semiotic_media",
@@ -56,28 +100,100 @@ def validate_tw_state_dict(data: Dict[str, Any]) -> None:
         raise ValueError(f"TWState missing required keys: {sorted(missing)}")
 
 
-def validate_tw369_config_dict(cfg: Dict[str, Any]) -> None:
+def _check_tw369_config_structure(cfg: Dict[str, Any]) -> None:
+    """Minimal structural validation for TW369 config dicts."""
+    for key in ("enabled", "max_time_steps", "default_step_size"):
+        if key not in cfg:
+            raise ValueError(f"TW369 config missing required key: {key}")
+
+
+_KINDS = {
+    "tw_state": (TW_STATE_SCHEMA, _check_tw_state_structure),
+    "tw369_config": (TW369_CONFIG_SCHEMA, _check_tw369_config_structure),
+}
+
+
+def _resolve_validator(kind: str, fast: bool) -> Optional[Any]:
+    if fast:
+        return None
+    return get_validator(SCHEMA_DIR / _KINDS[kind][0])
+
+
+def _validate(kind: str, data: Dict[str, Any], validator: Optional[Any]) -> None:
+    if validator is not None:
+        _schema_validate(validator, data)
+        return
+
+    # Fallback (or fast mode): minimal structural validation.
+    _KINDS[kind][1](data)
+
+
+def validate_tw_state_dict(data: Dict[str, Any], fast: bool = False) -> None:
+    """
+    Runtime validation helper for TWState-like dicts.
+
+    - If jsonschema is available and tw_state_schema.json exists, validate against it.
+    - Otherwise, perform minimal structural checks and raise ValueError on failure.
+
+    Args:
+        data: Dictionary to validate as TWState
+        fast: Only run the structural checks (for trusted internal paths)
+
+    Raises:
+        ValueError: If validation fails
+        jsonschema.ValidationError: If schema validation fails (when jsonschema available)
+    """
+    _validate("tw_state", data, _resolve_validator("tw_state", fast))
+
+
+def validate_tw369_config_dict(cfg: Dict[str, Any], fast: bool = False) -> None:
     """
     Runtime validation helper for TW369 engine config dicts.
 
     - If jsonschema is available and tw369_config_schema.json exists, validate against it.
     - Otherwise, perform minimal structural checks and raise ValueError on failure.
-    
+
     Args:
         cfg: Dictionary to validate as TW369 config
-        
+        fast: Only run the structural checks (for trusted internal paths)
+
     Raises:
         ValueError: If validation fails
         jsonschema.ValidationError: If schema validation fails (when jsonschema available)
     """
-    schema_path = SCHEMA_DIR / "tw369_config_schema.json"
+    _validate("tw369_config", cfg, _resolve_validator("tw369_config", fast))
 
-    if HAS_JSONSCHEMA and schema_path.exists():
-        schema = _load_json(schema_path)
-        jsonschema.validate(cfg, schema)  # type: ignore[attr-defined]
-        return
 
-    # Fallback: minimal structural validation.
-    for key in ("enabled", "max_time_steps", "default_step_size"):
-        if key not in cfg:
-            raise ValueError(f"TW369 config missing required key: {key}")
+def validate_many(
+    items: Iterable[Dict[str, Any]],
+    kind: str = "tw_state",
+    fast: bool = False,
+) -> List[Optional[Exception]]:
+    """
+    Validate a batch of dicts with a single compiled validator.
+
+    Args:
+        items: Dicts to validate
+        kind: "tw_state" or "tw369_config"
+        fast: Only run the structural checks (for trusted internal paths)
+
+    Returns:
+        One entry per item: None if valid, otherwise the exception the
+        single-item validator would have raised
+
+    Raises:
+        ValueError: If kind is unknown
+    """
+    if kind not in _KINDS:
+        raise ValueError(f"Unknown validation kind: {kind}")
+
+    validator = _resolve_validator(kind, fast)
+    errors: List[Optional[Exception]] = []
+    for item in items:
+        try:
+            _validate(kind, item, validator)
+        except Exception as e:
+            errors.append(e)
+        else:
+            errors.append(None)
+    return errors
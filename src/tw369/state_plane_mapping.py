@@ -8,11 +8,63 @@ the core TW369 mathematics.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Any, Literal, Optional
+from typing import Dict, Any, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
 
 
 DomainType = Literal["ALPHA", "GEO", "PRODUCT", "SAFEGUARD", "DEFAULT"]
 
+# Discrete axes of the compiled rule table
+SEVERITY_CLASSES: Tuple[str, ...] = ("low", "medium", "high", "extreme")
+TIME_HORIZONS: Tuple[str, ...] = ("short", "medium", "long")  # + 1 slot for any other value
+_HORIZON_INDEX = {h: i for i, h in enumerate(TIME_HORIZONS)}
+_OTHER_HORIZON = len(TIME_HORIZONS)
+
+# Shift baseline caps: how much weight a rule may move
+_CAP_NONE, _CAP_W3, _CAP_W3_W6, _CAP_W9 = range(4)
+
+
+def _rule_for(domain: str, sev_class: str, horizon: Optional[str], crisis: bool):
+    """
+    Adaptive rule of one (domain, severity class, horizon, narrative) cell.
+
+    Returns:
+        (cap kind, (c3, c6, c9)): weights move by take * c, with
+        take = min(shift_factor, cap)
+    """
+    # RULES:
+    # - ALPHA: crises puxam mais plano 6 (tensão) e 9 (estrutura), tirando peso de 3
+    # - GEO: alta severidade / horizonte longo puxam forte para plano 9
+    # - PRODUCT: curto prazo enfatiza 3/6 (experiência + discurso)
+    # - SAFEGUARD: estados mais críticos puxam 6/9 (risco / governança)
+    # - DEFAULT: leve bias para plane 6 quando severidade alta
+    if domain == "ALPHA":
+        if sev_class in ("high", "extreme"):
+            # até shift_factor, movendo parte de w3 -> w6 e w9
+            return _CAP_W3, (-0.7, 0.5, 0.2)
+
+    elif domain == "GEO":
+        if sev_class in ("medium", "high", "extreme") or horizon == "long":
+            # mover de 3 e 6 para 9
+            return _CAP_W3_W6, (-0.4, -0.6, 1.0)
+
+    elif domain == "PRODUCT":
+        if horizon == "short" and sev_class in ("medium", "high"):
+            # foco em superfície (3) e tensão (6)
+            return _CAP_W9, (0.6, 0.4, -1.0)
+
+    elif domain == "SAFEGUARD":
+        if sev_class in ("high", "extreme") or crisis:
+            # reforço em 6 (tensão / risco) + 9 (estrutura)
+            return _CAP_W3, (-1.0, 0.5, 0.5)
+
+    else:  # DEFAULT
+        if sev_class in ("high", "extreme"):
+            return _CAP_W3, (-0.5, 0.5, 0.0)
+
+    return _CAP_NONE, (0.0, 0.0, 0.0)
+
 
 @dataclass
 class AdaptiveMappingContext:
@@ -75,6 +127,69 @@ class AdaptiveStatePlaneMapper:
         self._severity_thresholds = config.get("severity_thresholds", {})
         self._max_shift = float(config.get("max_shift", 0.3))
         self._domains = config.get("domains", {})
+        self._compile()
+
+    def _compile(self) -> None:
+        """
+        Precompute the rule table.
+
+        Rows are the rule domains, any extra configured domains and a final
+        fallback row for unknown domains. For each (domain, severity class,
+        horizon, narrative) cell we store the shift cap and the
+        coefficients, so infer_mapping is a lookup plus a few flops.
+        """
+        names: List[str] = ["ALPHA", "GEO", "PRODUCT", "SAFEGUARD", "DEFAULT"]
+        names += [d for d in self._domains if d not in names]
+        self._domain_index: Dict[str, int] = {d: i for i, d in enumerate(names)}
+        # Unknown domains: configured DEFAULT baseline, DEFAULT rules
+        self._fallback_row = len(names)
+
+        n_rows = len(names) + 1
+        shape = (n_rows, len(SEVERITY_CLASSES), len(TIME_HORIZONS) + 1, 2)
+        baselines = np.zeros((n_rows, 3))
+        caps = np.zeros(shape)
+        coefs = np.zeros(shape + (3,))
+
+        horizons = list(TIME_HORIZONS) + [None]
+        for row in range(n_rows):
+            domain = names[row] if row < len(names) else None
+            base = self._get_baseline_for_domain(domain)
+            b3, b6, b9 = base.plane3, base.plane6, base.plane9
+            baselines[row] = (b3, b6, b9)
+            cap_values = {_CAP_NONE: 0.0, _CAP_W3: b3, _CAP_W3_W6: (b3 + b6) * 0.5, _CAP_W9: b9}
+
+            for s, sev_class in enumerate(SEVERITY_CLASSES):
+                for h, horizon in enumerate(horizons):
+                    for n, crisis in enumerate((False, True)):
+                        cap_kind, coef = _rule_for(domain, sev_class, horizon, crisis)
+                        caps[row, s, h, n] = cap_values[cap_kind]
+                        coefs[row, s, h, n] = coef
+
+        self._baselines = baselines
+        self._caps = caps
+        self._coefs = coefs
+        # Plain-Python views for the scalar path
+        self._baseline_rows = [tuple(b) for b in baselines.tolist()]
+        self._cap_list = caps.tolist()
+        self._coef_list = coefs.tolist()
+        self._thresholds = (
+            float(self._severity_thresholds.get("low", 0.3)),
+            float(self._severity_thresholds.get("medium", 0.6)),
+            float(self._severity_thresholds.get("high", 0.8)),
+        )
+
+    def _domain_row(self, domain: Any) -> int:
+        return self._domain_index.get(domain, self._fallback_row)
+
+    def _severity_bucket(self, severity: float) -> int:
+        low, med, high = self._thresholds
+        if severity < low:
+            return 0
+        if severity < med:
+            return 1
+        if severity < high:
+            return 2
+        return 3
 
     def _get_baseline_for_domain(self, domain: DomainType) -> PlaneWeights:
         key = domain if domain in self._domains else "DEFAULT"
@@ -130,68 +245,104 @@ class AdaptiveStatePlaneMapper:
 
         Adaptation happens through plane_weights.
         """
-        baseline = self._get_baseline_for_domain(ctx.domain)
-        sev_class = self._classify_severity(ctx.severity)
+        row = self._domain_row(ctx.domain)
+        bucket = self._severity_bucket(ctx.severity)
+        horizon = _HORIZON_INDEX.get(ctx.time_horizon, _OTHER_HORIZON)
+        crisis = 1 if ctx.narrative_type == "crisis" else 0
         shift_factor = self._compute_shift_factor(ctx.severity)
 
-        w3, w6, w9 = baseline.plane3, baseline.plane6, baseline.plane9
-
-        # RULES:
-        # - ALPHA: crises puxam mais plano 6 (tensão) e 9 (estrutura), tirando peso de 3
-        # - GEO: alta severidade / horizonte longo puxam forte para plano 9
-        # - PRODUCT: curto prazo enfatiza 3/6 (experiência + discurso)
-        # - SAFEGUARD: estados mais críticos puxam 6/9 (risco / governança)
-        # - DEFAULT: leve bias para plane 6 quando severidade alta
-
-        if ctx.domain == "ALPHA":
-            if sev_class in ("high", "extreme"):
-                # até shift_factor, movendo parte de w3 -> w6 e w9
-                delta = shift_factor
-                take_from_3 = min(delta, w3)
-                w3 -= take_from_3 * 0.7
-                w6 += take_from_3 * 0.5
-                w9 += take_from_3 * 0.2
-
-        elif ctx.domain == "GEO":
-            if sev_class in ("medium", "high", "extreme") or ctx.time_horizon == "long":
-                delta = shift_factor
-                # mover de 3 e 6 para 9
-                take = min(delta, (w3 + w6) * 0.5)
-                w3 -= take * 0.4
-                w6 -= take * 0.6
-                w9 += take
-
-        elif ctx.domain == "PRODUCT":
-            if ctx.time_horizon == "short" and sev_class in ("medium", "high"):
-                # foco em superfície (3) e tensão (6)
-                delta = shift_factor
-                take_from_9 = min(delta, w9)
-                w9 -= take_from_9
-                w3 += take_from_9 * 0.6
-                w6 += take_from_9 * 0.4
-
-        elif ctx.domain == "SAFEGUARD":
-            if sev_class in ("high", "extreme") or ctx.narrative_type == "crisis":
-                # reforço em 6 (tensão / risco) + 9 (estrutura)
-                delta = shift_factor
-                take_from_3 = min(delta, w3)
-                w3 -= take_from_3
-                w6 += take_from_3 * 0.5
-                w9 += take_from_3 * 0.5
-
-        else:  # DEFAULT
-            if sev_class in ("high", "extreme"):
-                delta = shift_factor
-                take_from_3 = min(delta, w3)
-                w3 -= take_from_3 * 0.5
-                w6 += take_from_3 * 0.5
+        b3, b6, b9 = self._baseline_rows[row]
+        c3, c6, c9 = self._coef_list[row][bucket][horizon][crisis]
+        take = min(shift_factor, self._cap_list[row][bucket][horizon][crisis])
 
         # Clamp and normalize
-        w3 = max(0.0, w3)
-        w6 = max(0.0, w6)
-        w9 = max(0.0, w9)
+        w3 = max(0.0, b3 + take * c3)
+        w6 = max(0.0, b6 + take * c6)
+        w9 = max(0.0, b9 + take * c9)
         weights = self._normalize_weights(PlaneWeights(w3, w6, w9))
 
+        return self._build_result(ctx, weights, SEVERITY_CLASSES[bucket], shift_factor, (b3, b6, b9))
+
+    def plane_weights_batch(
+        self,
+        domains: Sequence[Any],
+        severities: Sequence[float],
+        time_horizons: Optional[Sequence[Any]] = None,
+        narrative_types: Optional[Sequence[Any]] = None,
+    ) -> np.ndarray:
+        """
+        Adaptive plane weights for N contexts given as parallel arrays.
+
+        Args:
+            domains: Domain per context
+            severities: Severity per context
+            time_horizons: Time horizon per context (default: "medium")
+            narrative_types: Narrative type per context (default: None)
+
+        Returns:
+            Array of shape (N, 3) with normalized (plane3, plane6, plane9)
+            weights, identical to infer_mapping row by row
+        """
+        sev = np.asarray(severities, dtype=float)
+        n = sev.shape[0]
+        rows = np.fromiter((self._domain_row(d) for d in domains), dtype=np.intp, count=n)
+        if time_horizons is None:
+            horizons = np.full(n, _HORIZON_INDEX["medium"], dtype=np.intp)
+        else:
+            horizons = np.fromiter(
+                (_HORIZON_INDEX.get(h, _OTHER_HORIZON) for h in time_horizons),
+                dtype=np.intp,
+                count=n,
+            )
+        if narrative_types is None:
+            crisis = np.zeros(n, dtype=np.intp)
+        else:
+            crisis = np.fromiter((t == "crisis" for t in narrative_types), dtype=np.intp, count=n)
+
+        low, med, high = self._thresholds
+        buckets = np.full(n, 3, dtype=np.intp)
+        buckets[sev < high] = 2
+        buckets[sev < med] = 1
+        buckets[sev < low] = 0
+
+        shift = self._max_shift * np.clip(sev, 0.0, 1.0)
+        take = np.minimum(shift, self._caps[rows, buckets, horizons, crisis])
+        w = np.maximum(0.0, self._baselines[rows] + take[:, None] * self._coefs[rows, buckets, horizons, crisis])
+
+        total = np.maximum(1e-9, w[:, 0] + w[:, 1] + w[:, 2])
+        return w / total[:, None]
+
+    def infer_mapping_batch(self, contexts: Sequence[AdaptiveMappingContext]) -> List[PlaneMappingResult]:
+        """
+        infer_mapping for many contexts, with the weights computed in one
+        vectorized pass (see plane_weights_batch).
+        """
+        weights = self.plane_weights_batch(
+            [c.domain for c in contexts],
+            [c.severity for c in contexts],
+            [c.time_horizon for c in contexts],
+            [c.narrative_type for c in contexts],
+        )
+        results = []
+        for ctx, (w3, w6, w9) in zip(contexts, weights.tolist()):
+            bucket = self._severity_bucket(ctx.severity)
+            results.append(self._build_result(
+                ctx,
+                PlaneWeights(w3, w6, w9),
+                SEVERITY_CLASSES[bucket],
+                self._compute_shift_factor(ctx.severity),
+                self._baseline_rows[self._domain_row(ctx.domain)],
+            ))
+        return results
+
+    @staticmethod
+    def _build_result(
+        ctx: AdaptiveMappingContext,
+        weights: PlaneWeights,
+        sev_class: str,
+        shift_factor: float,
+        baseline: Tuple[float, float, float],
+    ) -> PlaneMappingResult:
         # Primary mapping remains static for now (future: truly dynamic reassignment)
         primary = {1: 3, 2: 6, 3: 9}
 
@@ -206,9 +357,9 @@ class AdaptiveStatePlaneMapper:
             "severity_class": sev_class,
             "shift_factor": shift_factor,
             "baseline": {
-                "plane3": baseline.plane3,
-                "plane6": baseline.plane6,
-                "plane9": baseline.plane9,
+                "plane3": baseline[0],
+                "plane6": baseline[1],
+                "plane9": baseline[2],
             },
         }
 
@@ -3,10 +3,14 @@ TW369 Temporal Coherence - Temporal drift analysis for KALDRA v2.6.
 
 Extends TW369 with temporal aggregation capabilities for analyzing
 drift evolution over narrative timelines.
+
+compute_temporal_coherence analyzes a full event list; for per-turn use,
+TemporalCoherenceTracker maintains the same measures incrementally.
 """
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 import statistics
@@ -204,3 +208,220 @@ def detect_regime_stability(events: List[Any]) -> float:
     stability = 1.0 - change_rate
     
     return stability
+
+
+class TemporalCoherenceTracker:
+    """
+    Incremental temporal coherence over a stream of events.
+    
+    Ingests events one at a time (O(1) each) and produces the same
+    TemporalCoherence as compute_temporal_coherence over the ingested
+    events, or over the last `window` events when a window is set.
+    
+    Maintained state:
+        - regression sums over drift values (index-relative, so the window
+          can slide without recomputation)
+        - Welford mean/M2 for drift volatility
+        - second differences, via their telescoped sum
+          (v[-1] - v[-2]) - (v[1] - v[0])
+        - regime change count and the current regime run
+    """
+    
+    def __init__(self, window: Optional[int] = None):
+        """
+        Args:
+            window: Number of most recent events to analyze (None = all)
+        """
+        if window is not None and window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self.window = window
+        
+        # Per-event records in the window: (drift or None, has_tw_state, regime)
+        self._events: deque = deque()
+        self._n_events = 0
+        
+        # Drift trajectory and running sums
+        self._drift: deque = deque()
+        self._times: deque = deque()
+        self._sum_y = 0.0
+        self._sum_jy = 0.0  # sum of j * y, j = position within the trajectory
+        self._mean = 0.0
+        self._m2 = 0.0
+        
+        # Truthy regimes (for stability) and their change count
+        self._regimes: deque = deque()
+        self._changes = 0
+        
+        # tw_state-bearing events: (timestamp, regime), for the regime run
+        self._tw_events: deque = deque()
+        self._run_regime: Optional[str] = None
+        self._run_start: Optional[float] = None
+        self._run_length = 0
+        self._last_regime: Optional[str] = None
+    
+    def __len__(self) -> int:
+        return self._n_events
+    
+    @property
+    def regime_run_length(self) -> int:
+        """Number of consecutive tw_state events in the current regime."""
+        return self._run_length if self._last_regime else 0
+    
+    def update(self, event: Any) -> None:
+        """
+        Ingest one StoryEvent-like object (drift_state, tw_state, timestamp).
+        """
+        self.add(
+            timestamp=getattr(event, "timestamp", 0.0),
+            drift_state=getattr(event, "drift_state", None),
+            tw_state=getattr(event, "tw_state", None),
+        )
+    
+    def add(
+        self,
+        timestamp: float,
+        drift_state: Optional[Dict[str, Any]] = None,
+        tw_state: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Ingest one event given its fields.
+        
+        Args:
+            timestamp: Event timestamp
+            drift_state: Event drift_state dict (uses "drift_metric")
+            tw_state: Event tw_state dict (uses "regime")
+        """
+        drift = drift_state.get("drift_metric", 0.0) if drift_state else None
+        has_tw = bool(tw_state)
+        regime = tw_state.get("regime") if has_tw else None
+        
+        if drift is not None:
+            self._push_drift(drift, timestamp)
+        
+        if has_tw:
+            if regime:
+                if self._regimes and self._regimes[-1] != regime:
+                    self._changes += 1
+                self._regimes.append(regime)
+            
+            if self._run_start is not None and regime == self._run_regime:
+                self._run_length += 1
+            else:
+                self._run_regime = regime
+                self._run_start = timestamp
+                self._run_length = 1
+            self._tw_events.append((timestamp, regime))
+        self._last_regime = regime
+        
+        self._events.append((drift, has_tw, regime))
+        self._n_events += 1
+        if self.window is not None and self._n_events > self.window:
+            self._evict_oldest()
+    
+    def _push_drift(self, y: float, timestamp: float) -> None:
+        n = len(self._drift)
+        self._drift.append(y)
+        self._times.append(timestamp)
+        self._sum_y += y
+        self._sum_jy += n * y
+        
+        delta = y - self._mean
+        self._mean += delta / (n + 1)
+        self._m2 += delta * (y - self._mean)
+    
+    def _pop_drift(self) -> None:
+        y = self._drift.popleft()
+        self._times.popleft()
+        n = len(self._drift)
+        self._sum_y -= y
+        # Remaining positions shift down by one
+        self._sum_jy -= self._sum_y
+        
+        if n == 0:
+            self._sum_y = self._sum_jy = self._mean = self._m2 = 0.0
+            return
+        old_mean = self._mean
+        self._mean = (old_mean * (n + 1) - y) / n
+        self._m2 = max(0.0, self._m2 - (y - old_mean) * (y - self._mean))
+    
+    def _evict_oldest(self) -> None:
+        drift, has_tw, regime = self._events.popleft()
+        self._n_events -= 1
+        
+        if drift is not None:
+            self._pop_drift()
+        
+        if has_tw:
+            if regime:
+                self._regimes.popleft()
+                if self._regimes and self._regimes[0] != regime:
+                    self._changes -= 1
+            self._tw_events.popleft()
+            if not self._tw_events:
+                self._run_start = None
+                self._run_length = 0
+            elif self._run_length > len(self._tw_events):
+                # The run started at the evicted event; it now starts at
+                # the oldest tw_state event left in the window
+                self._run_length = len(self._tw_events)
+                self._run_start = self._tw_events[0][0]
+    
+    def drift_slope(self) -> float:
+        """Same as compute_drift_slope over the window."""
+        n = len(self._drift)
+        if n < 2:
+            return 0.0
+        x_mean = (n - 1) / 2.0
+        denominator = n * (n * n - 1) / 12.0
+        return (self._sum_jy - x_mean * self._sum_y) / denominator
+    
+    def drift_acceleration(self) -> float:
+        """Same as compute_drift_acceleration over the window."""
+        n = len(self._drift)
+        if n < 3:
+            return 0.0
+        d = self._drift
+        return ((d[-1] - d[-2]) - (d[1] - d[0])) / (n - 2)
+    
+    def drift_volatility(self) -> float:
+        """Sample standard deviation of drift values (as statistics.stdev)."""
+        n = len(self._drift)
+        if n < 2:
+            return 0.0
+        return (self._m2 / (n - 1)) ** 0.5
+    
+    def regime_stability(self) -> float:
+        """Same as detect_regime_stability over the window."""
+        if self._n_events < 2 or len(self._regimes) < 2:
+            return 1.0
+        return 1.0 - self._changes / (len(self._regimes) - 1)
+    
+    def snapshot(self, include_trajectory: bool = True) -> Optional[TemporalCoherence]:
+        """
+        Current TemporalCoherence.
+        
+        Args:
+            include_trajectory: Copy drift_values/timestamps into the result.
+                When False they are left empty and the call is O(1).
+            
+        Returns:
+            TemporalCoherence or None if fewer than 2 drift values
+        """
+        if len(self._drift) < 2:
+            return None
+        
+        current_regime = self._last_regime
+        regime_duration = 0.0
+        if current_regime:
+            regime_duration = self._times[-1] - self._run_start
+        
+        return TemporalCoherence(
+            drift_slope=self.drift_slope(),
+            drift_acceleration=self.drift_acceleration(),
+            drift_volatility=self.drift_volatility(),
+            regime_stability=self.regime_stability(),
+            drift_values=list(self._drift) if include_trajectory else [],
+            timestamps=list(self._times) if include_trajectory else [],
+            current_regime=current_regime,
+            regime_duration=regime_duration,
+        )
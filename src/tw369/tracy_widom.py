@@ -7,15 +7,19 @@ replacing heuristic tanh approximation.
 
 import json
 import math
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import numpy as np
 
+from .calibration_store import get_calibration_store
+
 
 def load_tw_lookup(schema_dir: Optional[Path] = None) -> Dict:
-    """Load Tracy-Widom lookup table from schema."""
+    """Load Tracy-Widom lookup table from schema (cached if schema_dir is None)."""
     if schema_dir is None:
-        schema_dir = Path(__file__).parent.parent.parent / "schema" / "tw369"
+        return get_calibration_store().get("tracy_widom_lookup.json", {})
     
     lookup_path = schema_dir / "tracy_widom_lookup.json"
     
@@ -27,19 +31,78 @@ def load_tw_lookup(schema_dir: Optional[Path] = None) -> Dict:
 
 
 def load_tw_parameters(schema_dir: Optional[Path] = None) -> Dict:
-    """Load Tracy-Widom parameters from schema."""
+    """Load Tracy-Widom parameters from schema (cached if schema_dir is None)."""
+    default = {"enabled": False, "beta": 2, "use_lookup": True, "severity_scale": 1.0}
     if schema_dir is None:
-        schema_dir = Path(__file__).parent.parent.parent / "schema" / "tw369"
+        return dict(get_calibration_store().get("tw_parameters.json", default))
     
     params_path = schema_dir / "tw_parameters.json"
     
     if not params_path.exists():
-        return {"enabled": False, "beta": 2, "use_lookup": True, "severity_scale": 1.0}
+        return default
     
     with open(params_path, "r") as f:
         return json.load(f)
 
 
+@dataclass(frozen=True)
+class TWTable:
+    """
+    NumPy view of one beta entry of the Tracy-Widom lookup table.
+
+    Attributes:
+        x: Sorted x grid
+        cdf: CDF values at each x
+    """
+    x: np.ndarray
+    cdf: np.ndarray
+
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        """Linear interpolation of the CDF at x (clamped to the table edges)."""
+        return np.interp(np.asarray(x, dtype=float), self.x, self.cdf)
+
+
+def build_tw_table(beta: int = 2, lookup: Optional[Dict] = None) -> Optional[TWTable]:
+    """
+    Build a TWTable for one beta from a lookup dict.
+
+    Args:
+        beta: Ensemble type (1, 2, or 4)
+        lookup: Lookup table dict (loaded from schema if None)
+
+    Returns:
+        TWTable, or None if the beta entry is missing
+    """
+    if lookup is None:
+        lookup = load_tw_lookup()
+
+    beta_key = f"beta_{beta}"
+    if beta_key not in lookup:
+        return None
+
+    x = np.asarray(lookup[beta_key]["x"], dtype=float)
+    cdf = np.asarray(lookup[beta_key]["cdf"], dtype=float)
+
+    # Tables are shared through the cache; keep them read-only
+    x.setflags(write=False)
+    cdf.setflags(write=False)
+    return TWTable(x=x, cdf=cdf)
+
+
+@lru_cache(maxsize=8)
+def get_tw_table(beta: int = 2) -> Optional[TWTable]:
+    """
+    Cached TWTable for the schema lookup table.
+
+    Built once per beta from the calibration store; cleared by
+    invalidate_calibration().
+    """
+    return build_tw_table(beta=beta)
+
+
+get_calibration_store().add_invalidation_listener(get_tw_table.cache_clear)
+
+
 def tw_cdf(x: float, beta: int = 2, lookup: Optional[Dict] = None) -> float:
     """
     Compute Tracy-Widom CDF at x using lookup table with linear interpolation.
@@ -53,19 +116,43 @@ def tw_cdf(x: float, beta: int = 2, lookup: Optional[Dict] = None) -> float:
         CDF value in [0, 1]
     """
     if lookup is None:
-        lookup = load_tw_lookup()
-    
-    beta_key = f"beta_{beta}"
+        table = get_tw_table(beta)
+    else:
+        table = build_tw_table(beta=beta, lookup=lookup)
     
-    if beta_key not in lookup:
+    if table is None:
         # Fallback to heuristic if lookup not available
         return _heuristic_cdf(x)
     
-    x_vals = lookup[beta_key]["x"]
-    cdf_vals = lookup[beta_key]["cdf"]
-    
     # Linear interpolation
-    return float(np.interp(x, x_vals, cdf_vals))
+    return float(np.interp(x, table.x, table.cdf))
+
+
+def tw_cdf_array(
+    x: np.ndarray,
+    beta: int = 2,
+    lookup: Optional[Dict] = None,
+) -> np.ndarray:
+    """
+    Vectorized tw_cdf: evaluate the Tracy-Widom CDF over an array.
+    
+    Args:
+        x: Input values (any shape)
+        beta: Ensemble type (1, 2, or 4)
+        lookup: Preloaded lookup table (optional, cached schema table if None)
+        
+    Returns:
+        Array of CDF values in [0, 1], same shape as x
+    """
+    if lookup is None:
+        table = get_tw_table(beta)
+    else:
+        table = build_tw_table(beta=beta, lookup=lookup)
+    
+    if table is None:
+        return _heuristic_cdf_array(x)
+    
+    return table.evaluate(x)
 
 
 def _heuristic_cdf(x: float) -> float:
@@ -78,6 +165,12 @@ def _heuristic_cdf(x: float) -> float:
     return max(0.0, min(1.0, 0.5 * (1.0 + math.tanh(x / 2.0))))
 
 
+def _heuristic_cdf_array(x: np.ndarray) -> np.ndarray:
+    """Elementwise _heuristic_cdf."""
+    x = np.asarray(x, dtype=float)
+    return np.clip(0.5 * (1.0 + np.tanh(x / 2.0)), 0.0, 1.0)
+
+
 def severity_from_index(
     instability_index: float,
     params: Optional[Dict] = None,
@@ -107,10 +200,7 @@ def severity_from_index(
         return _heuristic_cdf(instability_index * 2.0)
     
     if use_lookup:
-        # Use TW lookup table
-        if lookup is None:
-            lookup = load_tw_lookup()
-        
+        # Use TW lookup table (cached schema table if lookup is None)
         # Map instability_index to x-scale (normalize)
         x = instability_index * severity_scale
         
@@ -121,3 +211,44 @@ def severity_from_index(
     else:
         # Use heuristic even if enabled (for testing)
         return _heuristic_cdf(instability_index * severity_scale)
+
+
+def severity_from_index_array(
+    instability_index: np.ndarray,
+    params: Optional[Dict] = None,
+    lookup: Optional[Dict] = None,
+) -> np.ndarray:
+    """
+    Vectorized severity_from_index: score a whole series in one call.
+    
+    Parameters and lookup are resolved once for the whole array; the
+    result matches severity_from_index elementwise.
+    
+    Args:
+        instability_index: Array of instability indices (any shape)
+        params: TW parameters (optional, will load from schema if None)
+        lookup: TW lookup table (optional, cached schema table if None)
+        
+    Returns:
+        Array of severities in [0, 1], same shape as instability_index
+    """
+    if params is None:
+        params = load_tw_parameters()
+    
+    index = np.asarray(instability_index, dtype=float)
+    enabled = params.get("enabled", False)
+    beta = params.get("beta", 2)
+    use_lookup = params.get("use_lookup", True)
+    severity_scale = params.get("severity_scale", 1.0)
+    
+    if not enabled:
+        return _heuristic_cdf_array(index * 2.0)
+    
+    if use_lookup:
+        return tw_cdf_array(
+            index * severity_scale,
+            beta=beta,
+            lookup=lookup,
+        )
+    
+    return _heuristic_cdf_array(index * severity_scale)
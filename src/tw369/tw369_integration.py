@@ -7,27 +7,83 @@ mapping them to planes 3, 6, and 9 respectively.
 Implements temporal drift calculation based on tension gradients between planes.
 """
 
-from typing import Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, Sequence, Tuple
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from pathlib import Path
+import json
 import math
+import threading
+import numpy as np
 from src.tw369.painleve.painleve_filter import painleve_filter
 from src.tw369.painleve.painleve2_solver import PainleveIISolver, build_default_solver
 
 # v2.4 imports
-from src.tw369.tracy_widom import severity_from_index
+from src.tw369.tracy_widom import severity_from_index, severity_from_index_array
 from src.tw369.drift_state import DriftState
-from src.tw369.drift_memory import DriftMemory
-from src.tw369.regime_utils import get_tw_regime_for_delta12
+from src.tw369.drift_memory import DriftMemoryStore
+from src.tw369.regime_utils import DEFAULT_REGIME, get_tw_regime_for_delta12
 
-# Module-level drift memory (v2.4)
-_DRIFT_MEMORY = DriftMemory(window_size=10)
+# Module-level drift memory, keyed by stream/session id
+_DRIFT_STORE = DriftMemoryStore(window_size=10)
 from src.tw369.advanced_drift_models import (
+    DriftEnsemble,
     DriftModelConfig,
+    DriftState as MultiscaleState,
     model_a_linear_drift,
     model_b_nonlinear_drift,
     model_c_multiscale_drift,
     model_d_stochastic_drift,
+    model_d_stochastic_ensemble,
+    model_a_linear_drift_array,
+    model_b_nonlinear_drift_array,
+    model_c_multiscale_drift_array,
+    model_d_stochastic_drift_array,
 )
+from src.tw369.tw_state_array import TWStateArray, compute_plane_tension_batch
+
+
+# Fixed plane order for array-based evolution (index 0, 1, 2)
+PLANE_ORDER: Tuple[str, ...] = ("3", "6", "9")
+_PLANE_POSITION = {plane: i for i, plane in enumerate(PLANE_ORDER)}
+
+# Drift component feeding each plane, in PLANE_ORDER
+_PLANE_INFLOW = ("plane9_to_3", "plane3_to_6", "plane6_to_9")
+
+
+@lru_cache(maxsize=1)
+def load_delta144_state_ids() -> Tuple[str, ...]:
+    """
+    Canonical Δ144 state order (schema/archetypes/delta144_states.json).
+    
+    Used as the fixed (144,) axis of array-based distributions.
+    """
+    path = Path(__file__).parent.parent.parent / "schema" / "archetypes" / "delta144_states.json"
+    with open(path, "r", encoding="utf-8") as f:
+        states = json.load(f)
+    return tuple(state["id"] for state in states)
+
+
+@lru_cache(maxsize=64)
+def _plane_index_array(
+    state_ids: Tuple[str, ...],
+    state_planes: frozenset,
+) -> np.ndarray:
+    """
+    Read-only plane position per state (see TW369Integrator.plane_index).
+    
+    Module-level and bounded so integrators stay free of mutable caches;
+    state_planes is the frozen (state, plane) mapping the array is built
+    from.
+    """
+    mapping = dict(state_planes)
+    index = np.fromiter(
+        (_PLANE_POSITION[mapping.get(state_id, "6")] for state_id in state_ids),
+        dtype=np.intp,
+        count=len(state_ids),
+    )
+    index.setflags(write=False)
+    return index
 
 
 @dataclass
@@ -47,6 +103,40 @@ class TWState:
     metadata: Optional[Dict[str, Any]] = None
 
 
+@dataclass(frozen=True)
+class TW369Core:
+    """
+    Immutable drift configuration of a TW369Integrator.
+    
+    Reconfiguring an integrator builds a new core and swaps it in with a
+    single assignment, so every call reads one consistent (model, config)
+    pair without locking. DriftModelConfig is frozen, so a core cannot be
+    changed in place.
+    """
+    drift_model: str = "model_a"
+    drift_model_config: DriftModelConfig = field(default_factory=DriftModelConfig)
+
+
+@dataclass(frozen=True)
+class DriftStreamState:
+    """
+    Carried drift state of one stream or caller (copy-on-write).
+    
+    compute_drift_step never mutates it; it returns a new instance, so
+    each thread can own its state and the integrator needs no locks.
+    
+    Attributes:
+        multiscale: Model C state (None for a fresh stream)
+        steps: Number of drift steps taken
+        noise_entropy: Model D seed entropy of the stream (stochastic_seed,
+            or fresh entropy when unseeded); step i draws its noise from
+            SeedSequence(noise_entropy, spawn_key=(i,))
+    """
+    multiscale: Optional[MultiscaleState] = None
+    steps: int = 0
+    noise_entropy: Optional[int] = None
+
+
 class TW369Integrator:
     """
     Integrates Kindra layers into the TW369 temporal evolution engine.
@@ -57,15 +147,46 @@ class TW369Integrator:
     - Eigenvalue-based instability indices
     """
     
-    def __init__(self):
+    def __init__(self, drift_store: Optional[DriftMemoryStore] = None):
+        """
+        Args:
+            drift_store: Per-stream drift memory (default: module-level store)
+        """
+        self._drift_store = drift_store if drift_store is not None else _DRIFT_STORE
+        
         # State-to-plane mapping for Δ144 states
         # This is a simplified mapping - can be refined with actual Δ144 structure
         self._state_plane_mapping = self._initialize_state_plane_mapping()
         
-        # Advanced drift model state
-        self._drift_state: Optional[DriftState] = None
-        self._drift_model: str = "model_a"
-        self._drift_model_config: DriftModelConfig = DriftModelConfig()
+        # Advanced drift model state of calls without a stream id
+        self._drift_state: Optional[MultiscaleState] = None
+        self._drift_state_lock = threading.Lock()
+        self._core = TW369Core()
+        
+        # Per-integrator generator for Model D ensembles (created lazily)
+        self._rng: Optional[np.random.Generator] = None
+    
+    @property
+    def core(self) -> TW369Core:
+        """Current immutable drift configuration."""
+        return self._core
+    
+    @property
+    def _drift_model(self) -> str:
+        return self._core.drift_model
+    
+    @_drift_model.setter
+    def _drift_model(self, value: str) -> None:
+        self._core = replace(self._core, drift_model=value)
+    
+    @property
+    def _drift_model_config(self) -> DriftModelConfig:
+        return self._core.drift_model_config
+    
+    @_drift_model_config.setter
+    def _drift_model_config(self, value: DriftModelConfig) -> None:
+        self._core = replace(self._core, drift_model_config=value)
+        self._rng = None
     
     def _initialize_state_plane_mapping(self) -> Dict[str, str]:
         """
@@ -191,25 +312,10 @@ class TW369Integrator:
         
         return float(max(0.0, min(1.0, severity)))
     
-    def compute_drift(self, tw_state: TWState, tau_modifiers: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    def _drift_inputs(self, tw_state: TWState):
         """
-        Computes the temporal drift based on the TW state.
-        
-        Drift represents energy/symbolic flow between planes:
-        - plane3_to_6: Surface → Tension (cultural forces creating tension)
-        - plane6_to_9: Tension → Structure (tension crystallizing into structure)
-        - plane9_to_3: Structure → Surface (structure manifesting at surface)
-        
-        Drift values are in range approximately [-1.0, 1.0]:
-        - Positive: flow from source to target plane
-        - Negative: resistance/backflow
-        
-        Args:
-            tw_state: Current TW state with all plane inputs
-            tau_modifiers: Optional modifiers from Tau Layer (e.g. drift_damping)
-            
-        Returns:
-            Dict mapping drift dimensions to values
+        Shared drift inputs: plane tensions, severity, tension gradients,
+        normalization factor k and the Model A linear drift.
         """
         # Compute tensions for each plane
         tensions = self._compute_plane_tension(tw_state)
@@ -240,62 +346,325 @@ class TW369Integrator:
             severity=severity,
             normalization_k=k,
         )
+        return tensions, severity, gradients, k, linear_drift
+    
+    def compute_drift(
+        self,
+        tw_state: TWState,
+        tau_modifiers: Optional[Dict[str, float]] = None,
+        stream_id: Optional[str] = None
+    ) -> Dict[str, float]:
+        """
+        Computes the temporal drift based on the TW state.
+        
+        Drift represents energy/symbolic flow between planes:
+        - plane3_to_6: Surface → Tension (cultural forces creating tension)
+        - plane6_to_9: Tension → Structure (tension crystallizing into structure)
+        - plane9_to_3: Structure → Surface (structure manifesting at surface)
+        
+        Drift values are in range approximately [-1.0, 1.0]:
+        - Positive: flow from source to target plane
+        - Negative: resistance/backflow
+        
+        Args:
+            tw_state: Current TW state with all plane inputs
+            tau_modifiers: Optional modifiers from Tau Layer (e.g. drift_damping)
+            stream_id: Stream/session id for drift memory and multiscale
+                state (default: tw_state.metadata["stream_id"]). Calls without
+                a stream id use the default stream's memory and the
+                integrator's own multiscale state (updated under a lock);
+                shared callers such as the master engine pass an explicit id.
+            
+        Returns:
+            Dict mapping drift dimensions to values (a new dict owned by
+            the caller; the carried multiscale state is never aliased)
+        """
+        if stream_id is None and tw_state.metadata:
+            stream_id = tw_state.metadata.get("stream_id")
+
+        tensions, severity, gradients, k, linear_drift = self._drift_inputs(tw_state)
 
-        drift_model = self._drift_model
-        cfg = self._drift_model_config
+        core = self._core
+        rng = self.stochastic_rng() if core.drift_model == "stochastic" else None
+        
+        def step(prev_state):
+            return self._select_drift(core, gradients, severity, k, linear_drift, prev_state, rng)
+        
+        if self._uses_multiscale(core):
+            if stream_id is not None:
+                drift = self._drift_store.update_multiscale(stream_id, step)
+            else:
+                with self._drift_state_lock:
+                    drift, self._drift_state = step(self._drift_state)
+        else:
+            drift, _ = step(None)
+        drift = dict(drift)
+        
+        # v2.4: Track drift in memory (non-blocking)
+        try:
+            drift_state = DriftState(
+                plane_values=tensions,
+                drift_metric=sum(abs(v) for v in drift.values()) / len(drift),
+                painleve_coherence=severity,
+                regime="UNKNOWN"  # Can be enhanced with Δ12 later
+            )
+            self._drift_store.append(stream_id or DriftMemoryStore.DEFAULT_STREAM, drift_state)
+        except Exception:
+            # Never block on memory failure
+            pass
+        
+        # v2.8: Apply Tau Layer Damping
+        if tau_modifiers:
+            damping = tau_modifiers.get("drift_damping", 1.0)
+            if damping < 0.99:
+                for k in drift:
+                    drift[k] *= damping
+        
+        return drift
+    
+    @staticmethod
+    def _uses_multiscale(core: TW369Core) -> bool:
+        return core.drift_model == "multiscale" and core.drift_model_config.multiscale_enabled
+    
+    @staticmethod
+    def _select_drift(
+        core: TW369Core,
+        gradients: Dict[str, float],
+        severity: float,
+        k: float,
+        linear_drift: Dict[str, float],
+        multiscale: Optional[MultiscaleState],
+        rng: Optional[np.random.Generator] = None
+    ) -> Tuple[Dict[str, float], Optional[MultiscaleState]]:
+        """
+        Apply the configured drift model.
+        
+        rng is the Model D noise source (see model_d_stochastic_drift).
+        
+        Returns:
+            (drift, multiscale state after this step); the state is returned
+            unchanged unless the multiscale model is active
+        """
+        drift_model = core.drift_model
+        cfg = core.drift_model_config
 
         if drift_model == "model_a":
-            drift = linear_drift
+            return linear_drift, multiscale
 
-        elif drift_model == "nonlinear" and cfg.nonlinear_enabled:
+        if drift_model == "nonlinear" and cfg.nonlinear_enabled:
             drift = model_b_nonlinear_drift(
                 gradients=gradients,
                 severity=severity,
                 cfg=cfg,
                 normalization_k=k,
             )
+            return drift, multiscale
 
-        elif drift_model == "multiscale" and cfg.multiscale_enabled:
+        if drift_model == "multiscale" and cfg.multiscale_enabled:
             # Use linear drift as base, then apply multiscale combination
-            eff_drift, new_state = model_c_multiscale_drift(
+            return model_c_multiscale_drift(
                 instantaneous_drift=linear_drift,
                 cfg=cfg,
-                prev_state=self._drift_state,
+                prev_state=multiscale,
             )
-            self._drift_state = new_state
-            drift = eff_drift
 
-        elif drift_model == "stochastic" and cfg.stochastic_enabled:
+        if drift_model == "stochastic" and cfg.stochastic_enabled:
             # Use linear drift as mean, then inject noise
             drift = model_d_stochastic_drift(
                 base_drift=linear_drift,
                 severity=severity,
                 cfg=cfg,
+                rng=rng,
             )
+            return drift, multiscale
 
-        else:
-            # Fallback: Model A
-            drift = linear_drift
+        # Fallback: Model A
+        return linear_drift, multiscale
+    
+    def compute_drift_step(
+        self,
+        tw_state: TWState,
+        state: Optional[DriftStreamState] = None,
+        tau_modifiers: Optional[Dict[str, float]] = None
+    ) -> Tuple[Dict[str, float], DriftStreamState]:
+        """
+        Side-effect-free variant of compute_drift.
         
-        # v2.4: Track drift in memory (non-blocking)
-        try:
-            drift_state = DriftState(
-                plane_values=tensions,
-                drift_metric=sum(abs(v) for v in drift.values()) / len(drift),
-                painleve_coherence=severity,
-                regime="UNKNOWN"  # Can be enhanced with Δ12 later
+        The caller owns the carried state: it is passed in and a new one is
+        returned. The integrator is only read (through one core snapshot)
+        and nothing is appended to the drift memory, so concurrent calls
+        from a thread pool need no locks and do not interleave.
+        
+        Args:
+            tw_state: Current TW state with all plane inputs
+            state: State returned by the previous step (None for a new stream)
+            tau_modifiers: Optional modifiers from Tau Layer (e.g. drift_damping)
+            
+        Returns:
+            (drift dict, new DriftStreamState)
+        """
+        if state is None:
+            state = DriftStreamState()
+        
+        core = self._core
+        rng = None
+        if core.drift_model == "stochastic":
+            if state.noise_entropy is None:
+                seed_seq = np.random.SeedSequence(core.drift_model_config.stochastic_seed)
+                state = replace(state, noise_entropy=seed_seq.entropy)
+            rng = np.random.default_rng(
+                np.random.SeedSequence(state.noise_entropy, spawn_key=(state.steps,))
             )
-            _DRIFT_MEMORY.append(drift_state)
+        
+        _, severity, gradients, k, linear_drift = self._drift_inputs(tw_state)
+        drift, multiscale = self._select_drift(
+            core, gradients, severity, k, linear_drift, state.multiscale, rng
+        )
+        drift = dict(drift)
+        
+        if tau_modifiers:
+            damping = tau_modifiers.get("drift_damping", 1.0)
+            if damping < 0.99:
+                for key in drift:
+                    drift[key] *= damping
+        
+        return drift, replace(state, multiscale=multiscale, steps=state.steps + 1)
+    
+    def stochastic_rng(self) -> np.random.Generator:
+        """
+        Per-integrator generator for Model D (compute_drift and ensembles).
+        
+        Seeded from stochastic_seed on first use; successive calls keep
+        drawing from it, so they differ but a seeded integrator replays the
+        same sequence. Reset by reconfiguring the drift model.
+        """
+        if self._rng is None:
+            self._rng = np.random.default_rng(self._drift_model_config.stochastic_seed)
+        return self._rng
+    
+    def compute_drift_ensemble(
+        self,
+        tw_state: TWState,
+        n_samples: int = 1000,
+        quantiles: Sequence[float] = (0.05, 0.5, 0.95),
+        drift_tolerance: Optional[float] = None,
+        tau_modifiers: Optional[Dict[str, float]] = None,
+        rng: Optional[np.random.Generator] = None
+    ) -> DriftEnsemble:
+        """
+        Monte Carlo uncertainty band for the stochastic drift model (Model D).
+        
+        Draws n_samples noisy drifts around the Model A drift in one
+        vectorized operation, instead of calling compute_drift n_samples
+        times. Uses the Model D sigma parameters whether or not the
+        stochastic model is the active one. Does not append to the drift
+        memory.
+        
+        Args:
+            tw_state: Current TW state with all plane inputs
+            n_samples: Ensemble size
+            quantiles: Quantile levels to report
+            drift_tolerance: Threshold for exceedance probabilities (default:
+                tw_state.metadata["drift_tolerance"], then the default regime's)
+            tau_modifiers: Optional modifiers from Tau Layer (e.g. drift_damping)
+            rng: Generator to draw from (default: stochastic_rng())
+            
+        Returns:
+            DriftEnsemble with mean, quantiles and exceedance probabilities
+        """
+        if drift_tolerance is None:
+            metadata = tw_state.metadata or {}
+            drift_tolerance = metadata.get("drift_tolerance", DEFAULT_REGIME["drift_tolerance"])
+        
+        _, severity, _, _, linear_drift = self._drift_inputs(tw_state)
+        
+        damping = 1.0
+        if tau_modifiers:
+            damping = tau_modifiers.get("drift_damping", 1.0)
+            if damping >= 0.99:
+                damping = 1.0
+        
+        return model_d_stochastic_ensemble(
+            base_drift=linear_drift,
+            severity=severity,
+            cfg=self._drift_model_config,
+            tolerance=float(drift_tolerance),
+            n_samples=n_samples,
+            quantiles=quantiles,
+            rng=rng if rng is not None else self.stochastic_rng(),
+            damping=damping,
+        )
+    
+    def _compute_severity_batch(self, tensions: np.ndarray) -> np.ndarray:
+        """
+        Batch _compute_severity_factor from precomputed (N, 3) tensions.
+        """
+        mean_tension = (tensions[:, 0] + tensions[:, 1] + tensions[:, 2]) / 3.0
+        
+        if getattr(self, 'config', {}).get('use_painleve_filter', False):
+            filtered = [self._apply_painleve_filter(float(t)) for t in mean_tension]
+            mean_tension = np.maximum(0.0, np.asarray(filtered, dtype=float))
+        
+        try:
+            severity = severity_from_index_array(mean_tension)
         except Exception:
-            # Never block on memory failure
-            pass
+            severity = 1.0 - np.exp(-mean_tension)
+        
+        return np.clip(severity, 0.0, 1.0)
+    
+    def compute_drift_batch(
+        self,
+        batch: TWStateArray,
+        multiscale_state: Optional[np.ndarray] = None,
+        rng: Optional[np.random.Generator] = None,
+        tau_modifiers: Optional[Dict[str, float]] = None
+    ) -> np.ndarray:
+        """
+        Batch compute_drift over many TW states.
+        
+        Uses the configured drift model with the same selection and fallback
+        rules as compute_drift. Unlike compute_drift, it does not append to
+        the drift memory and does not touch the integrator's own multiscale
+        state.
+        
+        Args:
+            batch: TWStateArray with N states
+            multiscale_state: Per-row multiscale state of shape (N, 3, 2),
+                updated in place (multiscale model only)
+            rng: Generator for the stochastic model (default: seeded from
+                stochastic_seed)
+            tau_modifiers: Optional modifiers from Tau Layer (e.g. drift_damping)
+            
+        Returns:
+            Drift array of shape (N, 3), columns in DRIFT_KEYS order
+            (plane3_to_6, plane6_to_9, plane9_to_3)
+        """
+        tensions = compute_plane_tension_batch(batch)
+        severity = self._compute_severity_batch(tensions)
+        
+        t3, t6, t9 = tensions[:, 0], tensions[:, 1], tensions[:, 2]
+        gradients = np.stack([t6 - t3, t9 - t6, t3 - t9], axis=1)
+        k = np.maximum(1.0, np.abs(gradients).sum(axis=1))
+        
+        linear_drift = model_a_linear_drift_array(gradients, severity, k)
+        
+        core = self._core
+        drift_model = core.drift_model
+        cfg = core.drift_model_config
+        
+        if drift_model == "nonlinear" and cfg.nonlinear_enabled:
+            drift = model_b_nonlinear_drift_array(gradients, severity, cfg, k)
+        elif drift_model == "multiscale" and cfg.multiscale_enabled:
+            drift = model_c_multiscale_drift_array(linear_drift, cfg, multiscale_state)
+        elif drift_model == "stochastic" and cfg.stochastic_enabled:
+            drift = model_d_stochastic_drift_array(linear_drift, severity, cfg, rng)
+        else:
+            drift = linear_drift
         
-        # v2.8: Apply Tau Layer Damping
         if tau_modifiers:
             damping = tau_modifiers.get("drift_damping", 1.0)
             if damping < 0.99:
-                for k in drift:
-                    drift[k] *= damping
+                drift = drift * damping
         
         return drift
     
@@ -348,6 +717,83 @@ class TW369Integrator:
             metadata=tw_state.metadata
         )
 
+    def plane_index(self, state_ids: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Precomputed state→plane index array for a fixed state order.
+        
+        Entry i is the position in PLANE_ORDER of state_ids[i]'s plane
+        (unmapped states default to plane 6, as in evolve). The most recent
+        64 state orders are cached (module-level, shared by integrators).
+        
+        Args:
+            state_ids: State order (default: canonical Δ144 order)
+            
+        Returns:
+            Read-only int array of shape (len(state_ids),)
+        """
+        key = tuple(state_ids) if state_ids is not None else load_delta144_state_ids()
+        return _plane_index_array(key, frozenset(self._state_plane_mapping.items()))
+    
+    def plane_factors(self, drift: Dict[str, float], step_size: float = 1.0) -> np.ndarray:
+        """
+        Per-step multiplicative factors for planes 3, 6, 9 (PLANE_ORDER).
+        
+        Positive drift into a plane increases its states. Drift is scaled by
+        step_size and dampened by 0.5 for stability; factors are clamped to a
+        minimum of 0.1 to avoid collapse.
+        """
+        factors = np.array([1.0 + drift[key] * 0.5 * step_size for key in _PLANE_INFLOW])
+        return np.maximum(factors, 0.1)
+    
+    def evolve_array(
+        self,
+        tw_state: TWState,
+        distribution: np.ndarray,
+        plane_idx: Optional[np.ndarray] = None,
+        time_steps: int = 1,
+        step_size: float = 1.0
+    ) -> np.ndarray:
+        """
+        Array form of evolve() over a fixed-order distribution.
+        
+        The TW state is fixed for the whole call, so drift is computed once
+        and every step applies the same per-plane factors. Since each step is
+        "multiply by factors[plane_idx], then renormalize", k steps collapse
+        into a single exponentiation: normalize(dist * factors[plane_idx] ** k).
+        The weights are computed in log space relative to the heaviest state
+        with mass in each row, so large k can neither overflow nor underflow.
+        
+        Args:
+            tw_state: Current TW state
+            distribution: Array of shape (n,) or (batch, n)
+            plane_idx: Plane index per state (default: canonical Δ144 order)
+            time_steps: Number of discrete time steps to evolve
+            step_size: Size of each time step (default: 1.0)
+            
+        Returns:
+            Evolved distribution(s), same shape as distribution
+        """
+        if plane_idx is None:
+            plane_idx = self.plane_index()
+        
+        drift = self.compute_drift(tw_state)
+        factors = self.plane_factors(drift, step_size)
+        steps = max(1, time_steps)
+        
+        dist = np.maximum(np.asarray(distribution, dtype=float), 0.0)
+        
+        # Work in log space and shift each row by the largest log-weight among
+        # states that carry mass, so long horizons cannot underflow to zero
+        log_weights = np.broadcast_to(steps * np.log(factors)[plane_idx], dist.shape)
+        log_weights = np.where(dist > 0, log_weights, -np.inf)
+        shift = log_weights.max(axis=-1, keepdims=True)
+        shift = np.where(np.isfinite(shift), shift, 0.0)
+        evolved = dist * np.exp(log_weights - shift)
+        
+        # Normalize distribution(s) to maintain probability sum
+        total = evolved.sum(axis=-1, keepdims=True)
+        return np.divide(evolved, total, out=evolved, where=total > 0)
+    
     def evolve(
         self,
         tw_state: TWState,
@@ -358,8 +804,9 @@ class TW369Integrator:
         """
         Evolves the Δ144 distribution over time using TW369 dynamics.
         
-        Applies drift incrementally to modulate archetype probabilities based on
-        which plane they belong to.
+        Applies drift to modulate archetype probabilities based on which
+        plane they belong to. Drift is computed once per call (the TW state
+        does not change between steps); see evolve_array.
         
         Args:
             tw_state: Current TW state
@@ -370,45 +817,21 @@ class TW369Integrator:
         Returns:
             Evolved Δ144 distribution
         """
-        current_dist = delta144_distribution.copy()
-        
-        for _ in range(max(1, time_steps)):
-            # Compute current drift
-            drift = self.compute_drift(tw_state)
-            
-            # Convert drift to multiplicative factors per plane
-            # Positive drift into a plane increases its states
-            # Drift is scaled by step_size and dampened by 0.5 for stability
-            factors = {
-                "3": 1.0 + drift["plane9_to_3"] * 0.5 * step_size,  # Feedback from 9→3
-                "6": 1.0 + drift["plane3_to_6"] * 0.5 * step_size,  # Flow from 3→6
-                "9": 1.0 + drift["plane6_to_9"] * 0.5 * step_size,  # Flow from 6→9
-            }
-            
-            # Clamp factors to prevent negative values
-            for plane in factors:
-                factors[plane] = max(0.1, factors[plane])  # Minimum 0.1 to avoid collapse
-            
-            # Apply factors to distribution based on state-plane mapping
-            new_dist = {}
-            for state_id, value in current_dist.items():
-                # Get plane for this state (default to plane 6 if unmapped)
-                plane = self._state_plane_mapping.get(state_id, "6")
-                factor = factors.get(plane, 1.0)
-                
-                # Apply factor
-                new_val = max(0.0, float(value) * factor)
-                new_dist[state_id] = new_val
-            
-            # Normalize distribution to maintain probability sum
-            total = sum(new_dist.values())
-            if total > 0:
-                for state_id in new_dist:
-                    new_dist[state_id] /= total
-            
-            current_dist = new_dist
+        state_ids = tuple(delta144_distribution.keys())
+        values = np.fromiter(
+            (float(v) for v in delta144_distribution.values()),
+            dtype=float,
+            count=len(state_ids),
+        )
         
-        return current_dist
+        evolved = self.evolve_array(
+            tw_state,
+            values,
+            plane_idx=self.plane_index(state_ids),
+            time_steps=time_steps,
+            step_size=step_size,
+        )
+        return dict(zip(state_ids, evolved.tolist()))
     
     def load_config(self, path="schema/tw369/tw369_default_config.json"):
         """
@@ -446,7 +869,7 @@ class TW369Integrator:
         multiscale = adv.get("multiscale", {})
         stochastic = adv.get("stochastic", {})
 
-        self._drift_model_config = DriftModelConfig(
+        drift_model_config = DriftModelConfig(
             default_model=adv.get("default_model", "model_a"),
             nonlinear_enabled=bool(nonlinear.get("enabled", False)),
             nonlinear_exponent=float(nonlinear.get("exponent", 1.5)),
@@ -465,26 +888,31 @@ class TW369Integrator:
         if config and "drift_model" in config:
             drift_model = str(config["drift_model"])
         else:
-            drift_model = self._drift_model_config.default_model
+            drift_model = drift_model_config.default_model
 
         if drift_model not in ("model_a", "nonlinear", "multiscale", "stochastic"):
             drift_model = "model_a"
 
-        self._drift_model = drift_model
+        # Swap in the new configuration as one immutable core
+        self._core = TW369Core(drift_model=drift_model, drift_model_config=drift_model_config)
+        self._rng = None
 
     def _apply_painleve_filter(self, instability_index: float) -> float:
         return painleve_filter(instability_index)
 
 
 # v2.4: Convenience accessor for drift history
-def get_drift_history():
+def get_drift_history(stream_id: Optional[str] = None):
     """
     Get drift history from module-level memory.
     
+    Args:
+        stream_id: Stream/session id (default stream if None)
+    
     Returns:
         List of DriftState objects (oldest to newest)
     """
-    return _DRIFT_MEMORY.get_history()
+    return _DRIFT_STORE.get_history(stream_id or DriftMemoryStore.DEFAULT_STREAM)
 
 
 # v2.7: Mapping of TW Planes to Polarities
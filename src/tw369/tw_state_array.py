@@ -0,0 +1,141 @@
+"""
+Array-backed TW State for batch scoring.
+
+Stores each plane as a fixed-index (N, 48) stack over the Kindra vector ids
+(E01..M48, shared by all three layers). Vector ids absent from a state's
+plane dict are stored as NaN, so per-plane statistics are computed over the
+same values as the dict-based TWState path. Ids outside E01..M48, which the
+dict path also accepts, get extra columns after the 48 (see extra_ids).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Kindra 48-vector order (schema/kindras/kindra_vectors_layer*_48.json)
+KINDRA_VECTOR_IDS: Tuple[str, ...] = tuple(
+    f"{prefix}{8 * block + i + 1:02d}"
+    for block, prefix in enumerate("ESPTRM")
+    for i in range(8)
+)
+_VECTOR_POSITION = {vector_id: i for i, vector_id in enumerate(KINDRA_VECTOR_IDS)}
+
+
+def _scores_to_vector(scores: Optional[Dict[str, float]], out: np.ndarray) -> List[Tuple[str, float]]:
+    """
+    Write a plane score dict into a NaN-initialized (48,) row.
+
+    Returns:
+        (vector_id, value) pairs of ids outside KINDRA_VECTOR_IDS
+    """
+    unknown = []
+    if not scores:
+        return unknown
+    for vector_id, value in scores.items():
+        pos = _VECTOR_POSITION.get(vector_id)
+        if pos is None:
+            unknown.append((vector_id, float(value)))
+        else:
+            out[pos] = float(value)
+    return unknown
+
+
+@dataclass
+class TWStateArray:
+    """
+    Batch of TW states as fixed-index arrays.
+
+    Attributes:
+        plane3: Layer 1 scores, shape (N, 48 + E), NaN where absent
+        plane6: Layer 2 scores, shape (N, 48 + E), NaN where absent
+        plane9: Layer 3 scores, shape (N, 48 + E), NaN where absent
+        extra_ids: Ids of the E columns after KINDRA_VECTOR_IDS (vector
+            ids outside E01..M48, in first-seen order)
+    """
+    plane3: np.ndarray
+    plane6: np.ndarray
+    plane9: np.ndarray
+    extra_ids: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        self.plane3 = np.atleast_2d(np.asarray(self.plane3, dtype=float))
+        self.plane6 = np.atleast_2d(np.asarray(self.plane6, dtype=float))
+        self.plane9 = np.atleast_2d(np.asarray(self.plane9, dtype=float))
+        if not (self.plane3.shape == self.plane6.shape == self.plane9.shape):
+            raise ValueError("Plane arrays must share the same (N, 48 + E) shape")
+
+    def __len__(self) -> int:
+        return self.plane3.shape[0]
+
+    @classmethod
+    def from_states(cls, states: Sequence) -> "TWStateArray":
+        """
+        Build a batch from TWState objects.
+
+        Args:
+            states: Sequence of TWState
+
+        Returns:
+            TWStateArray with one row per state
+        """
+        n = len(states)
+        planes = np.full((3, n, len(KINDRA_VECTOR_IDS)), np.nan)
+        unknown = []
+        for row, state in enumerate(states):
+            plane_scores = (
+                state.plane3_cultural_macro,
+                state.plane6_semiotic_media,
+                state.plane9_structural_systemic,
+            )
+            for plane, scores in enumerate(plane_scores):
+                for vector_id, value in _scores_to_vector(scores, planes[plane, row]):
+                    unknown.append((plane, row, vector_id, value))
+
+        extra_ids: Tuple[str, ...] = ()
+        if unknown:
+            extra_ids = tuple(dict.fromkeys(vector_id for _, _, vector_id, _ in unknown))
+            position = {vector_id: len(KINDRA_VECTOR_IDS) + i for i, vector_id in enumerate(extra_ids)}
+            grown = np.full((3, n, len(KINDRA_VECTOR_IDS) + len(extra_ids)), np.nan)
+            grown[:, :, :len(KINDRA_VECTOR_IDS)] = planes
+            for plane, row, vector_id, value in unknown:
+                grown[plane, row, position[vector_id]] = value
+            planes = grown
+        return cls(plane3=planes[0], plane6=planes[1], plane9=planes[2], extra_ids=extra_ids)
+
+    def planes(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Plane stacks in TW order (3, 6, 9)."""
+        return self.plane3, self.plane6, self.plane9
+
+
+def compute_tension_batch(scores: np.ndarray) -> np.ndarray:
+    """
+    Tension per row of a (N, 48 + E) NaN-masked plane stack.
+
+    Same formula as TW369Integrator._compute_plane_tension:
+    0.6 * mean(|v|) + 0.4 * std(v), and 0.0 for rows with no scores.
+    """
+    present = ~np.isnan(scores)
+    count = present.sum(axis=1)
+    safe_count = np.maximum(count, 1)
+
+    values = np.where(present, scores, 0.0)
+    energy = np.abs(values).sum(axis=1) / safe_count
+    mean_val = values.sum(axis=1) / safe_count
+    centered = np.where(present, values - mean_val[:, None], 0.0)
+    instability = np.sqrt((centered ** 2).sum(axis=1) / safe_count)
+
+    tension = 0.6 * energy + 0.4 * instability
+    return np.where(count > 0, tension, 0.0)
+
+
+def compute_plane_tension_batch(batch: TWStateArray) -> np.ndarray:
+    """
+    Tensions for planes 3, 6, 9 of every state in the batch.
+
+    Returns:
+        Array of shape (N, 3)
+    """
+    return np.stack([compute_tension_batch(p) for p in batch.planes()], axis=1)
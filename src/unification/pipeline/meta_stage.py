@@ -13,6 +13,8 @@ import logging
 from src.unification.states.unified_state import UnifiedContext, MetaContext
 from src.unification.registry import ModuleRegistry
 from src.meta.types import MetaInput
+from src.meta.analysis_cache import MetaAnalysisCache, get_meta_analysis_cache
+from src.config import KALDRA_META_CACHE_ENABLED
 
 # Import Meta Engines
 from src.meta.nietzsche import NietzscheEngine
@@ -33,14 +35,19 @@ class MetaStage:
     4. Polarity mapping
     """
     
-    def __init__(self, registry: ModuleRegistry):
+    def __init__(self, registry: ModuleRegistry, cache: Optional[MetaAnalysisCache] = None):
         """
         Initialize meta stage.
         
         Args:
             registry: Module registry with loaded engines
+            cache: Optional analysis cache (defaults to the process-wide
+                cache when KALDRA_META_CACHE_ENABLED is set)
         """
         self.registry = registry
+        if cache is None and KALDRA_META_CACHE_ENABLED:
+            cache = get_meta_analysis_cache()
+        self.cache = cache
         # Meta engines will be loaded in future phases
         self.meta_engines_available = False
     
@@ -107,7 +114,7 @@ class MetaStage:
                 else:
                      nietzsche_engine = NietzscheEngine()
                      
-                nietzsche_sig = nietzsche_engine.analyze(meta_input)
+                nietzsche_sig = self._analyze(nietzsche_engine, meta_input)
             except Exception as e:
                 self._warn("NietzscheEngine failed", e)
 
@@ -120,7 +127,7 @@ class MetaStage:
                 else:
                     aurelius_engine = AureliusEngine()
                     
-                aurelius_sig = aurelius_engine.analyze(meta_input)
+                aurelius_sig = self._analyze(aurelius_engine, meta_input)
             except Exception as e:
                 self._warn("AureliusEngine failed", e)
 
@@ -133,7 +140,7 @@ class MetaStage:
                 else:
                     campbell_engine = CampbellEngine()
 
-                campbell_sig = campbell_engine.analyze(meta_input)
+                campbell_sig = self._analyze(campbell_engine, meta_input)
             except Exception as e:
                 self._warn("CampbellEngine failed", e)
 
@@ -152,5 +159,10 @@ class MetaStage:
         
         return context
 
+    def _analyze(self, engine, meta_input: MetaInput):
+        if self.cache is not None:
+            return self.cache.analyze(engine, meta_input)
+        return engine.analyze(meta_input)
+
     def _warn(self, message, exception):
         print(f"[MetaStage Warning] {message}: {exception}")
@@ -2,6 +2,9 @@
 Unit tests for advanced drift models.
 """
 
+import random
+
+import numpy as np
 import pytest
 from src.tw369.advanced_drift_models import (
     DriftModelConfig,
@@ -10,6 +13,7 @@ from src.tw369.advanced_drift_models import (
     model_b_nonlinear_drift,
     model_c_multiscale_drift,
     model_d_stochastic_drift,
+    model_d_stochastic_ensemble,
 )
 
 
@@ -86,3 +90,50 @@ class TestAdvancedDriftModels:
         assert drift["plane3_to_6"] > 0.0
         assert drift["plane6_to_9"] < 0.0
         assert drift["plane9_to_3"] > 0.0
+
+    def test_model_d_does_not_touch_global_random_state(self):
+        cfg = DriftModelConfig(stochastic_enabled=True, stochastic_seed=42)
+        base = {"plane3_to_6": 0.1, "plane6_to_9": 0.2, "plane9_to_3": -0.1}
+
+        random.seed(7)
+        expected = random.random()
+        random.seed(7)
+        model_d_stochastic_drift(base, severity=0.7, cfg=cfg)
+        model_d_stochastic_ensemble(base, severity=0.7, cfg=cfg, tolerance=0.5, n_samples=10)
+
+        assert random.random() == expected
+
+    def test_model_d_ensemble_summarizes_samples(self):
+        cfg = DriftModelConfig(
+            stochastic_enabled=True,
+            stochastic_base_sigma=0.1,
+            stochastic_severity_scale=0.5,
+        )
+        base = {"plane3_to_6": 0.45, "plane6_to_9": 0.0, "plane9_to_3": -2.0}
+
+        ens = model_d_stochastic_ensemble(
+            base,
+            severity=1.0,
+            cfg=cfg,
+            tolerance=0.5,
+            n_samples=20000,
+            rng=np.random.default_rng(0),
+        )
+
+        assert ens.n_samples == 20000
+        assert ens.mean["plane3_to_6"] == pytest.approx(0.45, abs=0.01)
+        assert ens.quantiles[0.05]["plane6_to_9"] < 0.0 < ens.quantiles[0.95]["plane6_to_9"]
+        # sigma = 0.15: P(N(0.45, 0.15) > 0.5) ~ 0.37
+        assert ens.exceedance["plane3_to_6"] == pytest.approx(0.37, abs=0.02)
+        assert ens.exceedance["plane6_to_9"] < 0.01
+        assert ens.exceedance["plane9_to_3"] == 1.0
+        assert ens.exceedance_any == 1.0
+
+    def test_model_d_ensemble_rejects_invalid_arguments(self):
+        cfg = DriftModelConfig()
+        base = {"plane3_to_6": 0.1, "plane6_to_9": 0.2, "plane9_to_3": -0.1}
+
+        with pytest.raises(ValueError):
+            model_d_stochastic_ensemble(base, 0.5, cfg, tolerance=0.5, n_samples=0)
+        with pytest.raises(ValueError):
+            model_d_stochastic_ensemble(base, 0.5, cfg, tolerance=0.5, quantiles=(1.5,))
@@ -1,6 +1,10 @@
 import numpy as np
 
-from src.archetypes.api_adapter import infer_state, evaluate_sequence_stability
+from src.archetypes.api_adapter import (
+    infer_state,
+    evaluate_sequence_stability,
+    evaluate_sequence_stability_batch,
+)
 
 
 def test_infer_state_runs():
@@ -15,3 +19,13 @@ def test_evaluate_sequence_stability_runs():
     result = evaluate_sequence_stability(seq)
     assert "stability_score" in result
     assert 0.0 <= result["stability_score"] <= 1.0
+
+
+def test_evaluate_sequence_stability_batch_matches_single():
+    batch = np.random.randn(3, 6, 144)
+    results = evaluate_sequence_stability_batch(batch, tau=0.4)
+
+    for seq, result in zip(batch, results):
+        single = evaluate_sequence_stability(list(seq), tau=0.4)
+        assert abs(result["stability_score"] - single["stability_score"]) < 1e-12
+        assert result["tau"] == 0.4
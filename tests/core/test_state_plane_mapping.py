@@ -135,3 +135,94 @@ class TestAdaptiveStatePlaneMapping:
         assert "severity_class" in meta
         assert "shift_factor" in meta
         assert "baseline" in meta
+
+
+def _reference_weights(mapper, ctx):
+    """Original rule chain of infer_mapping, kept as the reference."""
+    baseline = mapper._get_baseline_for_domain(ctx.domain)
+    sev_class = mapper._classify_severity(ctx.severity)
+    shift_factor = mapper._compute_shift_factor(ctx.severity)
+    w3, w6, w9 = baseline.plane3, baseline.plane6, baseline.plane9
+
+    if ctx.domain == "ALPHA":
+        if sev_class in ("high", "extreme"):
+            take_from_3 = min(shift_factor, w3)
+            w3 -= take_from_3 * 0.7
+            w6 += take_from_3 * 0.5
+            w9 += take_from_3 * 0.2
+    elif ctx.domain == "GEO":
+        if sev_class in ("medium", "high", "extreme") or ctx.time_horizon == "long":
+            take = min(shift_factor, (w3 + w6) * 0.5)
+            w3 -= take * 0.4
+            w6 -= take * 0.6
+            w9 += take
+    elif ctx.domain == "PRODUCT":
+        if ctx.time_horizon == "short" and sev_class in ("medium", "high"):
+            take_from_9 = min(shift_factor, w9)
+            w9 -= take_from_9
+            w3 += take_from_9 * 0.6
+            w6 += take_from_9 * 0.4
+    elif ctx.domain == "SAFEGUARD":
+        if sev_class in ("high", "extreme") or ctx.narrative_type == "crisis":
+            take_from_3 = min(shift_factor, w3)
+            w3 -= take_from_3
+            w6 += take_from_3 * 0.5
+            w9 += take_from_3 * 0.5
+    else:
+        if sev_class in ("high", "extreme"):
+            take_from_3 = min(shift_factor, w3)
+            w3 -= take_from_3 * 0.5
+            w6 += take_from_3 * 0.5
+
+    weights = mapper._normalize_weights(PlaneWeights(max(0.0, w3), max(0.0, w6), max(0.0, w9)))
+    return weights, sev_class, shift_factor, baseline
+
+
+@pytest.mark.parametrize("max_shift", [0.3, 2.0])
+def test_compiled_mapping_matches_rules_exhaustively(max_shift):
+    cfg = _make_default_config()
+    cfg["max_shift"] = max_shift
+    cfg["domains"]["CUSTOM"] = {"plane3": 0.1, "plane6": 0.1, "plane9": 0.8}
+    mapper = AdaptiveStatePlaneMapper(cfg)
+
+    contexts = [
+        AdaptiveMappingContext(
+            domain=domain,
+            severity=severity,
+            time_horizon=horizon,
+            narrative_type=narrative,
+        )
+        for domain in ["ALPHA", "GEO", "PRODUCT", "SAFEGUARD", "DEFAULT", "CUSTOM", "UNKNOWN"]
+        for severity in [-0.5, 0.0, 0.1, 0.29, 0.3, 0.45, 0.6, 0.7, 0.8, 0.95, 1.0, 1.5]
+        for horizon in ["short", "medium", "long", "decade"]
+        for narrative in [None, "crisis", "optimistic"]
+    ]
+    batch = mapper.infer_mapping_batch(contexts)
+
+    for ctx, batched in zip(contexts, batch):
+        weights, sev_class, shift_factor, baseline = _reference_weights(mapper, ctx)
+        res = mapper.infer_mapping(ctx)
+
+        assert res.plane_weights == weights
+        assert batched.plane_weights == weights
+        assert res.metadata == batched.metadata
+        assert res.metadata["severity_class"] == sev_class
+        assert res.metadata["shift_factor"] == shift_factor
+        assert res.metadata["baseline"] == {
+            "plane3": baseline.plane3,
+            "plane6": baseline.plane6,
+            "plane9": baseline.plane9,
+        }
+
+
+def test_plane_weights_batch_defaults_and_missing_domains():
+    cfg = _make_default_config()
+    del cfg["domains"]["ALPHA"]
+    mapper = AdaptiveStatePlaneMapper(cfg)
+
+    weights = mapper.plane_weights_batch(["ALPHA", "GEO"], [0.9, 0.2])
+
+    assert weights.shape == (2, 3)
+    for row, (domain, severity) in enumerate([("ALPHA", 0.9), ("GEO", 0.2)]):
+        ref, _, _, _ = _reference_weights(mapper, AdaptiveMappingContext(domain=domain, severity=severity))
+        assert tuple(weights[row]) == (ref.plane3, ref.plane6, ref.plane9)
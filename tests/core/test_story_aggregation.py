@@ -1,6 +1,6 @@
 import numpy as np
 
-from src.core.story_aggregator import StoryAggregator, StoryTurnSignal
+from src.core.story_aggregator import IncrementalStoryAggregate, StoryAggregator, StoryTurnSignal
 from src.core.story_tracker import StoryTracker
 
 
@@ -118,3 +118,115 @@ def test_story_turn_signal_from_signal():
     assert sts.archetype_probs.shape[0] == 144
     assert sts.delta_state is not None
     assert sts.delta_state.get("id") == "S42"
+
+
+def test_incremental_aggregate_matches_full_aggregation():
+    rng = np.random.default_rng(7)
+    tracker = StoryTracker(aggregator=StoryAggregator(top_k_archetypes=3))
+    sid = tracker.create_story()
+
+    for i in range(60):
+        probs = np.zeros(144, dtype=np.float32)
+        # Few archetypes so counts tie and the top-k order changes
+        probs[int(rng.choice([3, 7, 11, 42, 99]))] = float(rng.uniform(0.2, 1.0))
+        tracker.add_turn(
+            story_id=sid,
+            role="user" if i % 2 == 0 else "assistant",
+            text=f"Turn {i}.",
+            signal=DummySignal(
+                probs,
+                delta_state={"id": f"S{i % 4}", "profile": "EXPANSIVE"} if i % 3 else None,
+                tw_trigger=bool(rng.random() < 0.4),
+                tw_severity=float(rng.random()),
+            ),
+            timestamp=f"2025-11-27T10:{i:02d}:00Z",
+        )
+        if i % 5 == 0:
+            payload = [t.to_payload() for t in tracker.get_story_turns(sid)]
+            assert tracker.aggregate_story(sid) == tracker.aggregator.aggregate(sid, payload)
+
+    assert tracker.aggregate_story(sid) == tracker.rebuild_story(sid)
+
+
+def test_incremental_state_counters():
+    state = IncrementalStoryAggregate("story-1", StoryAggregator(top_k_archetypes=2))
+    assert state.aggregate()["dominant_archetypes"] == []
+    assert state.narrative_coherence == 0.0
+
+    for i, (idx, trigger) in enumerate([(1, True), (2, True), (2, True), (1, False), (3, None)]):
+        probs = np.zeros(144, dtype=np.float32)
+        probs[idx] = 0.5
+        state.add_turn({
+            "turn_index": i,
+            "timestamp": "2025-11-27T10:00:00Z",
+            "role": "user",
+            "text": "x",
+            "signal": DummySignal(probs, tw_trigger=trigger),
+        })
+
+    assert state.archetype_counts == {1: 2, 2: 2, 3: 1}
+    assert state.dominant_archetypes == [1, 2]
+    assert state.max_tw_trigger_run == 3
+    assert state.tw_regime is None
+    assert state.tw_run_length == 1
+
+
+def test_tracker_reset_drops_incremental_state():
+    tracker = StoryTracker()
+    sid = tracker.create_story()
+    probs = np.zeros(144, dtype=np.float32)
+    probs[5] = 1.0
+
+    tracker.add_turn(story_id=sid, role="user", text="a", signal=DummySignal(probs))
+    assert len(tracker.aggregate_story(sid)["turns"]) == 1
+
+    tracker.reset_story(sid)
+    tracker.add_turn(story_id=sid, role="user", text="b", signal=DummySignal(probs))
+    story = tracker.aggregate_story(sid)
+    assert [t["text"] for t in story["turns"]] == ["b"]
+
+
+def test_incremental_aggregate_returns_snapshots():
+    state = IncrementalStoryAggregate("story-1", StoryAggregator())
+    probs = np.zeros(144, dtype=np.float32)
+    probs[7] = 0.8
+
+    def turn(i):
+        return {
+            "turn_index": i,
+            "timestamp": "2025-11-27T10:00:00Z",
+            "role": "user",
+            "text": f"t{i}",
+            "signal": DummySignal(probs),
+        }
+
+    state.add_turn(turn(0))
+    first = state.aggregate()
+    first["turns"].append({"text": "caller edit"})
+    state.add_turn(turn(1))
+
+    assert len(first["coherence_trace"]) == 1
+    assert len(state) == 2
+    assert [t["text"] for t in state.aggregate()["turns"]] == ["t0", "t1"]
+
+
+def test_tracker_aggregate_only_folds_new_turns(monkeypatch):
+    from src.core.story_tracker import StoryTurn
+
+    tracker = StoryTracker()
+    sid = tracker.create_story()
+    probs = np.zeros(144, dtype=np.float32)
+    probs[2] = 0.7
+    for text in ("a", "b", "c"):
+        tracker.add_turn(story_id=sid, role="user", text=text, signal=DummySignal(probs))
+    tracker.aggregate_story(sid)
+
+    calls = []
+    original = StoryTurn.to_payload
+    monkeypatch.setattr(StoryTurn, "to_payload", lambda self: calls.append(1) or original(self))
+    tracker.add_turn(story_id=sid, role="user", text="d", signal=DummySignal(probs))
+    story = tracker.aggregate_story(sid)
+
+    # Only the new turn is converted, earlier turns are not revisited
+    assert len(calls) == 1
+    assert [t["text"] for t in story["turns"]] == ["a", "b", "c", "d"]
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from src.core.story_aggregator import TW_REGIME_STABLE, TW_REGIME_TRIGGERED
+from src.core.story_index import StoryIndex, timestamp_seconds
+from src.core.story_store import TieredStoryStore
+from src.core.story_tracker import StoryTracker
+
+
+class Signal:
+    def __init__(self, idx: int, tw_trigger: bool = False, stage: str | None = None) -> None:
+        self.archetype_probs = np.zeros(144, dtype=np.float32)
+        self.archetype_probs[idx] = 0.9
+        self.tw_trigger = tw_trigger
+        self.meta_scores = {"campbell": {"stage": stage}} if stage else None
+
+
+def ts(minute: int) -> str:
+    return f"2025-11-27T10:{minute:02d}:00+00:00"
+
+
+def test_tracker_maintains_indexes():
+    tracker = StoryTracker()
+    a = tracker.create_story("a")
+    b = tracker.create_story("b")
+
+    tracker.add_turn(a, "user", "x", Signal(7, stage="ORDEAL"), timestamp=ts(0))
+    tracker.add_turn(a, "user", "y", Signal(7, tw_trigger=True), timestamp=ts(5))
+    tracker.add_turn(b, "user", "z", Signal(3, stage="CALL_TO_ADVENTURE"), timestamp=ts(10))
+
+    # Stage persists across turns that do not report one
+    assert tracker.query_stories(stage="ORDEAL").story_ids == ["a"]
+    assert tracker.query_stories(archetype=7, tw_regime=TW_REGIME_TRIGGERED).story_ids == ["a"]
+    assert tracker.query_stories(tw_regime=TW_REGIME_STABLE).story_ids == ["b"]
+    assert tracker.query_stories(since=timestamp_seconds(ts(6))).story_ids == ["b"]
+    assert tracker.query_stories(until=timestamp_seconds(ts(6))).story_ids == ["a"]
+    assert tracker.query_stories().story_ids == ["b", "a"]
+
+    # Dominant archetype moves with the counts
+    tracker.add_turn(a, "user", "w", Signal(3), timestamp=ts(11))
+    tracker.add_turn(a, "user", "v", Signal(3), timestamp=ts(12))
+    assert tracker.query_stories(archetype=7).story_ids == ["a"]  # tie: first seen wins
+    tracker.add_turn(a, "user", "u", Signal(3), timestamp=ts(13))
+    assert tracker.query_stories(archetype=3).story_ids == ["a", "b"]
+    assert tracker.query_stories(archetype=7).total == 0
+
+    tracker.reset_story(a)
+    assert tracker.query_stories(archetype=3).story_ids == ["b"]
+    tracker.delete_story(b)
+    assert tracker.query_stories().total == 0
+    assert tracker.index.counts("archetype") == {}
+
+
+def test_query_pagination():
+    index = StoryIndex(bucket_seconds=60)
+    for i in range(25):
+        index.update(f"s{i:02d}", archetype=i % 2, stage=None, tw_regime=None, last_seen=float(i))
+
+    pages = []
+    offset = 0
+    while offset is not None:
+        page = index.query(archetype=0, offset=offset, limit=5)
+        pages.append(page.story_ids)
+        offset = page.next_offset
+
+    assert page.total == 13
+    assert len(pages) == 3
+    assert sum(pages, []) == [f"s{i:02d}" for i in range(24, -1, -2)]
+
+    with pytest.raises(ValueError):
+        index.query(offset=-1)
+
+
+def test_bad_signal_is_not_indexed():
+    tracker = StoryTracker()
+    sid = tracker.create_story()
+    tracker.add_turn(sid, "user", "x", object(), timestamp=ts(0))
+
+    assert sid not in tracker.index
+    with pytest.raises(ValueError):
+        tracker.aggregate_story(sid)
+
+
+def test_spilled_stories_stay_queryable_after_restart(tmp_path):
+    path = tmp_path / "stories.db"
+    tracker = StoryTracker(store=TieredStoryStore(hot_bytes=1, spill_path=path))
+    for i, sid in enumerate(["a", "b", "c"]):
+        tracker.create_story(sid)
+        tracker.add_turn(sid, "user", "x", Signal(7, tw_trigger=i == 1, stage="ORDEAL"),
+                         timestamp=ts(i))
+    tracker.create_story("d")
+    tracker.reset_story("c")
+    tracker.store.close()
+
+    reopened = StoryTracker(store=TieredStoryStore(spill_path=path))
+    assert reopened.query_stories(archetype=7).story_ids == ["b", "a"]
+    assert reopened.query_stories(tw_regime=TW_REGIME_TRIGGERED).story_ids == ["b"]
+    assert reopened.query_stories(stage="ORDEAL", since=timestamp_seconds(ts(1))).story_ids == ["b"]
+    assert "c" not in reopened.index
+
+    # Loading a story moves it back to the hot tier, indexed keys unchanged
+    reopened.add_turn("a", "user", "y", Signal(7), timestamp=ts(9))
+    assert reopened.query_stories(archetype=7).story_ids == ["a", "b"]
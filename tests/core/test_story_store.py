@@ -0,0 +1,173 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from src.core.story_store import TieredStoryStore
+from src.core.story_tracker import StoryTracker
+
+
+class Signal:
+    def __init__(self, idx: int) -> None:
+        self.archetype_probs = np.zeros(144, dtype=np.float32)
+        self.archetype_probs[idx] = 0.9
+        self.tw_trigger = False
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def fill(tracker: StoryTracker, sid: str, n: int, idx: int = 4) -> None:
+    for i in range(n):
+        tracker.add_turn(sid, role="user", text=f"turn {i}", signal=Signal(idx))
+
+
+def test_byte_budget_spills_lru_and_reloads(tmp_path):
+    store = TieredStoryStore(hot_bytes=20_000, spill_path=tmp_path / "stories.db")
+    tracker = StoryTracker(store=store)
+
+    sids = [tracker.create_story(f"s{i}") for i in range(5)]
+    for i, sid in enumerate(sids):
+        fill(tracker, sid, 3, idx=i)
+        tracker.aggregate_story(sid)
+
+    stats = tracker.stats()
+    assert stats["hot_bytes"] <= 20_000
+    assert stats["spills"] > 0
+    assert stats["hot_stories"] + stats["cold_stories"] == 5
+    assert "s0" not in store.hot_ids()
+
+    # Spilled story comes back with turns and aggregate state
+    story = tracker.aggregate_story("s0")
+    assert [t["text"] for t in story["turns"]] == ["turn 0", "turn 1", "turn 2"]
+    assert story["dominant_archetypes"] == [0]
+    assert story == tracker.rebuild_story("s0")
+    assert tracker.stats()["cold_hits"] >= 1
+    assert tracker.list_story_ids() == sids
+
+
+def test_idle_stories_are_spilled(tmp_path):
+    clock = FakeClock()
+    store = TieredStoryStore(spill_path=tmp_path / "stories.db", idle_seconds=60, clock=clock)
+    tracker = StoryTracker(store=store)
+
+    tracker.create_story("old")
+    fill(tracker, "old", 2)
+    clock.now = 30.0
+    tracker.create_story("new")
+    fill(tracker, "new", 1)
+
+    clock.now = 100.0
+    assert tracker.evict_idle() == 1
+    assert store.hot_ids() == ["new"]
+
+    fill(tracker, "old", 1)
+    assert len(tracker.get_story_turns("old")) == 3
+
+
+def test_unpicklable_story_stays_hot(tmp_path):
+    store = TieredStoryStore(hot_bytes=1, spill_path=tmp_path / "stories.db")
+    tracker = StoryTracker(store=store)
+
+    tracker.create_story("a")
+    signal = Signal(1)
+    signal.callback = lambda: None
+    tracker.add_turn("a", role="user", text="x", signal=signal)
+    tracker.create_story("b")
+
+    assert "a" in store.hot_ids()
+    assert tracker.stats()["spill_errors"] >= 1
+
+
+def test_failed_spill_write_keeps_story_hot(tmp_path, monkeypatch):
+    import sqlite3
+
+    store = TieredStoryStore(hot_bytes=1, spill_path=tmp_path / "stories.db")
+    tracker = StoryTracker(store=store)
+
+    def disk_full(record):
+        raise sqlite3.OperationalError("database or disk is full")
+
+    monkeypatch.setattr(store._cold, "put", disk_full)
+    tracker.create_story("a")
+    fill(tracker, "a", 2)
+    tracker.create_story("b")
+
+    assert store.hot_ids() == ["a", "b"]
+    assert tracker.list_story_ids() == ["a", "b"]
+    assert len(tracker.get_story_turns("a")) == 2
+    assert store.nbytes == sum(r.nbytes for r in store._hot.values())
+    assert tracker.stats()["spill_errors"] >= 1
+
+
+def test_spilled_stories_survive_restart(tmp_path):
+    path = tmp_path / "stories.db"
+    store = TieredStoryStore(hot_bytes=1, spill_path=path)
+    tracker = StoryTracker(store=store)
+    tracker.create_story("a")
+    fill(tracker, "a", 2)
+    tracker.create_story("b")
+    store.close()
+
+    reopened = StoryTracker(store=TieredStoryStore(spill_path=path))
+    assert reopened.list_story_ids() == ["a"]
+    assert len(reopened.get_story_turns("a")) == 2
+    assert reopened.create_story("c") == "c"
+    assert reopened.list_story_ids() == ["a", "c"]
+
+
+def test_unknown_and_deleted_stories(tmp_path):
+    tracker = StoryTracker(store=TieredStoryStore(hot_bytes=1, spill_path=tmp_path / "s.db"))
+    with pytest.raises(KeyError):
+        tracker.add_turn("missing", role="user", text="x", signal=Signal(0))
+
+    tracker.create_story("a")
+    tracker.create_story("b")
+    tracker.delete_story("a")
+    assert tracker.list_story_ids() == ["b"]
+    assert tracker.get_story_turns("a") == []
+    assert tracker.stats()["misses"] >= 2
+
+
+def test_bounds_require_spill_path():
+    with pytest.raises(ValueError):
+        TieredStoryStore(hot_bytes=1000)
+
+
+def test_concurrent_turns_under_spill_pressure(tmp_path):
+    store = TieredStoryStore(hot_bytes=10_000, spill_path=tmp_path / "stories.db")
+    tracker = StoryTracker(store=store)
+    sids = [tracker.create_story(f"s{i}") for i in range(8)]
+
+    def run(sid):
+        for i in range(25):
+            tracker.add_turn(sid, role="user", text=f"turn {i}", signal=Signal(i % 3))
+            tracker.aggregate_story(sid)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(run, sids))
+
+    # No turn was appended to a record after it was spilled
+    for sid in sids:
+        assert len(tracker.get_story_turns(sid)) == 25
+        assert len(tracker.aggregate_story(sid)["turns"]) == 25
+    assert store.nbytes == sum(r.nbytes for r in store._hot.values())
+    assert store.stats()["spills"] > 0
+
+
+def test_default_store_follows_config(tmp_path, monkeypatch):
+    import src.config as config
+
+    monkeypatch.setattr(config, "KALDRA_STORY_SPILL_PATH", str(tmp_path / "stories.db"))
+    monkeypatch.setattr(config, "KALDRA_STORY_HOT_BYTES", 1)
+    tracker = StoryTracker()
+    tracker.create_story("a")
+    tracker.create_story("b")
+
+    assert tracker.store.hot_bytes == 1
+    assert tracker.stats()["cold_stories"] == 1
@@ -5,6 +5,8 @@ Tests the complete drift calculation and temporal evolution functionality.
 """
 
 import math
+
+import numpy as np
 import pytest
 from src.tw369.tw369_integration import TW369Integrator, TWState
 
@@ -220,6 +222,103 @@ class TestTW369DriftMathematics:
             assert not math.isinf(value), "Distribution contains inf"
             assert value >= 0, "Distribution contains negative values"
 
+    def test_evolve_closed_form_matches_stepwise(self):
+        """Test that k collapsed steps equal k applications of one step."""
+        integrator = TW369Integrator()
+        tw_state = TWState(
+            plane3_cultural_macro={"E01": 0.8, "S09": 0.6},
+            plane6_semiotic_media={"E01": 0.2},
+            plane9_structural_systemic={"E01": 0.5}
+        )
+        initial_dist = {"Lover": 0.2, "Hero": 0.3, "Sage": 0.4, "Unmapped": 0.1}
+        
+        stepwise = dict(initial_dist)
+        for _ in range(12):
+            stepwise = integrator.evolve(tw_state, stepwise, time_steps=1, step_size=0.5)
+        collapsed = integrator.evolve(tw_state, initial_dist, time_steps=12, step_size=0.5)
+        
+        for state_id in initial_dist:
+            assert collapsed[state_id] == pytest.approx(stepwise[state_id], rel=1e-9, abs=1e-15)
+    
+    def test_evolve_array_batch(self):
+        """Test batched evolution over the canonical Δ144 order."""
+        import numpy as np
+        from src.tw369.tw369_integration import load_delta144_state_ids
+        
+        integrator = TW369Integrator()
+        tw_state = TWState(
+            plane3_cultural_macro={"E01": 0.7},
+            plane6_semiotic_media={"E01": 0.3},
+            plane9_structural_systemic={"E01": 0.5}
+        )
+        state_ids = load_delta144_state_ids()
+        assert len(state_ids) == 144
+        assert integrator.plane_index().shape == (144,)
+        
+        rng = np.random.default_rng(0)
+        batch = rng.random((4, 144))
+        evolved = integrator.evolve_array(tw_state, batch, time_steps=3)
+        
+        assert evolved.shape == (4, 144)
+        assert np.allclose(evolved.sum(axis=1), 1.0)
+        
+        # Each row matches the dict-based path
+        row = integrator.evolve(tw_state, dict(zip(state_ids, batch[2])), time_steps=3)
+        assert np.allclose(evolved[2], [row[s] for s in state_ids])
+    
+    def test_evolve_long_horizon_is_finite(self):
+        """Test that very long horizons do not overflow."""
+        integrator = TW369Integrator()
+        tw_state = TWState(
+            plane3_cultural_macro={"E01": 1.0},
+            plane6_semiotic_media={"E01": 0.0},
+            plane9_structural_systemic={"E01": 0.0}
+        )
+        evolved = integrator.evolve(tw_state, {"Lover": 0.5, "Hero": 0.5}, time_steps=100000)
+        assert all(math.isfinite(v) for v in evolved.values())
+        assert abs(sum(evolved.values()) - 1.0) < 1e-9
+
+    def test_evolve_long_horizon_mass_outside_max_plane(self):
+        """Test long horizons when no mass is in the fastest-growing plane."""
+        integrator = TW369Integrator()
+        tw_state = TWState(
+            plane3_cultural_macro={"E01": 1.0},
+            plane6_semiotic_media={"E01": 0.0},
+            plane9_structural_systemic={"E01": 0.0}
+        )
+        evolved = integrator.evolve(tw_state, {"Hero": 0.5, "Sage": 0.5}, time_steps=100000)
+        stepwise = {"Hero": 0.5, "Sage": 0.5}
+        for _ in range(200):
+            stepwise = integrator.evolve(tw_state, stepwise, time_steps=1)
+        assert abs(sum(evolved.values()) - 1.0) < 1e-9
+        assert max(evolved, key=evolved.get) == max(stepwise, key=stepwise.get)
+
+        single = integrator.evolve(tw_state, {"Hero": 1.0}, time_steps=100000)
+        assert single == {"Hero": 1.0}
+
+        batch = integrator.evolve_array(
+            tw_state, np.array([[0.0, 0.0], [0.5, 0.5]]),
+            plane_idx=integrator.plane_index(("Hero", "Sage")), time_steps=100000
+        )
+        assert np.array_equal(batch[0], [0.0, 0.0])
+        assert abs(batch[1].sum() - 1.0) < 1e-9
+
+    def test_plane_index_cache_is_shared_and_bounded(self):
+        """Test that plane index arrays live in a bounded module-level cache."""
+        from src.tw369.tw369_integration import _plane_index_array
+
+        first, second = TW369Integrator(), TW369Integrator()
+        index = first.plane_index(("Lover", "Hero", "Sage", "Unknown"))
+
+        assert index.tolist() == [0, 1, 2, 1]
+        assert not index.flags.writeable
+        assert second.plane_index(("Lover", "Hero", "Sage", "Unknown")) is index
+        assert not hasattr(first, "_plane_index_cache")
+
+        for i in range(200):
+            first.plane_index(tuple(f"S{j}" for j in range(i % 8 + 1)) + (str(i),))
+        assert _plane_index_array.cache_info().currsize <= _plane_index_array.cache_info().maxsize
+
 
 if __name__ == "__main__":
     import math
@@ -52,3 +52,52 @@ def test_validate_tw369_config_dict_missing_key():
     }
     with pytest.raises(ValueError):
         validate_tw369_config_dict(cfg)
+
+
+def test_validator_is_compiled_once():
+    """Test that repeated validation reuses the cached validator."""
+    from src.tw369.runtime_validation import SCHEMA_DIR, TW_STATE_SCHEMA, get_validator
+
+    first = get_validator(SCHEMA_DIR / TW_STATE_SCHEMA)
+    second = get_validator(SCHEMA_DIR / TW_STATE_SCHEMA)
+    if first is None:
+        pytest.skip("jsonschema not available")
+    assert first is second
+
+
+def test_validate_many_reports_per_item_errors():
+    """Test batch validation returns one result per item."""
+    from src.tw369.runtime_validation import validate_many
+
+    good = {
+        "plane3_cultural_macro": {"E01": 0.5},
+        "plane6_semiotic_media": {"E01": -0.2},
+        "plane9_structural_systemic": {"E01": 0.1},
+    }
+    bad = {"plane3_cultural_macro": {"E01": 0.5}}
+
+    errors = validate_many([good, bad, good])
+    assert len(errors) == 3
+    assert errors[0] is None and errors[2] is None
+    assert isinstance(errors[1], Exception)
+
+    with pytest.raises(ValueError):
+        validate_many([good], kind="unknown")
+
+
+def test_fast_mode_is_structural_only():
+    """Test fast mode skips schema checks but keeps structural checks."""
+    from src.tw369.runtime_validation import validate_many
+
+    wrong_types = {
+        "plane3_cultural_macro": {"E01": "not-a-number"},
+        "plane6_semiotic_media": {},
+        "plane9_structural_systemic": {},
+    }
+    validate_tw_state_dict(wrong_types, fast=True)
+
+    with pytest.raises(ValueError):
+        validate_tw_state_dict({"plane3_cultural_macro": {}}, fast=True)
+
+    errors = validate_many([wrong_types], fast=True)
+    assert errors == [None]
@@ -2,8 +2,12 @@
 Integration tests for TW369 advanced drift model selection.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError, replace
+
+import numpy as np
 import pytest
-from src.tw369.tw369_integration import TW369Integrator, TWState
+from src.tw369.tw369_integration import DriftStreamState, TW369Integrator, TWState
 
 
 def _make_dummy_state() -> TWState:
@@ -34,8 +38,9 @@ class TestTW369AdvancedDriftSelection:
 
         # Manually override config fields
         integrator._drift_model = "nonlinear"
-        cfg = integrator._drift_model_config
-        cfg.nonlinear_enabled = True
+        integrator._drift_model_config = replace(
+            integrator._drift_model_config, nonlinear_enabled=True
+        )
 
         result_nl = integrator.compute_drift(state)
         assert isinstance(result_nl, dict)
@@ -51,8 +56,9 @@ class TestTW369AdvancedDriftSelection:
 
         # Enable multiscale
         integrator._drift_model = "multiscale"
-        cfg = integrator._drift_model_config
-        cfg.multiscale_enabled = True
+        integrator._drift_model_config = replace(
+            integrator._drift_model_config, multiscale_enabled=True
+        )
 
         result1 = integrator.compute_drift(state)
         result2 = integrator.compute_drift(state)
@@ -70,15 +76,20 @@ class TestTW369AdvancedDriftSelection:
 
         # Enable stochastic with seed
         integrator._drift_model = "stochastic"
-        cfg = integrator._drift_model_config
-        cfg.stochastic_enabled = True
-        cfg.stochastic_seed = 123
+        integrator._drift_model_config = replace(
+            integrator._drift_model_config, stochastic_enabled=True, stochastic_seed=123
+        )
 
         result1 = integrator.compute_drift(state)
         result2 = integrator.compute_drift(state)
+        replay = TW369Integrator()
+        replay._drift_model = "stochastic"
+        replay._drift_model_config = integrator._drift_model_config
 
-        # With seed, results should be reproducible
-        assert result1 == result2
+        # Successive calls draw fresh noise; a new seeded integrator replays it
+        assert result1 != result2
+        assert replay.compute_drift(state) == result1
+        assert replay.compute_drift(state) == result2
 
     def test_tw369_integrator_fallback_to_model_a_on_invalid_model(self):
         integrator = TW369Integrator()
@@ -96,3 +107,142 @@ class TestTW369AdvancedDriftSelection:
             "plane6_to_9",
             "plane9_to_3",
         }
+
+    def test_tw369_integrator_drift_ensemble_uses_own_generator(self):
+        integrator = TW369Integrator()
+        state = _make_dummy_state()
+        integrator._drift_model_config = replace(integrator._drift_model_config, stochastic_seed=5)
+
+        first = integrator.compute_drift_ensemble(state, n_samples=500)
+        second = integrator.compute_drift_ensemble(state, n_samples=500)
+        replay = TW369Integrator()
+        replay._drift_model_config = replace(replay._drift_model_config, stochastic_seed=5)
+
+        # Successive ensembles continue the generator; a new integrator replays it
+        assert first.mean != second.mean
+        assert replay.compute_drift_ensemble(state, n_samples=500).mean == first.mean
+        assert set(first.exceedance.keys()) == {
+            "plane3_to_6",
+            "plane6_to_9",
+            "plane9_to_3",
+        }
+        assert first.tolerance == 0.5
+
+    def test_tw369_integrator_drift_ensemble_mean_matches_linear_drift(self):
+        integrator = TW369Integrator()
+        state = _make_dummy_state()
+
+        linear = integrator.compute_drift(state)
+        ens = integrator.compute_drift_ensemble(
+            state, n_samples=20000, rng=np.random.default_rng(1)
+        )
+
+        for key, value in linear.items():
+            assert ens.mean[key] == pytest.approx(value, abs=0.005)
+
+    def test_compute_drift_step_is_copy_on_write(self):
+        integrator = TW369Integrator()
+        integrator._drift_model = "multiscale"
+        integrator._drift_model_config = replace(integrator._drift_model_config, multiscale_enabled=True)
+        state = _make_dummy_state()
+
+        drift1, s1 = integrator.compute_drift_step(state)
+        drift2, s2 = integrator.compute_drift_step(state, s1)
+        replay, _ = integrator.compute_drift_step(state, s1)
+
+        assert s1.steps == 1 and s2.steps == 2
+        assert s1.multiscale is not s2.multiscale
+        assert replay == drift2
+        assert drift2 != drift1
+        # Nothing carried on the integrator itself
+        assert integrator._drift_state is None
+
+    def test_compute_drift_step_matches_compute_drift(self):
+        integrator = TW369Integrator()
+        integrator._drift_model = "multiscale"
+        integrator._drift_model_config = replace(integrator._drift_model_config, multiscale_enabled=True)
+        state = _make_dummy_state()
+
+        stream_state = DriftStreamState()
+        for _ in range(3):
+            expected = integrator.compute_drift(state)
+            drift, stream_state = integrator.compute_drift_step(state, stream_state)
+            assert drift == pytest.approx(expected)
+
+    def test_compute_drift_step_stochastic_noise_follows_stream_state(self):
+        integrator = TW369Integrator()
+        integrator._drift_model = "stochastic"
+        integrator._drift_model_config = replace(
+            integrator._drift_model_config, stochastic_enabled=True, stochastic_seed=7
+        )
+        state = _make_dummy_state()
+
+        drift1, s1 = integrator.compute_drift_step(state)
+        drift2, s2 = integrator.compute_drift_step(state, s1)
+        replay, _ = integrator.compute_drift_step(state, s1)
+        fresh, _ = integrator.compute_drift_step(state)
+
+        assert drift1 != drift2
+        assert replay == drift2
+        assert fresh == drift1
+        assert s2.noise_entropy == 7
+
+    def test_compute_drift_step_parallel_streams_do_not_interleave(self):
+        integrator = TW369Integrator()
+        integrator._drift_model = "multiscale"
+        integrator._drift_model_config = replace(integrator._drift_model_config, multiscale_enabled=True)
+        states = [
+            TWState(
+                plane3_cultural_macro={"E01": 0.1 * i},
+                plane6_semiotic_media={"E01": -0.05 * i},
+                plane9_structural_systemic={"E01": 0.2},
+                metadata={},
+            )
+            for i in range(8)
+        ]
+
+        def run(tw_state):
+            stream_state = None
+            drifts = []
+            for _ in range(20):
+                drift, stream_state = integrator.compute_drift_step(tw_state, stream_state)
+                drifts.append(drift)
+            return drifts
+
+        sequential = [run(s) for s in states]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            parallel = list(pool.map(run, states))
+
+        assert parallel == sequential
+
+    def test_reconfiguring_swaps_immutable_core(self):
+        integrator = TW369Integrator()
+        before = integrator.core
+
+        integrator._configure_drift_model(
+            {"advanced_models": {"nonlinear": {"enabled": True}}},
+            {"drift_model": "nonlinear"},
+        )
+
+        assert before.drift_model == "model_a"
+        assert integrator.core is not before
+        assert integrator.core.drift_model == "nonlinear"
+        assert integrator.core.drift_model_config.nonlinear_enabled
+
+        with pytest.raises(FrozenInstanceError):
+            integrator.core.drift_model_config.nonlinear_enabled = False
+
+    def test_compute_drift_returns_caller_owned_dict(self):
+        integrator = TW369Integrator()
+        integrator._drift_model = "multiscale"
+        integrator._drift_model_config = replace(integrator._drift_model_config, multiscale_enabled=True)
+        state = _make_dummy_state()
+
+        drift = integrator.compute_drift(state, tau_modifiers={"drift_damping": 0.5})
+        carried = dict(integrator._drift_state.last_drift)
+        drift["plane3_to_6"] = 99.0
+
+        # Damping and caller writes leave the carried multiscale state alone
+        assert integrator._drift_state.last_drift == carried
+        assert drift is not integrator._drift_state.last_drift
+        assert integrator.compute_drift(state)["plane3_to_6"] != 99.0
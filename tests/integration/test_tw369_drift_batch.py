@@ -0,0 +1,115 @@
+"""
+Integration tests for batch (array-backed) TW369 drift computation.
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+from src.tw369.advanced_drift_models import DRIFT_KEYS
+from src.tw369.tw369_integration import TW369Integrator, TWState
+from src.tw369.tw_state_array import KINDRA_VECTOR_IDS, TWStateArray
+
+
+def _make_states(n: int = 25, seed: int = 3):
+    rng = np.random.default_rng(seed)
+    states = []
+    for _ in range(n):
+        planes = []
+        for _ in range(3):
+            k = int(rng.integers(0, 10))
+            ids = rng.choice(KINDRA_VECTOR_IDS, size=k, replace=False)
+            planes.append({str(v): float(rng.uniform(-1.0, 1.0)) for v in ids})
+        states.append(TWState(*planes, metadata={}))
+    return states
+
+
+def _configure(integrator: TW369Integrator, model: str) -> None:
+    integrator._drift_model = model
+    integrator._drift_model_config = replace(
+        integrator._drift_model_config,
+        nonlinear_enabled=True,
+        multiscale_enabled=True,
+        stochastic_enabled=True,
+    )
+
+
+class TestTW369DriftBatch:
+    def test_vector_ids_are_the_kindra_48(self):
+        assert len(KINDRA_VECTOR_IDS) == 48
+        assert KINDRA_VECTOR_IDS[0] == "E01"
+        assert KINDRA_VECTOR_IDS[8] == "S09"
+        assert KINDRA_VECTOR_IDS[-1] == "M48"
+
+    def test_plane_tension_matches_scalar(self):
+        from src.tw369.tw_state_array import compute_plane_tension_batch
+
+        integrator = TW369Integrator()
+        states = _make_states()
+        tensions = compute_plane_tension_batch(TWStateArray.from_states(states))
+
+        for row, state in enumerate(states):
+            scalar = integrator._compute_plane_tension(state)
+            assert tensions[row] == pytest.approx([scalar["3"], scalar["6"], scalar["9"]], rel=1e-12, abs=1e-15)
+
+    def test_unknown_vector_ids_match_scalar(self):
+        integrator = TW369Integrator()
+        states = [
+            TWState({"E01": 0.4, "legacy_tension": 0.9}, {"X99": -0.3}, {}, metadata={}),
+            TWState({"E01": 0.1}, {"S09": 0.2, "X99": 0.8}, {"M48": -0.5}, metadata={}),
+        ]
+
+        batch = TWStateArray.from_states(states)
+        drift = integrator.compute_drift_batch(batch)
+
+        assert batch.extra_ids == ("legacy_tension", "X99")
+        assert batch.plane3.shape == (2, len(KINDRA_VECTOR_IDS) + 2)
+        for row, state in enumerate(states):
+            scalar = integrator.compute_drift(state, stream_id="unknown-ids")
+            assert drift[row] == pytest.approx([scalar[key] for key in DRIFT_KEYS], rel=1e-12, abs=1e-15)
+
+    @pytest.mark.parametrize("model", ["model_a", "nonlinear"])
+    def test_deterministic_models_match_scalar(self, model):
+        integrator = TW369Integrator()
+        _configure(integrator, model)
+        states = _make_states()
+
+        drift = integrator.compute_drift_batch(TWStateArray.from_states(states))
+        assert drift.shape == (len(states), 3)
+
+        for row, state in enumerate(states):
+            scalar = integrator.compute_drift(state)
+            assert drift[row] == pytest.approx([scalar[key] for key in DRIFT_KEYS], rel=1e-12, abs=1e-15)
+
+    def test_multiscale_carries_per_row_state(self):
+        states = _make_states(n=6)
+        batch = TWStateArray.from_states(states)
+        batch_integrator = TW369Integrator()
+        _configure(batch_integrator, "multiscale")
+        carried = np.zeros((len(states), 3, 2))
+
+        scalar_integrators = []
+        for _ in states:
+            integrator = TW369Integrator()
+            _configure(integrator, "multiscale")
+            scalar_integrators.append(integrator)
+
+        for _ in range(4):
+            drift = batch_integrator.compute_drift_batch(batch, multiscale_state=carried)
+            for row, (state, integrator) in enumerate(zip(states, scalar_integrators)):
+                scalar = integrator.compute_drift(state)
+                assert drift[row] == pytest.approx([scalar[key] for key in DRIFT_KEYS], rel=1e-12, abs=1e-15)
+                long_term = integrator._drift_state.long_term_drift
+                assert carried[row, :, 1] == pytest.approx([long_term[key] for key in DRIFT_KEYS], rel=1e-12, abs=1e-15)
+
+    def test_stochastic_is_seedable(self):
+        integrator = TW369Integrator()
+        _configure(integrator, "stochastic")
+        batch = TWStateArray.from_states(_make_states())
+
+        d1 = integrator.compute_drift_batch(batch, rng=np.random.default_rng(7))
+        d2 = integrator.compute_drift_batch(batch, rng=np.random.default_rng(7))
+        d3 = integrator.compute_drift_batch(batch, rng=np.random.default_rng(8))
+
+        assert np.array_equal(d1, d2)
+        assert not np.array_equal(d1, d3)
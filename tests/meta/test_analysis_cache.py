@@ -0,0 +1,144 @@
+"""Tests for the meta-engine analysis cache"""
+
+import pytest
+
+from src.meta.analysis_cache import MetaAnalysisCache, fingerprint
+from src.meta.aurelius import AureliusEngine, analyze_meta as analyze_aurelius
+from src.meta.campbell_engine import CampbellEngine
+from src.meta.nietzsche import NietzscheEngine
+from src.meta.types import MetaInput
+from src.tw369.tw369_integration import TWState
+from src.unification.states.unified_state import KindraContext
+
+
+class CountingEngine:
+    """Wraps an engine and counts analyze() calls."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.name = engine.name
+        self.version = engine.version
+        self.calls = 0
+
+    def analyze(self, meta_input):
+        self.calls += 1
+        return self.engine.analyze(meta_input)
+
+
+def make_input(text="The hero must overcome the ordeal and return home.", scale=1.0):
+    return MetaInput(
+        text=text,
+        delta144_state="A04_HERO",
+        archetype_scores={"A04_HERO": 0.8 * scale, "A08_REBEL": 0.2},
+        kindra=KindraContext(
+            layer1={"order": 0.4},
+            layer2={"intensity": 0.7},
+            layer3={"myth": 0.9},
+            tw_plane_distribution={3: 0.2, 6: 0.3, 9: 0.5},
+        ),
+        tw_state=TWState(metadata={"drift_metric": 0.5, "regime": "STABLE"}),
+        bias_score=0.1,
+    )
+
+
+@pytest.mark.parametrize("engine_cls", [NietzscheEngine, AureliusEngine, CampbellEngine])
+def test_cached_signal_matches_engine(engine_cls):
+    cache = MetaAnalysisCache()
+    engine = CountingEngine(engine_cls())
+
+    first = cache.analyze(engine, make_input())
+    second = cache.analyze(engine, make_input())
+
+    assert second == first and second is not first
+    assert first == engine_cls().analyze(make_input())
+    assert engine.calls == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_fingerprint_inputs():
+    engine = NietzscheEngine()
+    base = fingerprint(engine, make_input())
+
+    # Engines lower-case the text; dict order does not matter
+    reordered = make_input(text="THE HERO must overcome the ordeal and return home.")
+    reordered.archetype_scores = {"A08_REBEL": 0.2, "A04_HERO": 0.8}
+    assert fingerprint(engine, reordered) == base
+
+    # Differences below the quantum collapse, larger ones do not
+    assert fingerprint(engine, make_input(scale=1.0 + 1e-9)) == base
+    assert fingerprint(engine, make_input(scale=1.01)) != base
+    assert fingerprint(engine, make_input(text="Another story.")) != base
+    assert fingerprint(AureliusEngine(), make_input()) != base
+
+    engine.version = "3.2"
+    assert fingerprint(engine, make_input()) != base
+
+
+def test_lru_eviction():
+    cache = MetaAnalysisCache(max_entries=2)
+    engine = CountingEngine(NietzscheEngine())
+
+    for text in ("one", "two", "three"):
+        cache.analyze(engine, make_input(text))
+    cache.analyze(engine, make_input("one"))
+
+    assert len(cache) == 2
+    assert cache.stats()["evictions"] == 2
+    assert engine.calls == 4
+
+
+def test_disk_tier_shared_between_caches(tmp_path):
+    engine = CountingEngine(CampbellEngine())
+    writer = MetaAnalysisCache(disk_dir=tmp_path)
+    reader = MetaAnalysisCache(disk_dir=tmp_path)
+
+    expected = writer.analyze(engine, make_input())
+    result = reader.analyze(engine, make_input())
+
+    assert result == expected
+    assert engine.calls == 1
+    assert reader.stats()["disk_hits"] == 1
+
+
+def test_engine_errors_not_cached():
+    class FailingEngine:
+        name = "failing"
+
+        def analyze(self, meta_input):
+            raise RuntimeError("boom")
+
+    cache = MetaAnalysisCache()
+    with pytest.raises(RuntimeError):
+        cache.analyze(FailingEngine(), make_input())
+    assert len(cache) == 0
+
+
+def test_cached_signals_are_copies(tmp_path):
+    cache = MetaAnalysisCache(disk_dir=tmp_path)
+    engine = NietzscheEngine()
+    expected = engine.analyze(make_input())
+
+    first = cache.analyze(engine, make_input())
+    first.scores.clear()
+    first.notes.append("mutated")
+    second = cache.analyze(engine, make_input())
+    second.scores.clear()
+    cache.clear()
+    from_disk = cache.analyze(engine, make_input())
+
+    assert cache.analyze(engine, make_input()) == expected
+    assert from_disk == expected
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_legacy_wrapper_with_cache():
+    cache = MetaAnalysisCache()
+
+    cached = analyze_aurelius("Stay calm and accept what you cannot control.", bias_score=0.2, cache=cache)
+    cached.notes.append("mutated")
+    again = analyze_aurelius("Stay calm and accept what you cannot control.", bias_score=0.2, cache=cache)
+    plain = analyze_aurelius("Stay calm and accept what you cannot control.", bias_score=0.2)
+
+    assert again == plain
+    assert cache.stats()["hits"] == 1
@@ -18,7 +18,9 @@ from meta.campbell_engine import (
     CampbellEngine,
     CampbellSignal,
     CAMPBELL_ARCHETYPES,
-    JOURNEY_STAGES
+    JOURNEY_STAGES,
+    STAGE_KEYWORDS,
+    keyword_hits,
 )
 from meta.nietzsche import MetaInput
 from unification.states.unified_state import KindraContext
@@ -194,3 +196,50 @@ def test_kindra_liminality_boosts_threshold():
     
     # Should likely be CROSSING_THRESHOLD or APPROACH_INMOST_CAVE
     assert result.journey_stage in ["CROSSING_THRESHOLD", "APPROACH_INMOST_CAVE", "RETURN_WITH_ELIXIR"]
+
+
+# ============================================================================
+# Batch Analysis Tests
+# ============================================================================
+
+def test_keyword_hits_matches_substring_test():
+    """Test that the single-scan keyword matrix equals `kw in text` (nested keywords too)."""
+    keywords = sorted({kw for kws in STAGE_KEYWORDS.values() for kw in kws})
+    texts = ["", "mastery of the final test", "homework", "the new world gate", "xyz"]
+    
+    hits = keyword_hits(texts)
+    
+    expected = [[int(kw in text) for kw in keywords] for text in texts]
+    assert hits.tolist() == expected
+
+
+def test_analyze_batch_identical_to_scalar():
+    """Test that analyze_batch returns exactly the per-input analyze() results."""
+    import random
+    
+    rng = random.Random(7)
+    vocabulary = [kw for kws in STAGE_KEYWORDS.values() for kw in kws] + ["mastery", "homework", "noise"]
+    archetypes = list(CAMPBELL_ARCHETYPES)
+    
+    inputs = []
+    for _ in range(300):
+        text = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 6)))
+        kindra = None
+        if rng.random() < 0.7:
+            kindra = KindraContext(
+                layer1={"order": rng.random()},
+                layer2={"intensity": rng.random(), "transition": rng.random()},
+                layer3={"threshold": rng.random(), "myth": rng.random()}
+            )
+        inputs.append(MetaInput(
+            text=text.upper() if rng.random() < 0.2 else text,
+            delta144_state=rng.choice([None, "A02_SAGE_STATE_01", "A08_REBEL"]),
+            archetype_scores={rng.choice(archetypes): rng.random() for _ in range(rng.randint(0, 4))},
+            kindra=kindra
+        ))
+    
+    engine = CampbellEngine()
+    batch = engine.analyze_batch(inputs)
+    
+    assert batch == [engine.analyze(meta_input) for meta_input in inputs]
+    assert engine.analyze_batch([]) == []
@@ -1,5 +1,10 @@
 """Tests for Meta Engine Orchestrator"""
 
+import threading
+import time
+import uuid
+from dataclasses import replace
+
 import pytest
 import numpy as np
 
@@ -9,9 +14,41 @@ from src.meta.engine_orchestrator import (
     EngineResult,
     OrchestrationResult,
     MetaOrchestrator,
+    EngineVariant,
+    VARIANT_TAUS,
 )
 
 
+class FakeEngineCore:
+    """Stand-in for KaldraMasterEngineV2: records tau and stream id, optional delay/failure per tau."""
+    
+    def __init__(self, delays=None, barrier=None, failing=()):
+        self.tau = 0.65
+        self.delays = delays or {}
+        self.barrier = barrier
+        self.failing = set(failing)
+        self.calls = []
+        self.streams = []
+    
+    def infer_from_embedding(self, embedding, text=None, tw_window=None, stream_id=None):
+        self.calls.append(self.tau)
+        self.streams.append(stream_id)
+        if self.barrier is not None:
+            self.barrier.wait(timeout=2.0)
+        time.sleep(self.delays.get(self.tau, 0.0))
+        if self.tau in self.failing:
+            raise RuntimeError("engine failure")
+        return {"tau": self.tau}
+    
+    @staticmethod
+    def describe(name):
+        return f"engine {name}"
+    
+    @classmethod
+    def kind(cls):
+        return cls.__name__
+
+
 class TestOrchestrationConfig:
     """Test OrchestrationConfig dataclass"""
     
@@ -201,6 +238,200 @@ class TestMetaOrchestrator:
         assert len(result.secondary_results) == 1
         assert result.secondary_results[0].engine_name == "geo"
         assert result.secondary_results[0].success is True
+    
+    def test_streams_keep_separate_drift_memory(self):
+        """Test that each stream id gets its own TW369 drift memory"""
+        orchestrator = MetaOrchestrator()
+        store = orchestrator.engine_core.tw_integrator._drift_store
+        embedding = np.random.randn(256).astype(np.float32)
+        stream_a, stream_b = f"a-{uuid.uuid4().hex}", f"b-{uuid.uuid4().hex}"
+        default_before = len(store.get_history(store.DEFAULT_STREAM))
+        
+        orchestrator.execute(embedding, stream_id=stream_a)
+        orchestrator.execute(embedding, stream_id=stream_a)
+        orchestrator.execute(embedding, context=RoutingContext(metadata={"stream_id": stream_b}))
+        
+        assert len(store.get_history(stream_a)) == 2
+        assert len(store.get_history(stream_b)) == 1
+        assert len(store.get_history(store.DEFAULT_STREAM)) == default_before
+    
+    def test_engine_drift_state_lives_in_stream_store(self):
+        """Test that unkeyed requests use the default stream, not integrator state"""
+        orchestrator = MetaOrchestrator()
+        integrator = orchestrator.engine_core.tw_integrator
+        integrator._drift_model = "multiscale"
+        integrator._drift_model_config = replace(integrator._drift_model_config, multiscale_enabled=True)
+        store = integrator._drift_store
+        
+        orchestrator.execute(np.random.randn(256).astype(np.float32))
+        
+        assert integrator._drift_state is None
+        assert store.get_multiscale_state(store.DEFAULT_STREAM) is not None
+
+
+class TestEngineVariants:
+    """Test variant views and parallel execution (fake engine core)"""
+    
+    def test_variants_share_core(self):
+        core = FakeEngineCore()
+        orchestrator = MetaOrchestrator(engine_core=core)
+        
+        assert set(orchestrator.engines) == set(VARIANT_TAUS)
+        for name, engine in orchestrator.engines.items():
+            assert isinstance(engine, EngineVariant)
+            assert engine.core is core
+            assert engine.tau == VARIANT_TAUS[name]
+    
+    def test_methods_see_variant_tau(self):
+        core = FakeEngineCore()
+        orchestrator = MetaOrchestrator(engine_core=core)
+        
+        result = orchestrator.execute(
+            np.zeros(256),
+            routing_decision=RoutingDecision(primary_engine="safeguard", confidence=1.0),
+        )
+        
+        assert result.primary_result.signal == {"tau": 0.75}
+        assert core.tau == 0.65
+    
+    def test_only_plain_methods_bind_to_view(self):
+        core = FakeEngineCore()
+        variant = EngineVariant("alpha", core, 0.70)
+        
+        assert variant.describe("x") == "engine x"
+        assert variant.kind() == "FakeEngineCore"
+        assert variant.infer_from_embedding(np.zeros(256)) == {"tau": 0.70}
+        assert variant.calls == [0.70]
+        
+        core.describe = lambda name: f"patched {name}"
+        assert variant.describe("x") == "patched x"
+    
+    def test_stream_id_reaches_every_engine(self):
+        core = FakeEngineCore()
+        orchestrator = MetaOrchestrator(
+            OrchestrationConfig(parallel_execution=True, max_workers=2),
+            engine_core=core,
+        )
+        decision = RoutingDecision(primary_engine="alpha", confidence=0.8, secondary_engines=["geo"])
+        
+        orchestrator.execute(np.zeros(256), routing_decision=decision, stream_id="session-1")
+        orchestrator.execute(
+            np.zeros(256),
+            context=RoutingContext(metadata={"stream_id": "session-2"}),
+            routing_decision=decision,
+        )
+        orchestrator.shutdown()
+        
+        assert core.streams == ["session-1"] * 2 + ["session-2"] * 2
+    
+    def test_parallel_fan_out(self):
+        # All three engines must be in flight at once to pass the barrier
+        core = FakeEngineCore(barrier=threading.Barrier(3))
+        orchestrator = MetaOrchestrator(
+            OrchestrationConfig(parallel_execution=True, max_workers=3),
+            engine_core=core,
+        )
+        decision = RoutingDecision(
+            primary_engine="alpha",
+            confidence=0.8,
+            secondary_engines=["geo", "product"],
+        )
+        
+        result = orchestrator.execute(np.zeros(256), routing_decision=decision)
+        orchestrator.shutdown()
+        
+        assert result.primary_result.success is True
+        assert result.primary_result.signal == {"tau": 0.70}
+        assert [r.engine_name for r in result.secondary_results] == ["geo", "product"]
+        assert all(r.success for r in result.secondary_results)
+    
+    def test_parallel_deadline(self):
+        core = FakeEngineCore(delays={0.60: 1.0})
+        orchestrator = MetaOrchestrator(
+            OrchestrationConfig(parallel_execution=True, timeout_seconds=0.2),
+            engine_core=core,
+        )
+        decision = RoutingDecision(
+            primary_engine="alpha",
+            confidence=0.8,
+            secondary_engines=["product"],
+        )
+        
+        start = time.time()
+        result = orchestrator.execute(np.zeros(256), routing_decision=decision)
+        elapsed = time.time() - start
+        orchestrator.shutdown()
+        
+        assert elapsed < 0.9
+        assert result.primary_result.success is True
+        assert result.secondary_results[0].success is False
+        assert "deadline" in result.secondary_results[0].error
+
+
+class TestHedgedFallback:
+    """Test speculative default-engine fallback (fake engine core)"""
+    
+    def _orchestrator(self, core, **kwargs):
+        config = OrchestrationConfig(hedge_fallback=True, hedge_min_samples=3, **kwargs)
+        return MetaOrchestrator(config, engine_core=core)
+    
+    def test_fast_primary_does_not_hedge(self):
+        core = FakeEngineCore()
+        orchestrator = self._orchestrator(core)
+        decision = RoutingDecision(primary_engine="alpha", confidence=1.0)
+        
+        for _ in range(5):
+            result = orchestrator.execute(np.zeros(256), routing_decision=decision)
+        orchestrator.shutdown()
+        
+        assert result.primary_result.engine_name == "alpha"
+        assert core.calls == [0.70] * 5
+        assert orchestrator.latency.count("alpha") == 5
+    
+    def test_slow_primary_hedges_to_default(self):
+        core = FakeEngineCore(delays={0.70: 0.01})
+        orchestrator = self._orchestrator(core)
+        decision = RoutingDecision(primary_engine="alpha", confidence=1.0)
+        for _ in range(3):
+            orchestrator.execute(np.zeros(256), routing_decision=decision)
+        
+        core.delays[0.70] = 1.0
+        start = time.time()
+        result = orchestrator.execute(np.zeros(256), routing_decision=decision)
+        elapsed = time.time() - start
+        orchestrator.shutdown()
+        
+        assert result.primary_result.success is True
+        assert result.primary_result.engine_name == "default"
+        assert elapsed < 0.5
+    
+    def test_failed_primary_falls_back_without_history(self):
+        core = FakeEngineCore(failing={0.70})
+        orchestrator = self._orchestrator(core)
+        
+        result = orchestrator.execute(
+            np.zeros(256),
+            routing_decision=RoutingDecision(primary_engine="alpha", confidence=1.0),
+        )
+        orchestrator.shutdown()
+        
+        assert result.primary_result.engine_name == "default"
+        assert result.primary_result.success is True
+        assert core.calls == [0.70, 0.65]
+    
+    def test_both_failing_returns_primary_error(self):
+        core = FakeEngineCore(failing={0.70, 0.65})
+        orchestrator = self._orchestrator(core)
+        
+        result = orchestrator.execute(
+            np.zeros(256),
+            routing_decision=RoutingDecision(primary_engine="alpha", confidence=1.0),
+        )
+        orchestrator.shutdown()
+        
+        assert result.primary_result.engine_name == "alpha"
+        assert result.primary_result.success is False
+        assert result.primary_result.error == "engine failure"
 
 
 class TestEngineResult:
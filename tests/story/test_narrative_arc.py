@@ -0,0 +1,155 @@
+"""
+Tests for Campbell stage tracking (forward filtering and batched Viterbi).
+"""
+
+import itertools
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from story.story_buffer import StoryBuffer, StoryEvent
+from story.narrative_arc import (
+    CAMPBELL_STAGES,
+    CampbellStageTracker,
+    analyze_arc,
+    build_transition_matrix,
+    compute_tension,
+    decode_stage_paths,
+    stage_likelihoods,
+    viterbi_decode_batch,
+)
+
+
+def _event(i, stage=None, confidence=0.8):
+    meta_scores = {"campbell": {"stage": stage, "confidence": confidence}} if stage else None
+    return StoryEvent(event_id=f"e{i}", timestamp=float(i), sequence_id=i, text="", meta_scores=meta_scores)
+
+
+def test_transition_matrix_is_stochastic():
+    """Test that every row is a distribution and invalid inputs are rejected."""
+    matrix = build_transition_matrix()
+
+    assert matrix.shape == (12, 12)
+    assert np.allclose(matrix.sum(axis=1), 1.0)
+    assert matrix[0, 0] == pytest.approx(0.6)
+    assert matrix[0, 1] == pytest.approx(0.3 + 0.05 / 11)
+    assert matrix[-1, -1] == pytest.approx(0.95)
+
+    with pytest.raises(ValueError):
+        build_transition_matrix(stay=0.8, advance=0.3)
+
+
+def test_stage_likelihoods():
+    """Test observation likelihoods from Campbell meta-scores."""
+    likelihood = stage_likelihoods(_event(0, "ordeal", 0.9))
+
+    assert likelihood.argmax() == CAMPBELL_STAGES.index("ordeal")
+    assert likelihood[CAMPBELL_STAGES.index("ordeal")] == pytest.approx(0.9)
+    assert np.allclose(stage_likelihoods(_event(1)), 1.0 / 12)
+    assert np.allclose(stage_likelihoods(_event(2, "UNKNOWN_STAGE")), 1.0 / 12)
+
+
+def test_tracker_matches_full_forward_pass():
+    """Test that incremental updates equal a forward pass over the whole sequence."""
+    rng = np.random.default_rng(3)
+    likelihoods = rng.random((15, 12))
+    tracker = CampbellStageTracker()
+
+    for t in range(len(likelihoods)):
+        tracker.update(likelihoods[t])
+
+        alpha = tracker.initial * likelihoods[0]
+        for obs in likelihoods[1:t + 1]:
+            alpha = (alpha @ tracker.transitions) * obs
+        assert np.allclose(tracker.belief, alpha / alpha.sum())
+
+    assert tracker.num_events == 15
+
+
+def test_tracker_follows_story():
+    """Test stage estimates and predictions along a progressing story."""
+    stages = ["ordinary_world"] * 3 + ["call_to_adventure"] * 2
+    tracker = CampbellStageTracker()
+
+    for i, stage in enumerate(stages):
+        tracker.update(_event(i, stage))
+
+    assert tracker.current_stage == "call_to_adventure"
+    assert tracker.events_in_stage == 2
+    assert tracker.predicted_next_stage == "refusal_of_the_call"
+    assert 0.0 < tracker.transition_likelihood < 1.0
+    assert tracker.expected_events_to_transition >= 1
+
+    tracker.reset()
+    assert tracker.num_events == 0
+
+
+def test_viterbi_batch_matches_brute_force():
+    """Test batched Viterbi (with padding) against exhaustive search."""
+    rng = np.random.default_rng(11)
+    likelihoods = rng.random((4, 3, 12))
+    lengths = [3, 2, 1, 3]
+    tracker = CampbellStageTracker()
+
+    paths = viterbi_decode_batch(likelihoods, lengths)
+
+    for b, n in enumerate(lengths):
+        def score(path):
+            p = tracker.initial[path[0]] * likelihoods[b, 0, path[0]]
+            for t in range(1, n):
+                p *= tracker.transitions[path[t - 1], path[t]] * likelihoods[b, t, path[t]]
+            return p
+
+        best = max(itertools.product(range(12), repeat=n), key=score)
+        assert tuple(paths[b, :n]) == best
+        assert (paths[b, n:] == -1).all()
+
+
+def test_decode_stage_paths():
+    """Test Viterbi decoding of story timelines."""
+    story = [_event(i, s) for i, s in enumerate(["ordinary_world", "call_to_adventure", "refusal_of_the_call"])]
+    # A low-confidence outlier in the middle of a stable stage is smoothed away
+    noisy = [_event(0, "ordeal"), _event(1, "road_back", 0.3), _event(2, "ordeal"), _event(3)]
+
+    paths = decode_stage_paths([story, noisy, []])
+
+    assert paths[0] == ["ordinary_world", "call_to_adventure", "refusal_of_the_call"]
+    assert paths[1][:3] == ["ordeal", "ordeal", "ordeal"]
+    assert len(paths[1]) == 4
+    assert paths[2] == []
+
+
+def test_analyze_arc_with_tracker():
+    """Test that analyze_arc uses the tracker's filtered state."""
+    buffer = StoryBuffer()
+    for stage in ["ordinary_world", "call_to_adventure", "call_to_adventure"]:
+        buffer.add_event(text="", meta_scores={"campbell": {"stage": stage, "confidence": 0.8}})
+
+    tracker = CampbellStageTracker.from_buffer(buffer)
+    arc = analyze_arc(buffer, tracker=tracker)
+
+    assert arc.current_stage == tracker.current_stage == "call_to_adventure"
+    assert arc.stage_confidence == tracker.stage_confidence
+    assert arc.transition_likelihood == tracker.transition_likelihood
+    assert arc.predicted_inflection_distance == tracker.expected_events_to_transition
+
+    # Without a tracker the legacy heuristics are unchanged
+    assert analyze_arc(buffer).transition_likelihood == 0.4
+
+
+def test_compute_tension_buffer_matches_events():
+    buffer = StoryBuffer(capacity=3)
+    buffer.add_event("calm", drift_state={"drift_metric": 0.1},
+                     meta_scores={"aurelius": {"emotional_regulation": 0.9}})
+    buffer.add_event("rising", drift_state={"regime": "x"},
+                     meta_scores={"nietzsche": {"will_to_power": 0.8}, "aurelius": {}})
+    buffer.add_event("peak", drift_state={"drift_metric": 0.9},
+                     meta_scores={"nietzsche": {"will_to_power": 0.9, "active_nihilism": 0.7}})
+
+    timeline = buffer.get_timeline()
+    assert compute_tension(buffer) == pytest.approx(compute_tension(timeline))
+    assert compute_tension(buffer) == pytest.approx(0.84 - 0.24)
@@ -205,3 +205,34 @@ def test_meta_score_deltas():
     
     assert "nietzsche" in motion.meta_deltas
     assert motion.meta_deltas["nietzsche"] > 0  # Increased
+
+
+def test_buffer_analytics_match_event_walk():
+    """Columnar aggregation matches the per-event functions."""
+    buffer = StoryBuffer(capacity=4)
+    
+    # Overflows the ring, so columns wrap around
+    for i, (drift, delta12, state) in enumerate([
+        (0.2, {"A01_INNOCENT": 0.9}, "A01_INNOCENT_1_01"),
+        (0.9, {"A01_INNOCENT": 0.2, "A03_WARRIOR": 0.8}, None),
+        (0.3, None, "A03_WARRIOR_3_05"),
+        (0.95, {"A03_WARRIOR": 0.4, "A05_SEEKER": 0.6}, "A05_SEEKER_5_02"),
+        (0.1, {"A05_SEEKER": 0.7}, "A05_SEEKER_5_02"),
+        (None, {"A01_INNOCENT": 0.8, "A05_SEEKER": 0.1}, "A01_INNOCENT_1_01"),
+    ]):
+        buffer.add_event(
+            f"Event {i}",
+            delta12=delta12,
+            delta144_state=state,
+            drift_state={"drift_metric": drift} if drift is not None else {"regime": "calm"},
+            meta_scores={"nietzsche": {"will_to_power": 0.1 * i, "amor_fati": 0.5}},
+        )
+    
+    timeline = buffer.get_timeline()
+    aggregation = aggregate_story(buffer)
+    expected = [compute_narrative_motion(a, b) for a, b in zip(timeline, timeline[1:])]
+    
+    assert aggregation.timeline == timeline
+    assert aggregation.motion_vectors == expected
+    assert aggregation.inflection_points == detect_inflection_points(timeline)
+    assert aggregation.drift_trajectory.drift_values == [0.3, 0.95, 0.1, 0.0]
@@ -2,6 +2,7 @@
 Tests for StoryBuffer and StoryEvent.
 """
 
+import numpy as np
 import pytest
 import sys
 from pathlib import Path
@@ -173,3 +174,147 @@ def test_story_buffer_with_full_kaldra_signal():
     assert event.delta12["A07_RULER"] == 0.4
     assert event.meta_scores["nietzsche"]["will_to_power"] == 0.7
     assert event.tw_state["plane"] == "6"
+
+
+def test_story_buffer_view_round_trip():
+    """Test that events read back from the columnar buffer equal the stored ones."""
+    buffer = StoryBuffer(capacity=4)
+    events = []
+    for i in range(6):
+        events.append(buffer.add_event(
+            f"Event {i}",
+            delta12={"A01_INNOCENT": 0.1 * i, f"A0{i % 3 + 2}_X": 0.5} if i % 2 == 0 else None,
+            meta_scores={"campbell": {"stage": "ordeal", "confidence": 0.7}} if i == 5 else None,
+            drift_state={"drift_metric": 0.2 * i, "regime": "STABLE"} if i != 4 else {"regime": "CRITICAL"},
+            metadata={"i": i}
+        ))
+    
+    timeline = buffer.get_timeline()
+    
+    assert [e.to_dict() for e in timeline] == [e.to_dict() for e in events[2:]]
+    assert [e.text for e in buffer.get_recent(2)] == ["Event 5", "Event 4"]
+
+
+def test_story_buffer_columns():
+    """Test the chronological column accessors after the ring wraps."""
+    buffer = StoryBuffer(capacity=3)
+    for i in range(5):
+        buffer.add_event(
+            f"Event {i}",
+            delta12={"A01_INNOCENT": float(i)} if i != 3 else {"A07_RULER": 1.0},
+            meta_scores={
+                "nietzsche": {"will_to_power": 0.1 * i},
+                "campbell": {"stage": "call_to_adventure" if i < 4 else "ordeal", "confidence": 0.5},
+            },
+            drift_state={"drift_metric": 0.1 * i}
+        )
+    
+    assert buffer.sequence_ids().tolist() == [2, 3, 4]
+    assert buffer.drift_metrics() == pytest.approx([0.2, 0.3, 0.4])
+    assert buffer.delta12_keys == ["A01_INNOCENT", "A07_RULER"]
+    
+    delta12 = buffer.delta12_matrix()
+    assert delta12[:, 0].tolist()[0] == 2.0 and np.isnan(delta12[1, 0])
+    assert delta12[1, 1] == 1.0
+    
+    tension = buffer.tension_features()
+    assert tension[:, 0] == pytest.approx([0.2, 0.3, 0.4])
+    assert np.isnan(tension[:, 2]).all()
+    
+    names = buffer.stage_names
+    assert [names[c] for c in buffer.stage_codes()] == ["call_to_adventure", "call_to_adventure", "ordeal"]
+    
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.timestamps().shape == (0,)
+
+
+def test_story_buffer_events_are_detached():
+    """Test that changing a returned event leaves the buffer and its columns alone."""
+    buffer = StoryBuffer(capacity=3)
+    drift_state = {"drift_metric": 0.2, "regime": "STABLE"}
+    event = buffer.add_event("Event 0", delta12={"A01_INNOCENT": 0.5}, drift_state=drift_state)
+    
+    event.drift_state["drift_metric"] = 0.9
+    drift_state["regime"] = "CRITICAL"
+    viewed = buffer.get_timeline()[0]
+    viewed.drift_state["drift_metric"] = 0.9
+    viewed.delta12["A01_INNOCENT"] = 1.0
+    
+    stored = buffer.get_timeline()[0]
+    assert stored is not viewed
+    assert stored.drift_state == {"drift_metric": 0.2, "regime": "STABLE"}
+    assert stored.delta12 == {"A01_INNOCENT": 0.5}
+    assert buffer.drift_metrics().tolist() == [0.2]
+    assert buffer.delta12_matrix().tolist() == [[0.5]]
+
+
+def test_story_buffer_delta12_values():
+    """Test that real Δ12 values are stored as float and other values kept aside."""
+    buffer = StoryBuffer(capacity=3)
+    buffer.add_event("Event 0", delta12={"A01_INNOCENT": np.float32(0.5), "A02_ORPHAN": 1})
+    buffer.add_event("Event 1", delta12={"A01_INNOCENT": 0.25, "a": "high"})
+    
+    first, second = buffer.get_timeline()
+    assert first.delta12 == {"A01_INNOCENT": 0.5, "A02_ORPHAN": 1.0}
+    assert type(first.delta12["A01_INNOCENT"]) is float
+    assert second.delta12 == {"A01_INNOCENT": 0.25, "a": "high"}
+    
+    # The non-real value has no column and counts as missing
+    assert buffer.delta12_keys == ["A01_INNOCENT", "A02_ORPHAN"]
+    matrix = buffer.delta12_matrix()
+    assert matrix[1, 0] == 0.25 and np.isnan(matrix[1, 1])
+    assert StoryBuffer.from_bytes(buffer.to_bytes()).to_dict() == buffer.to_dict()
+
+
+def test_story_buffer_binary_round_trip():
+    """Test that binary snapshots decode to the same buffer as the dict format."""
+    buffer = StoryBuffer(capacity=4)
+    for i in range(6):
+        buffer.add_event(
+            f"Event {i}",
+            delta12={"A01_INNOCENT": 0.1 * i, "A07_RULER": 0.5} if i % 2 == 0 else None,
+            delta144_state=f"A0{i % 3 + 1}_STATE" if i != 4 else None,
+            meta_scores={"campbell": {"stage": "ordeal", "confidence": 0.7}, "nietzsche": {"will_to_power": 0.3}},
+            drift_state={"drift_metric": 0.2 * i, "regime": "STABLE"} if i != 3 else None,
+            tw_state={"plane": "6"},
+            polarity_scores={"light_shadow": -0.2},
+            metadata={"i": i, "tags": ["a", "b"]}
+        )
+    
+    data = buffer.to_bytes()
+    decoded = StoryBuffer.from_bytes(data)
+    
+    assert decoded.to_dict() == buffer.to_dict()
+    assert decoded.delta144_names == buffer.delta144_names
+    assert decoded.delta144_codes().tolist() == buffer.delta144_codes().tolist()
+    assert np.array_equal(decoded.delta12_matrix(), buffer.delta12_matrix(), equal_nan=True)
+    assert StoryBuffer.from_bytes(decoded.to_bytes()).to_dict() == buffer.to_dict()
+    
+    # Decoded columns are read-only views until the buffer is written to
+    assert not decoded._timestamps.flags.writeable
+    decoded.add_event("Event 6", delta12={"A09_NEW": 1.0})
+    buffer.add_event("Event 6", delta12={"A09_NEW": 1.0})
+    assert [e.text for e in decoded.get_timeline()] == [e.text for e in buffer.get_timeline()]
+    assert decoded.delta12_keys == buffer.delta12_keys
+    
+    empty = StoryBuffer.from_bytes(StoryBuffer(capacity=2).to_bytes())
+    assert len(empty) == 0 and empty.capacity == 2
+
+
+def test_story_event_binary_round_trip():
+    """Test single-event binary encoding and snapshot validation."""
+    event = StoryEvent(
+        event_id="evt-1",
+        timestamp=1234567890.5,
+        sequence_id=7,
+        text="Test event",
+        delta12={"A01_INNOCENT": 0.5},
+        delta144_state="A01_INNOCENT_1_01",
+        drift_state={"drift_metric": 0.25},
+    )
+    
+    assert StoryEvent.from_bytes(event.to_bytes()).to_dict() == event.to_dict()
+    
+    with pytest.raises(ValueError):
+        StoryBuffer.from_bytes(b"JUNK" + event.to_bytes()[4:])
@@ -34,3 +34,34 @@ def test_detect_anomaly():
     assert isinstance(trigger, bool)
     assert stats is not None
     assert stats.lambda_max > 0
+
+def test_lanczos_matches_exact_lambda_max():
+    rng = np.random.default_rng(42)
+    window = rng.standard_normal((120, 300))
+    window[:, :5] += rng.standard_normal((120, 1)) * 3.0  # planted factor
+
+    exact = TWPainleveOracle(TWConfig(eigen_solver="exact"))
+    lanczos = TWPainleveOracle(TWConfig(eigen_solver="lanczos"))
+    trigger_exact, stats_exact = exact.detect(window)
+    trigger_lanczos, stats_lanczos = lanczos.detect(window)
+
+    assert trigger_exact == trigger_lanczos
+    assert stats_lanczos.lambda_max == pytest.approx(stats_exact.lambda_max, rel=1e-9)
+    assert stats_lanczos.num_eigenvalues == stats_exact.num_eigenvalues == 300
+
+def test_lanczos_top_k_matches_eigvalsh():
+    from src.tw369.lanczos import lanczos_top_eigenvalues
+
+    rng = np.random.default_rng(7)
+    window = rng.standard_normal((400, 64))
+    centered = window - window.mean(axis=0)
+    expected = np.linalg.eigvalsh(np.cov(centered, rowvar=False))[-3:]
+
+    top = lanczos_top_eigenvalues(centered, k=3, tol=1e-10)
+    assert np.allclose(top, expected, rtol=1e-9)
+
+def test_auto_solver_selection():
+    oracle = TWPainleveOracle(TWConfig(eigen_solver="auto", lanczos_min_dim=256))
+    assert not oracle.uses_lanczos(20)
+    assert oracle.uses_lanczos(256)
+    assert not TWPainleveOracle(TWConfig(eigen_solver="exact")).uses_lanczos(1536)
@@ -0,0 +1,95 @@
+"""
+Tests for the TW369 regime backtest engine.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from tw369.backtest import BacktestConfig, load_series, run_backtest, run_oracle
+from tw369.oracle_tw_painleve import TWConfig, TWPainleveOracle
+from tw369.painleve.painleve_filter import painleve_filter, painleve_filter_array
+
+
+def _regime_shift_series(T=400, m=8, shift_at=250, seed=0):
+    """White noise, then a strong common factor from shift_at on."""
+    rng = np.random.default_rng(seed)
+    x = rng.standard_normal((T, m))
+    factor = rng.standard_normal(T - shift_at)
+    x[shift_at:] += 2.0 * factor[:, None]
+    return x
+
+
+def test_run_oracle_matches_detect_per_window():
+    series = _regime_shift_series()
+    config = BacktestConfig(window_size=60, stride=7, chunk_size=5)
+    trace = run_oracle(series, config)
+
+    oracle = TWPainleveOracle(TWConfig(window_size=60, alpha=config.significance))
+    assert len(trace.times) == len(range(60, len(series) + 1, 7))
+    for t, lam, fired in zip(trace.times, trace.lambda_max, trace.triggers):
+        triggered, stats = oracle.detect(series[t + 1 - 60:t + 1])
+        assert lam == pytest.approx(stats.lambda_max, rel=1e-9)
+        assert fired == triggered
+        assert trace.threshold == pytest.approx(stats.threshold)
+
+
+def test_painleve_filter_array_matches_scalar():
+    values = np.linspace(-1.5, 1.5, 31)
+    expected = [painleve_filter(v) for v in values]
+    assert np.allclose(painleve_filter_array(values), expected)
+
+
+def test_backtest_reports_lead_time_for_regime_shift():
+    series = {"topic_a": _regime_shift_series(seed=1), "topic_b": _regime_shift_series(seed=2)}
+    events = {"topic_a": [270], "topic_b": [270]}
+    config = BacktestConfig(
+        window_size=60,
+        painleve_alphas=(0.0, 0.2),
+        thresholds=(0.0, 0.5, 2.0),
+        max_lead=40,
+    )
+
+    report = run_backtest(series, events, config)
+
+    assert len(report.results) == 6
+    assert report.num_windows == {"topic_a": 341, "topic_b": 341}
+    by_key = {(r.painleve_alpha, r.threshold): r for r in report.results}
+    sensitive = by_key[(0.0, 0.0)]
+    assert sensitive.hit_rate == 1.0
+    assert 0 < sensitive.mean_lead_time <= 40
+    assert 0.0 < sensitive.trigger_rate < 1.0
+    # Filtered index is clamped to [-1, 1]: threshold 2.0 never fires
+    assert by_key[(0.0, 2.0)].trigger_rate == 0.0
+    assert by_key[(0.0, 2.0)].hit_rate == 0.0
+    assert all(r.runtime_s >= 0.0 for r in report.results)
+    assert report.best("hit_rate").hit_rate == 1.0
+
+
+def test_parallel_sweep_matches_in_process():
+    series = {"topic": _regime_shift_series(seed=3)}
+    events = {"topic": [260]}
+    base = dict(window_size=50, painleve_alphas=(0.0, 0.1, 0.3), thresholds=(0.0, 0.4))
+
+    serial = run_backtest(series, events, BacktestConfig(**base))
+    parallel = run_backtest(series, events, BacktestConfig(processes=2, **base))
+
+    strip = lambda report: [
+        (r.painleve_alpha, r.threshold, r.trigger_rate, r.hit_rate, r.mean_lead_time)
+        for r in report.results
+    ]
+    assert strip(parallel) == strip(serial)
+
+
+def test_load_series_npz(tmp_path):
+    path = tmp_path / "history.npz"
+    np.savez(path, alpha=np.zeros((10, 3)), beta=np.ones((12, 3)))
+
+    series = load_series(path)
+
+    assert set(series) == {"alpha", "beta"}
+    assert series["beta"].shape == (12, 3)
@@ -0,0 +1,80 @@
+"""
+Tests for the TW369 calibration store and Painlevé solver pool.
+"""
+
+import json
+
+import pytest
+
+from src.tw369.calibration_store import CalibrationStore, get_calibration_store, invalidate_calibration
+from src.tw369.painleve.painleve2_solver import build_default_solver, get_solver_pool
+from src.tw369.regime_utils import get_painleve_alpha_for_archetype, load_archetype_regimes
+
+
+def test_store_loads_each_file_once(tmp_path):
+    """Test that a file is parsed once and then served from memory."""
+    (tmp_path / "regime_calibration.json").write_text(json.dumps({"A07_RULER": {"alpha": 0.7}}))
+    store = CalibrationStore(schema_dir=tmp_path)
+    
+    for _ in range(5):
+        assert store.get("regime_calibration.json")["A07_RULER"]["alpha"] == 0.7
+    assert store.get("missing.json", {}) == {}
+    assert store.get("missing.json", {"x": 1}) == {"x": 1}
+    
+    assert store.stats()["loads"] == 2
+    assert store.stats()["hits"] == 5
+
+
+def test_invalidate_reloads_and_notifies(tmp_path):
+    """Test that invalidation drops cached content and runs listeners."""
+    path = tmp_path / "painleve_config.json"
+    path.write_text(json.dumps({"alpha": 0.1}))
+    store = CalibrationStore(schema_dir=tmp_path)
+    calls = []
+    store.add_invalidation_listener(lambda: calls.append(1))
+    
+    assert store.get("painleve_config.json")["alpha"] == 0.1
+    path.write_text(json.dumps({"alpha": 0.2}))
+    assert store.get("painleve_config.json")["alpha"] == 0.1
+    
+    store.invalidate("painleve_config.json")
+    assert store.get("painleve_config.json")["alpha"] == 0.2
+    assert calls == [1]
+
+
+def test_regime_lookups_do_no_io_after_first_load():
+    """Test that repeated regime lookups are served from the store."""
+    store = get_calibration_store()
+    get_painleve_alpha_for_archetype("A07_RULER")
+    load_archetype_regimes()
+    loads = store.stats()["loads"]
+    
+    for _ in range(10):
+        get_painleve_alpha_for_archetype("A08_REBEL")
+        load_archetype_regimes()
+    
+    assert store.stats()["loads"] == loads
+
+
+def test_load_archetype_regimes_returns_private_copy():
+    """Test that callers cannot corrupt the cached regimes."""
+    regimes = load_archetype_regimes()
+    regimes["A07_RULER"]["drift_tolerance"] = -1.0
+    assert load_archetype_regimes()["A07_RULER"]["drift_tolerance"] != -1.0
+
+
+def test_solver_pool_reuses_instances():
+    """Test that solvers are shared per (alpha, config) and cleared on invalidation."""
+    pool = get_solver_pool()
+    first = build_default_solver("A08_REBEL")
+    second = build_default_solver("A08_REBEL")
+    assert first is second
+    assert first.alpha == pytest.approx(get_painleve_alpha_for_archetype("A08_REBEL"))
+    
+    hits = pool.stats()["hits"]
+    build_default_solver("A08_REBEL")
+    assert pool.stats()["hits"] == hits + 1
+    
+    invalidate_calibration()
+    assert pool.stats()["size"] == 0
+    assert build_default_solver("A08_REBEL") is not first
@@ -0,0 +1,96 @@
+"""
+Tests for the binary DriftLog.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from tw369.drift_log import HEADER, RECORD_DTYPE, DriftLog, convert_json_history
+from tw369.drift_memory import DriftMemory
+from tw369.drift_state import DriftState
+
+
+def _state(i: int, regime: str = "UNKNOWN") -> DriftState:
+    return DriftState(
+        timestamp=1000.0 + i,
+        plane_values={"3": 0.1 * i, "6": 0.2 * i, "9": -0.1 * i},
+        drift_metric=0.01 * i,
+        painleve_coherence=0.5,
+        regime=regime,
+    )
+
+
+def test_append_and_read_tail(tmp_path):
+    log = DriftLog(tmp_path / "drift.bin")
+    for i in range(20):
+        log.append(_state(i, "A07_RULER" if i % 2 else "UNKNOWN"))
+
+    assert len(log) == 20
+    assert (tmp_path / "drift.bin").stat().st_size == HEADER.size + 20 * RECORD_DTYPE.itemsize
+
+    last = log.read_states(3)
+    assert [s.timestamp for s in last] == [1017.0, 1018.0, 1019.0]
+    assert last[0].regime == "A07_RULER"
+    assert last[1].regime == "UNKNOWN"
+    assert last[2].plane_values["6"] == pytest.approx(3.8)
+
+
+def test_reopen_preserves_records_and_regimes(tmp_path):
+    path = tmp_path / "drift.bin"
+    DriftLog(path).extend([_state(0, "A01_INNOCENT"), _state(1, "A07_RULER")])
+
+    reopened = DriftLog(path)
+    reopened.append(_state(2, "A07_RULER"))
+
+    assert len(reopened) == 3
+    assert [s.regime for s in reopened.read_states()] == ["A01_INNOCENT", "A07_RULER", "A07_RULER"]
+
+
+def test_torn_tail_record_is_truncated(tmp_path):
+    path = tmp_path / "drift.bin"
+    DriftLog(path).extend([_state(i) for i in range(3)])
+    with open(path, "ab") as f:
+        f.write(b"\x00" * (RECORD_DTYPE.itemsize // 2))
+
+    log = DriftLog(path)
+
+    assert len(log) == 3
+    assert path.stat().st_size == HEADER.size + 3 * RECORD_DTYPE.itemsize
+    log.append(_state(3))
+    assert log.read_states(1)[0].timestamp == 1003.0
+
+
+def test_rejects_non_log_file(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a drift log at all")
+    with pytest.raises(ValueError):
+        DriftLog(path)
+
+
+def test_volatility_matches_drift_memory(tmp_path):
+    memory = DriftMemory(window_size=10, log=DriftLog(tmp_path / "drift.bin"))
+    for i in range(25):
+        memory.append(_state(i * i % 7))
+
+    assert memory.log.compute_volatility(10) == pytest.approx(memory.compute_volatility())
+
+
+def test_convert_json_and_recover_memory(tmp_path):
+    memory = DriftMemory(window_size=5)
+    for i in range(5):
+        memory.append(_state(i, "A03_HERO"))
+    json_path = tmp_path / "memory.json"
+    memory.save(json_path)
+
+    log_path = tmp_path / "drift.bin"
+    assert convert_json_history(json_path, log_path) == 5
+
+    recovered = DriftMemory.from_log(DriftLog(log_path), window_size=3)
+    history = recovered.get_history()
+    assert [s.timestamp for s in history] == [1002.0, 1003.0, 1004.0]
+    assert history[-1].regime == "A03_HERO"
+    assert history[-1].to_dict() == memory.get_latest().to_dict()
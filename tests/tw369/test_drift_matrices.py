@@ -0,0 +1,77 @@
+"""
+Tests for batched drift APIs in tw369.drift.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from tw369.drift import (
+    compute_consecutive_drift,
+    compute_consecutive_drift_batch,
+    compute_cosine_drift,
+    compute_drift_matrix,
+    compute_drift_metrics,
+    compute_l2_drift,
+    compute_topk_drift,
+)
+
+
+@pytest.fixture
+def sequence():
+    return np.random.default_rng(0).standard_normal((23, 16))
+
+
+def test_consecutive_drift_matches_pairwise_metrics(sequence):
+    dt = np.linspace(0.5, 2.0, len(sequence) - 1)
+    result = compute_consecutive_drift(sequence, delta_times=dt)
+
+    for i in range(len(sequence) - 1):
+        expected = compute_drift_metrics(sequence[i], sequence[i + 1], delta_time=dt[i])
+        for key, value in expected.items():
+            assert result[key][i] == pytest.approx(value)
+
+
+def test_consecutive_drift_batch_matches_per_sequence(sequence):
+    batch = np.stack([sequence, sequence[::-1], 2.0 * sequence])
+    result = compute_consecutive_drift_batch(batch)
+
+    assert result["l2_drift"].shape == (3, len(sequence) - 1)
+    for b in range(3):
+        single = compute_consecutive_drift(batch[b])
+        for key in single:
+            assert np.allclose(result[key][b], single[key])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1024])
+def test_drift_matrix_matches_scalar_functions(sequence, chunk_size):
+    l2 = compute_drift_matrix(sequence, metric="l2", chunk_size=chunk_size)
+    cos = compute_drift_matrix(sequence, metric="cosine", chunk_size=chunk_size)
+
+    assert l2.shape == (len(sequence), len(sequence))
+    assert np.all(np.diag(l2) == 0.0)
+    for i in (0, 7, 22):
+        for j in (0, 3, 22):
+            assert l2[i, j] == pytest.approx(compute_l2_drift(sequence[i], sequence[j]), abs=1e-9)
+            assert cos[i, j] == pytest.approx(compute_cosine_drift(sequence[i], sequence[j]), abs=1e-9)
+
+
+def test_topk_drift_matches_full_matrix(sequence):
+    full = compute_drift_matrix(sequence)
+    np.fill_diagonal(full, np.inf)
+
+    indices, drifts = compute_topk_drift(sequence, k=4, chunk_size=6)
+
+    assert indices.shape == drifts.shape == (len(sequence), 4)
+    assert np.allclose(drifts, np.sort(full, axis=1)[:, :4])
+    assert np.allclose(np.take_along_axis(full, indices, axis=1), drifts)
+    assert not np.any(indices == np.arange(len(sequence))[:, None])
+
+
+def test_drift_matrix_rejects_unknown_metric(sequence):
+    with pytest.raises(ValueError):
+        compute_drift_matrix(sequence, metric="manhattan")
@@ -126,3 +126,123 @@ def test_memory_clear():
     
     assert len(memory.get_history()) == 0
     assert memory.get_latest() is None
+
+
+def test_store_isolates_streams():
+    """Test that DriftMemoryStore keeps one history per stream."""
+    from tw369.drift_memory import DriftMemoryStore
+    
+    store = DriftMemoryStore(window_size=3)
+    for i in range(5):
+        store.append("user_a", DriftState(drift_metric=float(i)))
+    store.append("user_b", DriftState(drift_metric=99.0))
+    
+    assert [s.drift_metric for s in store.get_history("user_a")] == [2.0, 3.0, 4.0]
+    assert [s.drift_metric for s in store.get_history("user_b")] == [99.0]
+    assert store.get_history("unknown") == []
+    assert "unknown" not in store
+
+
+def test_store_lru_and_idle_eviction():
+    """Test LRU eviction under max_streams and idle eviction."""
+    from tw369.drift_memory import DriftMemoryStore
+    
+    store = DriftMemoryStore(window_size=2, max_streams=3)
+    store.append(DriftMemoryStore.DEFAULT_STREAM, DriftState())
+    store.append("s1", DriftState())
+    store.append("s2", DriftState())
+    store.append("s3", DriftState())  # evicts s1, default is pinned
+    
+    assert len(store) == 3
+    assert "s1" not in store
+    assert DriftMemoryStore.DEFAULT_STREAM in store
+    assert store.evictions == 1
+    
+    assert store.evict_idle(idle_timeout=0.0) == 2
+    assert store.stream_ids() == [DriftMemoryStore.DEFAULT_STREAM]
+
+
+def test_store_never_evicts_touched_or_busy_stream():
+    """Test that eviction skips the stream being created and streams in use."""
+    import threading
+    from tw369.drift_memory import DriftMemoryStore
+    
+    store = DriftMemoryStore(window_size=2, max_streams=1)
+    store.append(DriftMemoryStore.DEFAULT_STREAM, DriftState())
+    store.append("s1", DriftState(drift_metric=1.0))
+    
+    # Over budget (default is pinned), but the new stream is kept
+    assert [s.drift_metric for s in store.get_history("s1")] == [1.0]
+    
+    entered = threading.Event()
+    release = threading.Event()
+    
+    def slow_step(prev):
+        entered.set()
+        release.wait(5)
+        return "done", "carried"
+    
+    # Streams on other stripes than "busy", so appending them does not wait
+    others = [f"other{i}" for i in range(100)]
+    others = [sid for sid in others if store._stripe(sid) is not store._stripe("busy")][:4]
+    
+    worker = threading.Thread(target=store.update_multiscale, args=("busy", slow_step))
+    worker.start()
+    assert entered.wait(5)
+    for sid in others:
+        store.append(sid, DriftState())
+    release.set()
+    worker.join()
+    
+    assert store.get_multiscale_state("busy") == "carried"
+
+
+def test_store_concurrent_appends():
+    """Test that concurrent appends across streams are not lost."""
+    import threading
+    from tw369.drift_memory import DriftMemoryStore
+    
+    store = DriftMemoryStore(window_size=1000)
+    
+    def worker(stream_id):
+        for i in range(500):
+            store.append(stream_id, DriftState(drift_metric=float(i)))
+    
+    threads = [threading.Thread(target=worker, args=(f"s{i % 4}",)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    
+    for i in range(4):
+        assert len(store.get_history(f"s{i}")) == 1000
+
+
+def test_integrator_multiscale_per_stream():
+    """Test that multiscale drift state does not leak across streams."""
+    from dataclasses import replace
+    from src.tw369.drift_memory import DriftMemoryStore as StoreCls
+    from src.tw369.tw369_integration import TW369Integrator, TWState
+    
+    store = StoreCls(window_size=5)
+    integrator = TW369Integrator(drift_store=store)
+    integrator._drift_model = "multiscale"
+    integrator._drift_model_config = replace(integrator._drift_model_config, multiscale_enabled=True)
+    
+    hot = TWState({"E01": 0.9, "S09": -0.8}, {"E01": 0.1}, {"E01": 0.5}, metadata={})
+    cold = TWState({"E01": 0.1}, {"E01": 0.1}, {"E01": 0.1}, metadata={"stream_id": "cold"})
+    
+    first_cold = integrator.compute_drift(cold)
+    for _ in range(3):
+        integrator.compute_drift(hot, stream_id="hot")
+    second_cold = integrator.compute_drift(cold)
+    
+    # Cold stream only sees its own two steps: d2 = alpha*inst + (1-alpha)*d1
+    alpha = integrator._drift_model_config.multiscale_alpha
+    for key, d1 in first_cold.items():
+        inst = d1 / alpha
+        assert abs(second_cold[key] - (alpha * inst + (1 - alpha) * d1)) < 1e-12
+    
+    assert len(store.get_history("hot")) == 3
+    assert len(store.get_history("cold")) == 2
+    assert integrator._drift_state is None
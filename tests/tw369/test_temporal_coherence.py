@@ -2,6 +2,8 @@
 Tests for TW369 Temporal Coherence.
 """
 
+import random
+
 import pytest
 import sys
 from pathlib import Path
@@ -13,8 +15,9 @@ from tw369.temporal_coherence import (
     compute_drift_slope,
     compute_drift_acceleration,
     detect_regime_stability,
+    TemporalCoherenceTracker,
 )
-from story.story_buffer import StoryBuffer
+from story.story_buffer import StoryBuffer, StoryEvent
 
 
 def test_compute_drift_slope_increasing():
@@ -135,3 +138,57 @@ def test_temporal_coherence_insufficient_data():
     coherence = compute_temporal_coherence(events)
     
     assert coherence is None  # Not enough data
+
+
+def _random_events(n, seed):
+    rng = random.Random(seed)
+    events = []
+    for i in range(n):
+        roll = rng.random()
+        events.append(StoryEvent(
+            event_id=f"evt_{i}",
+            sequence_id=i,
+            text=f"Event {i}",
+            timestamp=float(i) + rng.random(),
+            drift_state={"drift_metric": rng.uniform(0.0, 1.0)} if roll < 0.8 else None,
+            tw_state={"regime": rng.choice(["stable", "unstable", None])} if roll > 0.15 else None,
+        ))
+    return events
+
+
+def _assert_same(snapshot, expected):
+    if expected is None:
+        assert snapshot is None
+        return
+    assert snapshot.drift_slope == pytest.approx(expected.drift_slope, abs=1e-9)
+    assert snapshot.drift_acceleration == pytest.approx(expected.drift_acceleration, abs=1e-9)
+    assert snapshot.drift_volatility == pytest.approx(expected.drift_volatility, abs=1e-9)
+    assert snapshot.regime_stability == pytest.approx(expected.regime_stability)
+    assert snapshot.drift_values == pytest.approx(expected.drift_values)
+    assert snapshot.timestamps == expected.timestamps
+    assert snapshot.current_regime == expected.current_regime
+    assert snapshot.regime_duration == pytest.approx(expected.regime_duration)
+
+
+@pytest.mark.parametrize("window", [None, 1, 4, 9])
+def test_tracker_matches_batch_computation(window):
+    """Tracker snapshots equal compute_temporal_coherence after every event."""
+    events = _random_events(60, seed=window or 0)
+    tracker = TemporalCoherenceTracker(window=window)
+
+    for i, event in enumerate(events):
+        tracker.update(event)
+        start = 0 if window is None else max(0, i + 1 - window)
+        _assert_same(tracker.snapshot(), compute_temporal_coherence(events[start:i + 1]))
+
+
+def test_tracker_regime_run_length():
+    """Run length counts consecutive tw_state events in the current regime."""
+    tracker = TemporalCoherenceTracker()
+    for i, regime in enumerate(["a", "b", "b", "b"]):
+        tracker.add(float(i), drift_state={"drift_metric": 0.1}, tw_state={"regime": regime})
+
+    assert tracker.regime_run_length == 3
+    snapshot = tracker.snapshot(include_trajectory=False)
+    assert snapshot.regime_duration == pytest.approx(2.0)
+    assert snapshot.drift_values == []
@@ -83,3 +83,54 @@ def test_severity_bounds():
         
         assert 0.0 <= sev_disabled <= 1.0, f"Severity out of bounds for index {idx} (disabled)"
         assert 0.0 <= sev_enabled <= 1.0, f"Severity out of bounds for index {idx} (enabled)"
+
+
+def test_tw_cdf_array_matches_scalar():
+    """Test that the vectorized CDF matches tw_cdf elementwise."""
+    import numpy as np
+    from tw369.tracy_widom import tw_cdf_array
+    
+    lookup = load_tw_lookup()
+    xs = np.linspace(-4.0, 6.0, 101)
+    
+    for beta in (1, 2, 4):
+        expected = [tw_cdf(x, beta=beta, lookup=lookup) for x in xs]
+        assert np.allclose(tw_cdf_array(xs, beta=beta), expected)
+        assert np.allclose(tw_cdf_array(xs, beta=beta, lookup=lookup), expected)
+    
+    # Unknown beta falls back to the heuristic elementwise
+    expected = [tw_cdf(x, beta=3, lookup=lookup) for x in xs]
+    assert np.allclose(tw_cdf_array(xs, beta=3, lookup=lookup), expected)
+
+
+def test_severity_from_index_array_matches_scalar():
+    """Test that the vectorized severity matches the scalar path for all modes."""
+    import numpy as np
+    from tw369.tracy_widom import severity_from_index_array
+    
+    indices = np.linspace(-2.0, 5.0, 57).reshape(3, 19)
+    param_sets = [
+        {"enabled": False},
+        {"enabled": True, "beta": 2, "use_lookup": True, "severity_scale": 1.5},
+        {"enabled": True, "beta": 1, "use_lookup": False, "severity_scale": 0.7},
+    ]
+    
+    for params in param_sets:
+        result = severity_from_index_array(indices, params=params)
+        expected = np.vectorize(lambda v: severity_from_index(v, params=params))(indices)
+        assert result.shape == indices.shape
+        assert np.allclose(result, expected)
+
+
+def test_tw_table_cache():
+    """Test that schema tables are cached per beta in a bounded, read-only cache."""
+    import numpy as np
+    from tw369.tracy_widom import tw_cdf_array, get_tw_table
+    
+    table = get_tw_table(2)
+    assert get_tw_table(2) is table
+    assert get_tw_table.cache_info().maxsize is not None
+    assert not table.cdf.flags.writeable
+    
+    xs = np.linspace(-5.0, 7.0, 1000)
+    assert np.array_equal(tw_cdf_array(xs), np.interp(xs, table.x, table.cdf))